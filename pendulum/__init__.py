@@ -3,6 +3,7 @@
 from .pendulum import Pendulum
 from .interval import Interval
 from .period import Period
+from .period_index import PeriodIndex
 
 # Constants
 from .constants import (
@@ -34,10 +35,16 @@ from_time = Pendulum.create_from_time
 from_format = Pendulum.create_from_format
 strptime = Pendulum.strptime
 from_timestamp = Pendulum.create_from_timestamp
+from_timestamps = Pendulum.create_from_timestamps
+unpack = Pendulum.unpack
+pack_many = Pendulum.pack_many
+unpack_many = Pendulum.unpack_many
 test = Pendulum.test
 set_test_now = Pendulum.set_test_now
 has_test_now = Pendulum.has_test_now
 get_test_now = Pendulum.get_test_now
+set_clock = Pendulum.set_clock
+get_clock = Pendulum.get_clock
 set_locale = Pendulum.set_locale
 get_locale = Pendulum.get_locale
 translator = Pendulum.translator
@@ -21,6 +21,13 @@ if PY33:
 else:
     FileNotFoundError = IOError # cf PEP-3151 
 
+# Typecode for arrays of signed 64-bit integers.
+# The "q" typecode is not available before Python 3.3.
+if PY33:
+    INT64_TYPECODE = 'q'
+else:
+    INT64_TYPECODE = 'l'
+
 def decode(string, encodings=None):
     if not PY2 and not isinstance(string, bytes):
         return string
@@ -1,5 +1,7 @@
 /* ------------------------------------------------------------------------- */
 
+#define PY_SSIZE_T_CLEAN
+
 #include <Python.h>
 #include <stdint.h>
 #include <datetime.h>
@@ -88,12 +90,28 @@ const int32_t MONTHS_OFFSETS[2][14] = {
 
 /* ------------------------------------------------------------------------- */
 
-PyObject* local_time(PyObject *self, PyObject *args) {
-    double unix_time;
-    int32_t utc_offset;
+// Transition rules applied by normalize()
+#define POST_TRANSITION 0
+#define PRE_TRANSITION 1
+#define TRANSITION_ERROR 2
+
+// Errors reported by normalize() for the TRANSITION_ERROR rule
+#define NON_EXISTING_TIME 1
+#define AMBIGUOUS_TIME 2
+
+/* ------------------------------------------------------------------------- */
+
+typedef struct {
+    int32_t year;
+    int32_t month;
+    int32_t day;
+    int32_t hour;
+    int32_t minute;
+    int32_t second;
+} broken_down_time;
+
+static void _local_time(int64_t seconds, int32_t utc_offset, broken_down_time *tm) {
     int32_t year;
-    int64_t microsecond;
-    int64_t seconds;
     int32_t leap_year;
     int64_t sec_per_100years;
     int64_t sec_per_4years;
@@ -101,23 +119,8 @@ PyObject* local_time(PyObject *self, PyObject *args) {
     int32_t month;
     int32_t day;
     int32_t month_offset;
-    int32_t hour;
-    int32_t minute;
-    int32_t second;
-
-    if (!PyArg_ParseTuple(args, "di", &unix_time, &utc_offset)) {
-        PyErr_SetString(
-            PyExc_ValueError, "Invalid parameters"
-        );
-        return NULL;
-    }
 
     year = EPOCH_YEAR;
-    microsecond = (int64_t) (unix_time * 1000000) % 1000000;
-    if (microsecond < 0) {
-        microsecond += 1000000;
-    }
-    seconds = (int64_t) unix_time;
 
     // Shift to a base year that is 400-year aligned.
     if (seconds >= 0) {
@@ -179,21 +182,584 @@ PyObject* local_time(PyObject *self, PyObject *args) {
         month -= 1;
     }
 
-    // Handle hours, minutes, seconds and microseconds
-    hour = seconds / SECS_PER_HOUR;
+    tm->year = year;
+    tm->month = month;
+    tm->day = day;
+
+    // Handle hours, minutes and seconds
+    tm->hour = seconds / SECS_PER_HOUR;
     seconds %= SECS_PER_HOUR;
-    minute = seconds / SECS_PER_MIN;
-    second = seconds % SECS_PER_MIN;
-
-    return PyTuple_Pack(
-        7,
-        PyLong_FromLong(year),
-        PyLong_FromLong(month),
-        PyLong_FromLong(day),
-        PyLong_FromLong(hour),
-        PyLong_FromLong(minute),
-        PyLong_FromLong(second),
-        PyLong_FromLong(microsecond)
+    tm->minute = seconds / SECS_PER_MIN;
+    tm->second = seconds % SECS_PER_MIN;
+}
+
+/* ------------------------------------------------------------------------- */
+
+// Gets a contiguous buffer of integers of the given size
+// from an array or a memoryview.
+static int _get_column(PyObject *obj, Py_buffer *view, Py_ssize_t itemsize) {
+    if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        return -1;
+    }
+
+    if (view->itemsize != itemsize || view->ndim > 1) {
+        PyBuffer_Release(view);
+        PyErr_SetString(PyExc_TypeError, "Invalid transition column");
+
+        return -1;
+    }
+
+    return 0;
+}
+
+static Py_ssize_t _bisect_right(const int64_t *values, int64_t value, Py_ssize_t lo, Py_ssize_t hi) {
+    Py_ssize_t mid;
+
+    while (lo < hi) {
+        mid = (lo + hi) / 2;
+        if (value < values[mid]) {
+            hi = mid;
+        } else {
+            lo = mid + 1;
+        }
+    }
+
+    return lo;
+}
+
+/* ------------------------------------------------------------------------- */
+
+PyObject* local_time(PyObject *self, PyObject *args) {
+    double unix_time;
+    int32_t utc_offset;
+    int64_t microsecond;
+    broken_down_time tm;
+
+    if (!PyArg_ParseTuple(args, "di", &unix_time, &utc_offset)) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
+        );
+        return NULL;
+    }
+
+    microsecond = (int64_t) (unix_time * 1000000) % 1000000;
+    if (microsecond < 0) {
+        microsecond += 1000000;
+    }
+
+    _local_time((int64_t) unix_time, utc_offset, &tm);
+
+    return Py_BuildValue(
+        "(iiiiiiL)",
+        tm.year, tm.month, tm.day,
+        tm.hour, tm.minute, tm.second,
+        (PY_LONG_LONG) microsecond
+    );
+}
+
+/* ------------------------------------------------------------------------- */
+
+PyObject* normalize(PyObject *self, PyObject *args) {
+    PY_LONG_LONG sec;
+    int microsecond;
+    PyObject *pre_times_obj;
+    PyObject *times_obj;
+    PyObject *transition_type_indexes_obj;
+    PyObject *utc_offsets_obj;
+    int default_transition_type_index;
+    int dst_rule;
+    Py_ssize_t lo;
+    Py_ssize_t hi;
+    Py_buffer pre_times_view;
+    Py_buffer times_view;
+    Py_buffer transition_type_indexes_view;
+    Py_buffer utc_offsets_view;
+    const int64_t *pre_times;
+    const int64_t *times;
+    const uint8_t *transition_type_indexes;
+    const int32_t *utc_offsets;
+    Py_ssize_t count;
+    Py_ssize_t last;
+    Py_ssize_t i;
+    Py_ssize_t idx = -1;
+    int64_t pre_time;
+    int64_t time;
+    int64_t unix_time = 0;
+    int transition_type_index;
+    int pre_transition_type_index;
+    int error = 0;
+    broken_down_time tm = {0, 0, 0, 0, 0, 0};
+
+    if (!PyArg_ParseTuple(args, "LiOOOOiinn",
+                          &sec, &microsecond,
+                          &pre_times_obj, &times_obj,
+                          &transition_type_indexes_obj, &utc_offsets_obj,
+                          &default_transition_type_index, &dst_rule,
+                          &lo, &hi)) {
+        return NULL;
+    }
+
+    if (_get_column(pre_times_obj, &pre_times_view, 8) < 0) {
+        return NULL;
+    }
+
+    if (_get_column(times_obj, &times_view, 8) < 0) {
+        PyBuffer_Release(&pre_times_view);
+        return NULL;
+    }
+
+    if (_get_column(transition_type_indexes_obj, &transition_type_indexes_view, 1) < 0) {
+        PyBuffer_Release(&pre_times_view);
+        PyBuffer_Release(&times_view);
+        return NULL;
+    }
+
+    if (_get_column(utc_offsets_obj, &utc_offsets_view, 4) < 0) {
+        PyBuffer_Release(&pre_times_view);
+        PyBuffer_Release(&times_view);
+        PyBuffer_Release(&transition_type_indexes_view);
+        return NULL;
+    }
+
+    pre_times = (const int64_t *) pre_times_view.buf;
+    times = (const int64_t *) times_view.buf;
+    transition_type_indexes = (const uint8_t *) transition_type_indexes_view.buf;
+    utc_offsets = (const int32_t *) utc_offsets_view.buf;
+    count = times_view.len / 8;
+
+    if (count > 0 && (lo < 0 || hi > count || lo > hi)) {
+        lo = 0;
+        hi = count;
+    }
+
+    // Since transition times are whole seconds, dt <= t
+    // is equivalent to sec < t or (sec == t and microsecond == 0)
+    if (count == 0 || sec < times[0]) {
+        // Before the first transition, so use the default offset.
+        transition_type_index = default_transition_type_index;
+        unix_time = sec - utc_offsets[transition_type_index];
+    } else {
+        last = count - 1;
+
+        if (sec >= times[last]) {
+            i = last;
+        } else {
+            idx = _bisect_right(times, sec, lo, hi);
+            i = idx;
+
+            // DST -> No DST
+            pre_time = pre_times[i - 1];
+            if (sec < pre_time || (sec == pre_time && !microsecond)) {
+                i -= 1;
+            }
+        }
+
+        pre_time = pre_times[i];
+        time = times[i];
+        transition_type_index = transition_type_indexes[i];
+        if (i) {
+            pre_transition_type_index = transition_type_indexes[i - 1];
+        } else {
+            pre_transition_type_index = transition_type_index;
+        }
+
+        if (pre_time <= sec && sec < time) {
+            // Skipped time
+            if (dst_rule == TRANSITION_ERROR) {
+                error = NON_EXISTING_TIME;
+            }
+
+            unix_time = sec - utc_offsets[pre_transition_type_index];
+
+            if (dst_rule == PRE_TRANSITION) {
+                // We do not apply the transition
+                transition_type_index = pre_transition_type_index;
+            }
+        } else if (time <= sec && (sec < pre_time || (sec == pre_time && !microsecond))) {
+            // Repeated time
+            if (dst_rule == TRANSITION_ERROR) {
+                error = AMBIGUOUS_TIME;
+            } else if (dst_rule == PRE_TRANSITION) {
+                // We do not apply the transition
+                transition_type_index = pre_transition_type_index;
+            }
+
+            unix_time = sec - utc_offsets[transition_type_index];
+        } else {
+            if (i != last || sec < time) {
+                // In between transitions
+                // The actual transition type is the previous transition one
+                transition_type_index = pre_transition_type_index;
+            }
+
+            unix_time = sec - utc_offsets[transition_type_index];
+        }
+    }
+
+    if (error) {
+        transition_type_index = 0;
+    } else {
+        _local_time(unix_time, utc_offsets[transition_type_index], &tm);
+    }
+
+    PyBuffer_Release(&pre_times_view);
+    PyBuffer_Release(&times_view);
+    PyBuffer_Release(&transition_type_indexes_view);
+    PyBuffer_Release(&utc_offsets_view);
+
+    return Py_BuildValue(
+        "(iiiiiiiin)",
+        tm.year, tm.month, tm.day,
+        tm.hour, tm.minute, tm.second,
+        transition_type_index, error, idx
+    );
+}
+
+/* ------------------------------------------------------------------------- */
+
+PyObject* find_utc_index(PyObject *self, PyObject *args) {
+    PY_LONG_LONG unix_time;
+    PyObject *transition_times_obj;
+    PyObject *utc_index_obj;
+    PY_LONG_LONG bucket_size;
+    Py_buffer transition_times_view;
+    Py_buffer utc_index_view;
+    const int64_t *transition_times;
+    const uint16_t *utc_index;
+    Py_ssize_t count;
+    int64_t bucket;
+    Py_ssize_t idx;
+
+    if (!PyArg_ParseTuple(args, "LOOL",
+                          &unix_time, &transition_times_obj,
+                          &utc_index_obj, &bucket_size)) {
+        return NULL;
+    }
+
+    if (_get_column(transition_times_obj, &transition_times_view, 8) < 0) {
+        return NULL;
+    }
+
+    transition_times = (const int64_t *) transition_times_view.buf;
+    count = transition_times_view.len / 8;
+
+    if (count == 0) {
+        idx = 0;
+    } else if (utc_index_obj == Py_None) {
+        idx = _bisect_right(transition_times, unix_time, 0, count);
+    } else {
+        if (_get_column(utc_index_obj, &utc_index_view, 2) < 0) {
+            PyBuffer_Release(&transition_times_view);
+            return NULL;
+        }
+
+        utc_index = (const uint16_t *) utc_index_view.buf;
+
+        bucket = unix_time - transition_times[0];
+        if (bucket < 0) {
+            idx = 0;
+        } else {
+            bucket /= bucket_size;
+
+            if (bucket >= utc_index_view.len / 2) {
+                idx = count;
+            } else {
+                // Buckets are small enough to hold at most one transition
+                // except for unusually close transitions.
+                idx = utc_index[bucket];
+                while (idx < count && transition_times[idx] <= unix_time) {
+                    idx++;
+                }
+            }
+        }
+
+        PyBuffer_Release(&utc_index_view);
+    }
+
+    PyBuffer_Release(&transition_times_view);
+
+    return PyLong_FromSsize_t(idx);
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int _is_leap(int32_t year) {
+    return year % 4 == 0 && (year % 100 != 0 || year % 400 == 0);
+}
+
+static int _is_long_year(int32_t year) {
+    int32_t y = year - 1;
+    int32_t p = (year + year / 4 - year / 100 + year / 400) % 7;
+    int32_t previous_p = (y + y / 4 - y / 100 + y / 400) % 7;
+
+    return p == 4 || previous_p == 3;
+}
+
+/* ------------------------------------------------------------------------- */
+
+PyObject* days_in_month(PyObject *self, PyObject *args) {
+    int32_t year;
+    int32_t month;
+
+    if (!PyArg_ParseTuple(args, "ii", &year, &month)) {
+        return NULL;
+    }
+
+    if (month < 1 || month > MONTHS_PER_YEAR) {
+        PyErr_SetString(PyExc_ValueError, "Invalid month");
+        return NULL;
+    }
+
+    return PyLong_FromLong(DAYS_PER_MONTHS[_is_leap(year)][month]);
+}
+
+/* ------------------------------------------------------------------------- */
+
+PyObject* is_long_year(PyObject *self, PyObject *args) {
+    int32_t year;
+
+    if (!PyArg_ParseTuple(args, "i", &year)) {
+        return NULL;
+    }
+
+    if (year < 1) {
+        PyErr_SetString(PyExc_ValueError, "Invalid year");
+        return NULL;
+    }
+
+    return PyBool_FromLong(_is_long_year(year));
+}
+
+/* ------------------------------------------------------------------------- */
+
+PyObject* calendar_fields(PyObject *self, PyObject *args) {
+    int32_t year;
+    int32_t month;
+    int32_t day;
+    int32_t y;
+    int leap;
+    int32_t day_of_year;
+    int32_t day_of_week;
+    int32_t week_of_year;
+
+    if (!PyArg_ParseTuple(args, "iii", &year, &month, &day)) {
+        return NULL;
+    }
+
+    if (year < 1 || month < 1 || month > MONTHS_PER_YEAR) {
+        PyErr_SetString(PyExc_ValueError, "Invalid date");
+        return NULL;
+    }
+
+    leap = _is_leap(year);
+    day_of_year = MONTHS_OFFSETS[leap][month] + day;
+
+    // The proleptic ordinal of 0001-01-01, a Monday, is 1.
+    y = year - 1;
+    day_of_week = (int32_t) (
+        ((int64_t) y * 365 + y / 4 - y / 100 + y / 400 + day_of_year) % 7
+    );
+
+    // Weeks start on monday and the first week of the year
+    // is the one containing its first thursday.
+    week_of_year = (day_of_year - (day_of_week ? day_of_week : 7) + 10) / 7;
+    if (week_of_year < 1) {
+        week_of_year = _is_long_year(year - 1) ? 53 : 52;
+    } else if (week_of_year == 53 && !_is_long_year(year)) {
+        week_of_year = 1;
+    }
+
+    return Py_BuildValue(
+        "(iiiii)",
+        day_of_week, day_of_year, week_of_year,
+        DAYS_PER_MONTHS[leap][month], (month + 2) / 3
+    );
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int _is_digit(char c) {
+    return c >= '0' && c <= '9';
+}
+
+// Parses count digits, returns 0 if they are not all digits.
+static int _parse_digits(const char *s, Py_ssize_t length, Py_ssize_t *i, int count, int32_t *value) {
+    int n;
+
+    if (*i + count > length) {
+        return 0;
+    }
+
+    *value = 0;
+    for (n = 0; n < count; n++) {
+        if (!_is_digit(s[*i + n])) {
+            return 0;
+        }
+
+        *value = *value * 10 + (s[*i + n] - '0');
+    }
+
+    *i += count;
+
+    return 1;
+}
+
+/* ------------------------------------------------------------------------- */
+
+PyObject* parse_iso8601(PyObject *self, PyObject *args) {
+    const char *s;
+    Py_ssize_t length;
+    Py_ssize_t i = 0;
+    int extended;
+    int digits;
+    int sign;
+    int32_t year;
+    int32_t month;
+    int32_t day;
+    int32_t hour = 0;
+    int32_t minute = 0;
+    int32_t second = 0;
+    int32_t microsecond = 0;
+    int32_t offset_hour;
+    int32_t offset_minute = 0;
+    int32_t offset = 0;
+    int has_offset = 0;
+
+    if (!PyArg_ParseTuple(args, "s#", &s, &length)) {
+        return NULL;
+    }
+
+    // Date
+    if (!_parse_digits(s, length, &i, 4, &year)) {
+        Py_RETURN_NONE;
+    }
+
+    extended = i < length && s[i] == '-';
+    if (extended) {
+        i++;
+    }
+
+    if (!_parse_digits(s, length, &i, 2, &month)) {
+        Py_RETURN_NONE;
+    }
+
+    if (extended) {
+        if (i >= length || s[i] != '-') {
+            Py_RETURN_NONE;
+        }
+
+        i++;
+    }
+
+    if (!_parse_digits(s, length, &i, 2, &day)) {
+        Py_RETURN_NONE;
+    }
+
+    // Time
+    if (i < length) {
+        if (s[i] != 'T' && s[i] != 't' && s[i] != ' ') {
+            Py_RETURN_NONE;
+        }
+
+        i++;
+
+        if (!_parse_digits(s, length, &i, 2, &hour)) {
+            Py_RETURN_NONE;
+        }
+
+        extended = i < length && s[i] == ':';
+        if (extended) {
+            i++;
+        }
+
+        if (!_parse_digits(s, length, &i, 2, &minute)) {
+            Py_RETURN_NONE;
+        }
+
+        if (i < length && (extended ? s[i] == ':' : _is_digit(s[i]))) {
+            if (extended) {
+                i++;
+            }
+
+            if (!_parse_digits(s, length, &i, 2, &second)) {
+                Py_RETURN_NONE;
+            }
+
+            if (i < length && (s[i] == '.' || s[i] == ',')) {
+                i++;
+
+                // The fraction of second is truncated to microseconds
+                digits = 0;
+                while (i < length && _is_digit(s[i])) {
+                    if (digits < 6) {
+                        microsecond = microsecond * 10 + (s[i] - '0');
+                    }
+
+                    digits++;
+                    i++;
+                }
+
+                if (!digits) {
+                    Py_RETURN_NONE;
+                }
+
+                for (; digits < 6; digits++) {
+                    microsecond *= 10;
+                }
+            }
+        }
+
+        // Offset
+        if (i < length) {
+            if (s[i] == 'Z' || s[i] == 'z') {
+                has_offset = 1;
+                i++;
+            } else if (s[i] == '+' || s[i] == '-') {
+                sign = s[i] == '-' ? -1 : 1;
+                i++;
+
+                if (!_parse_digits(s, length, &i, 2, &offset_hour)) {
+                    Py_RETURN_NONE;
+                }
+
+                if (i < length) {
+                    if (s[i] == ':') {
+                        i++;
+                    }
+
+                    if (!_parse_digits(s, length, &i, 2, &offset_minute)) {
+                        Py_RETURN_NONE;
+                    }
+                }
+
+                if (offset_hour > 23 || offset_minute > 59) {
+                    Py_RETURN_NONE;
+                }
+
+                has_offset = 1;
+                offset = sign * (offset_hour * SECS_PER_HOUR + offset_minute * SECS_PER_MIN);
+            }
+        }
+    }
+
+    if (i != length) {
+        Py_RETURN_NONE;
+    }
+
+    if (!has_offset) {
+        return Py_BuildValue(
+            "(iiiiiiiO)",
+            year, month, day,
+            hour, minute, second, microsecond,
+            Py_None
+        );
+    }
+
+    return Py_BuildValue(
+        "(iiiiiiii)",
+        year, month, day,
+        hour, minute, second, microsecond,
+        offset
     );
 }
 
@@ -206,6 +772,42 @@ static PyMethodDef localtime_methods[] = {
         METH_VARARGS,
         PyDoc_STR("Returns a UNIX time as a broken down time for a particular transition type.")
     },
+    {
+        "normalize",
+        (PyCFunction) normalize,
+        METH_VARARGS,
+        PyDoc_STR("Normalizes a local UNIX time with the transitions of a timezone.")
+    },
+    {
+        "find_utc_index",
+        (PyCFunction) find_utc_index,
+        METH_VARARGS,
+        PyDoc_STR("Returns the index of the first transition after a UTC UNIX time.")
+    },
+    {
+        "parse_iso8601",
+        (PyCFunction) parse_iso8601,
+        METH_VARARGS,
+        PyDoc_STR("Parses a strict ISO 8601 or RFC 3339 date and time.")
+    },
+    {
+        "days_in_month",
+        (PyCFunction) days_in_month,
+        METH_VARARGS,
+        PyDoc_STR("Returns the number of days in a month.")
+    },
+    {
+        "is_long_year",
+        (PyCFunction) is_long_year,
+        METH_VARARGS,
+        PyDoc_STR("Returns whether an ISO year has 53 weeks.")
+    },
+    {
+        "calendar_fields",
+        (PyCFunction) calendar_fields,
+        METH_VARARGS,
+        PyDoc_STR("Returns the calendar fields of a date.")
+    },
     {NULL}
 };
 
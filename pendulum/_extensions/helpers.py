@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import re
+
+from bisect import bisect_right
+
 EPOCH_YEAR = 1970
 
 DAYS_PER_N_YEAR = 365
@@ -71,6 +75,24 @@ TM_OCTOBER = 9
 TM_NOVEMBER = 10
 TM_DECEMBER = 11
 
+# Strict ISO 8601 / RFC 3339 date and time,
+# in the basic or extended formats
+ISO8601_DT = re.compile(
+    r'^(?P<year>[0-9]{4})(?P<date_sep>-?)(?P<month>[0-9]{2})(?P=date_sep)(?P<day>[0-9]{2})'
+    r'(?:[Tt ](?P<hour>[0-9]{2})(?P<time_sep>:?)(?P<minute>[0-9]{2})'
+    r'(?:(?P=time_sep)(?P<second>[0-9]{2})(?:[.,](?P<fraction>[0-9]+))?)?'
+    r'(?:(?P<utc>[Zz])|(?P<sign>[+-])(?P<offset_hour>[0-9]{2})(?::?(?P<offset_minute>[0-9]{2}))?)?)?\Z'
+)
+
+# Transition rules applied by normalize()
+POST_TRANSITION = 0
+PRE_TRANSITION = 1
+TRANSITION_ERROR = 2
+
+# Errors reported by normalize() for the TRANSITION_ERROR rule
+NON_EXISTING_TIME = 1
+AMBIGUOUS_TIME = 2
+
 
 def local_time(unix_time, utc_offset):
     """
@@ -148,3 +170,264 @@ def local_time(unix_time, utc_offset):
         year, month, day,
         hour, minute, second, microsecond
     )
+
+
+def is_leap(year):
+    """
+    Returns whether a year is a leap year.
+
+    :type year: int
+
+    :rtype: bool
+    """
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year, month):
+    """
+    Returns the number of days in a month.
+
+    :type year: int
+    :type month: int
+
+    :rtype: int
+    """
+    return DAYS_PER_MONTHS[int(is_leap(year))][month]
+
+
+def is_long_year(year):
+    """
+    Returns whether an ISO year has 53 weeks.
+
+    :type year: int
+
+    :rtype: bool
+    """
+    def p(y):
+        return (y + y // 4 - y // 100 + y // 400) % 7
+
+    return p(year) == 4 or p(year - 1) == 3
+
+
+def calendar_fields(year, month, day):
+    """
+    Returns the calendar fields of a date:
+    its day of the week (0 for Sunday), day of the year,
+    ISO week of the year, number of days in its month and quarter.
+
+    :type year: int
+    :type month: int
+    :type day: int
+
+    :rtype: tuple
+    """
+    leap = int(is_leap(year))
+    day_of_year = MONTHS_OFFSETS[leap][month] + day
+
+    # The proleptic ordinal of 0001-01-01, a Monday, is 1.
+    y = year - 1
+    ordinal = y * 365 + y // 4 - y // 100 + y // 400 + day_of_year
+    day_of_week = ordinal % 7
+
+    # Weeks start on monday and the first week of the year
+    # is the one containing its first thursday.
+    week_of_year = (day_of_year - (day_of_week or 7) + 10) // 7
+    if week_of_year < 1:
+        week_of_year = 53 if is_long_year(year - 1) else 52
+    elif week_of_year == 53 and not is_long_year(year):
+        week_of_year = 1
+
+    return (
+        day_of_week, day_of_year, week_of_year,
+        DAYS_PER_MONTHS[leap][month], (month + 2) // 3
+    )
+
+
+def parse_iso8601(text):
+    """
+    Parses a strict ISO 8601 or RFC 3339 date and time.
+
+    Returns the year, month, day, hour, minute, second,
+    microsecond (the fraction of second being truncated)
+    and the offset to UTC in seconds (None if there is no offset),
+    or None if the string is not in a supported format.
+
+    The fields are not validated.
+
+    :type text: str
+
+    :rtype: tuple or None
+    """
+    m = ISO8601_DT.match(text)
+    if not m:
+        return
+
+    hour = minute = second = microsecond = 0
+    offset = None
+
+    if m.group('hour'):
+        hour = int(m.group('hour'))
+        minute = int(m.group('minute'))
+
+        if m.group('second'):
+            second = int(m.group('second'))
+
+            fraction = m.group('fraction')
+            if fraction:
+                microsecond = int(fraction[:6].ljust(6, '0'))
+
+        if m.group('utc'):
+            offset = 0
+        elif m.group('sign'):
+            offset_hour = int(m.group('offset_hour'))
+            offset_minute = int(m.group('offset_minute') or 0)
+            if offset_hour > 23 or offset_minute > 59:
+                return
+
+            offset = offset_hour * SECS_PER_HOUR + offset_minute * SECS_PER_MIN
+            if m.group('sign') == '-':
+                offset = -offset
+
+    return (
+        int(m.group('year')), int(m.group('month')), int(m.group('day')),
+        hour, minute, second, microsecond,
+        offset
+    )
+
+
+def normalize(sec, microsecond,
+              pre_times, times, transition_type_indexes,
+              utc_offsets, default_transition_type_index,
+              dst_rule, lo, hi):
+    """
+    Normalizes a local time given as a unix time, in whole seconds,
+    and its microseconds.
+
+    The first transition after the local time is searched
+    between the lo and hi indexes of the transitions.
+
+    Returns the broken down normalized time (without microseconds),
+    the index of its transition type, an error code
+    (NON_EXISTING_TIME or AMBIGUOUS_TIME for the TRANSITION_ERROR rule,
+    0 otherwise) and the index found by the search (-1 if no search
+    was needed).
+
+    :type sec: int
+    :type microsecond: int
+    :type pre_times: array
+    :type times: array
+    :type transition_type_indexes: array
+    :type utc_offsets: array
+    :type default_transition_type_index: int
+    :type dst_rule: int
+    :type lo: int
+    :type hi: int
+
+    :rtype: tuple
+    """
+    # Since transition times are whole seconds, dt <= t
+    # is equivalent to sec < t or (sec == t and microsecond == 0)
+    idx = -1
+
+    if not times or sec < times[0]:
+        # Before the first transition, so use the default offset.
+        # Since the first transition has no previous transition type,
+        # its local times before and after the transition are the same.
+        transition_type_index = default_transition_type_index
+        unix_time = sec - utc_offsets[transition_type_index]
+    else:
+        last = len(times) - 1
+
+        if sec >= times[last]:
+            i = last
+        else:
+            idx = bisect_right(times, sec, lo, hi)
+            i = idx
+
+            # DST -> No DST
+            pre_time = pre_times[i - 1]
+            if sec < pre_time or (sec == pre_time and not microsecond):
+                i -= 1
+
+        pre_time = pre_times[i]
+        time = times[i]
+        transition_type_index = transition_type_indexes[i]
+        if i:
+            pre_transition_type_index = transition_type_indexes[i - 1]
+        else:
+            pre_transition_type_index = transition_type_index
+
+        if pre_time <= sec < time:
+            # tr.pre_time <= dt < tr.time
+            # Skipped time
+            if dst_rule == TRANSITION_ERROR:
+                return 0, 0, 0, 0, 0, 0, 0, NON_EXISTING_TIME, idx
+
+            unix_time = sec - utc_offsets[pre_transition_type_index]
+
+            if dst_rule == PRE_TRANSITION:
+                # We do not apply the transition
+                transition_type_index = pre_transition_type_index
+        elif time <= sec and (sec < pre_time
+                              or (sec == pre_time and not microsecond)):
+            # tr.time <= dt <= tr.pre_time
+            # Repeated time
+            if dst_rule == TRANSITION_ERROR:
+                return 0, 0, 0, 0, 0, 0, 0, AMBIGUOUS_TIME, idx
+
+            if dst_rule == PRE_TRANSITION:
+                # We do not apply the transition
+                transition_type_index = pre_transition_type_index
+
+            unix_time = sec - utc_offsets[transition_type_index]
+        else:
+            if i != last or sec < time:
+                # In between transitions
+                # The actual transition type is the previous transition one
+                transition_type_index = pre_transition_type_index
+
+            unix_time = sec - utc_offsets[transition_type_index]
+
+    return local_time(
+        unix_time, utc_offsets[transition_type_index]
+    )[:-1] + (transition_type_index, 0, idx)
+
+
+def find_utc_index(unix_time, transition_times, utc_index, bucket_size):
+    """
+    Returns the index of the first transition
+    after the given UTC unix time.
+
+    The utc_index maps fixed-size buckets of UTC time,
+    starting at the first transition, to the first transition
+    after the start of each bucket. If it is None, the transitions
+    are searched.
+
+    :type unix_time: int
+    :type transition_times: array
+    :type utc_index: array or None
+    :type bucket_size: int
+
+    :rtype: int
+    """
+    if not transition_times:
+        return 0
+
+    if utc_index is None:
+        return bisect_right(transition_times, unix_time)
+
+    bucket = (unix_time - transition_times[0]) // bucket_size
+    if bucket < 0:
+        return 0
+
+    count = len(transition_times)
+    if bucket >= len(utc_index):
+        return count
+
+    # Buckets are small enough to hold at most one transition
+    # except for unusually close transitions.
+    idx = utc_index[bucket]
+    while idx < count and transition_times[idx] <= unix_time:
+        idx += 1
+
+    return idx
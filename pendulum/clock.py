@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import math
+import time
+
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class Clock(object):
+    """
+    Base class for all clocks.
+
+    Clocks tell the current time to now(), utcnow(), today(),
+    tomorrow() and yesterday(). Subclasses only have to implement time().
+    """
+
+    def time(self):
+        """
+        Returns the current UTC unix time.
+
+        :rtype: float
+        """
+        raise NotImplementedError()
+
+    def now(self, cls, tz):
+        """
+        Returns the current time in the given timezone.
+
+        :param cls: The class of the instance to create
+        :type cls: type
+
+        :param tz: The timezone
+        :type tz: Timezone
+
+        :rtype: Pendulum
+        """
+        return self._create(cls, tz, self.time())
+
+    @staticmethod
+    def _create(cls, tz, unix_time):
+        """
+        Creates an instance from a UTC unix time,
+        with a single transition lookup.
+
+        :type cls: type
+
+        :type tz: Timezone
+
+        :type unix_time: int or float
+
+        :rtype: Pendulum
+        """
+        dt = _EPOCH + timedelta(seconds=unix_time)
+        tzinfo = tz._get_utc_tzinfo(dt)
+        dt += tzinfo.adjusted_offset
+
+        return cls(
+            dt.year, dt.month, dt.day,
+            dt.hour, dt.minute, dt.second, dt.microsecond,
+            tzinfo
+        )
+
+
+class PreciseClock(Clock):
+    """
+    A clock reading the system time, to the microsecond, on every call.
+    """
+
+    def time(self):
+        return time.time()
+
+
+class CoarseClock(PreciseClock):
+    """
+    A clock with a resolution of one second.
+
+    The instances of the current second are cached per timezone
+    so that calling now() repeatedly within the same second
+    returns the same instance without any conversion.
+    They are dropped as soon as the second changes.
+    """
+
+    def __init__(self):
+        self._unix_time = None
+        self._instances = {}
+
+    def now(self, cls, tz):
+        unix_time = int(math.floor(self.time()))
+
+        if unix_time != self._unix_time:
+            self._instances = {}
+            self._unix_time = unix_time
+        else:
+            cached = self._instances.get(tz)
+            if cached is not None:
+                # Another thread may have stored an instance
+                # of a previous second
+                cached_time, instance = cached
+
+                if cached_time == unix_time and instance.__class__ is cls:
+                    return instance
+
+        instance = self._create(cls, tz, unix_time)
+        self._instances[tz] = (unix_time, instance)
+
+        return instance
+
+    def clear(self):
+        """
+        Clears the cached instances.
+        """
+        self._unix_time = None
+        self._instances = {}
+
+
+CLOCKS = {
+    'precise': PreciseClock(),
+    'coarse': CoarseClock(),
+}
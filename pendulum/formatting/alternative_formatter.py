@@ -3,7 +3,38 @@
 import re
 import datetime
 
+from collections import OrderedDict
+
 from .formatter import Formatter
+from ..translator import Translator
+from .._compat import decode
+
+
+def _parse_two_digit_year(value):
+    year = int(value)
+
+    return year + (1900 if year > 68 else 2000)
+
+
+def _parse_fraction(value):
+    return int(value[:6].ljust(6, '0'))
+
+
+def _parse_offset(value):
+    if value in ('Z', 'z'):
+        return 0
+
+    sign = -1 if value[0] == '-' else 1
+    value = value[1:].replace(':', '')
+
+    return sign * (int(value[:2]) * 3600 + int(value[2:]) * 60)
+
+
+def _parse_timezone(value):
+    if value[0] in '+-':
+        return _parse_offset(value)
+
+    return value
 
 
 class AlternativeFormatter(Formatter):
@@ -99,6 +130,72 @@ class AlternativeFormatter(Formatter):
         'LLLL': 'dddd, MMMM D, YYYY h:mm A',
     }
 
+    # Parsing rules: the regular expression matching the token,
+    # the parsed field (None if it is ignored) and its converter
+    _PARSING_RULES = {
+        # Year
+        'YYYY': ('[0-9]{4}', 'year', int),
+        'YY': ('[0-9]{2}', 'year', _parse_two_digit_year),
+        'Y': ('[0-9]{1,4}', 'year', int),
+
+        # Quarter
+        'Q': ('[1-4]', None, None),
+
+        # Month
+        'MM': ('[0-9]{2}', 'month', int),
+        'M': ('[0-9]{1,2}', 'month', int),
+
+        # Day
+        'DD': ('[0-9]{2}', 'day', int),
+        'D': ('[0-9]{1,2}', 'day', int),
+
+        # Day of Year
+        'DDDD': ('[0-9]{3}', 'day_of_year', int),
+        'DDD': ('[0-9]{1,3}', 'day_of_year', int),
+
+        # Day of Week
+        'd': ('[0-6]', None, None),
+
+        # Hour
+        'HH': ('[0-9]{2}', 'hour', int),
+        'H': ('[0-9]{1,2}', 'hour', int),
+        'hh': ('[0-9]{2}', 'hour', int),
+        'h': ('[0-9]{1,2}', 'hour', int),
+
+        # Minute
+        'mm': ('[0-9]{2}', 'minute', int),
+        'm': ('[0-9]{1,2}', 'minute', int),
+
+        # Second
+        'ss': ('[0-9]{2}', 'second', int),
+        's': ('[0-9]{1,2}', 'second', int),
+
+        # Timestamp
+        'X': ('-?[0-9]+', 'timestamp', int),
+
+        # Timezone
+        'Z': ('[Zz]|[+-][0-9]{2}:?[0-9]{2}', 'offset', _parse_offset),
+        'ZZ': ('[Zz]|[+-][0-9]{2}:?[0-9]{2}', 'offset', _parse_offset),
+        'z': ('[A-Za-z]+|[+-][0-9]{2}(?::?[0-9]{2})?', None, None),
+        'zz': (
+            '[A-Za-z_]+(?:/[A-Za-z0-9_+-]+)*|[+-][0-9]{2}:?[0-9]{2}',
+            'tz', _parse_timezone
+        ),
+    }
+
+    _PARSED_FIELDS = (
+        'year', 'month', 'day', 'day_of_year',
+        'hour', 'minute', 'second', 'microsecond',
+        'meridian', 'offset', 'tz', 'timestamp'
+    )
+
+    # Maximum number of compiled parsing patterns kept
+    _PATTERNS_CACHE_SIZE = 128
+
+    def __init__(self):
+        self._translator = Translator('en')
+        self._patterns = OrderedDict()
+
     def format(self, dt, fmt, locale=None):
         """
         Formats a Pendulum instance with a given format and locale.
@@ -232,3 +329,218 @@ class AlternativeFormatter(Formatter):
             return self._format_localizable_token(dt, token, 'en')
 
         return trans
+
+    def parse(self, time, fmt, locale=None, translator=None):
+        """
+        Parses a string with a given format and locale.
+
+        The format is compiled once into a regular expression
+        which is kept in a bounded cache.
+
+        Names of days of the week, quarters, week days and
+        timezone abbreviations are matched but ignored.
+
+        :param time: The string to parse
+        :type time: str
+
+        :param fmt: The format to use
+        :type fmt: str
+
+        :param locale: The locale to use
+        :type locale: str or None
+
+        :param translator: The translator to use for localized tokens
+        :type translator: Translator or None
+
+        :rtype: dict
+        """
+        if translator is None:
+            translator = self._translator
+
+        if not locale:
+            locale = translator.locale
+
+        # Localized names are matched as unicode strings
+        time = decode(time)
+        fmt = decode(fmt)
+
+        regex, groups = self._compile(fmt, locale, translator)
+
+        m = regex.match(time)
+        if not m:
+            raise ValueError(
+                u'String [{}] does not match format [{}]'.format(time, fmt)
+            )
+
+        parsed = dict.fromkeys(self._PARSED_FIELDS)
+        for (field, converter), value in zip(groups, m.groups()):
+            if field is not None:
+                parsed[field] = converter(value)
+
+        meridian = parsed.pop('meridian')
+        if meridian is not None and parsed['hour'] is not None:
+            # The meridian gives the hours it applies to
+            hour = parsed['hour'] % 12
+            for meridian_hour in meridian:
+                if meridian_hour % 12 == hour:
+                    parsed['hour'] = meridian_hour
+                    break
+
+        return parsed
+
+    def _compile(self, fmt, locale, translator):
+        """
+        Returns the compiled regular expression of a format
+        and the parsed field and converter of each of its groups.
+
+        :type fmt: str
+
+        :type locale: str
+
+        :type translator: Translator
+
+        :rtype: tuple
+        """
+        key = (fmt, locale, translator)
+
+        pattern = self._patterns.get(key)
+        if pattern is not None:
+            return pattern
+
+        groups = []
+        regex = re.compile(
+            u'{}\\Z'.format(self._compile_format(fmt, locale, translator, groups)),
+            re.IGNORECASE | re.UNICODE
+        )
+        pattern = (regex, groups)
+
+        if len(self._patterns) >= self._PATTERNS_CACHE_SIZE:
+            self._patterns.popitem(last=False)
+
+        self._patterns[key] = pattern
+
+        return pattern
+
+    def _compile_format(self, fmt, locale, translator, groups):
+        """
+        Returns the regular expression matching a format.
+
+        :rtype: str
+        """
+        regex = ''
+        position = 0
+
+        for m in self._FORMAT_RE.finditer(fmt):
+            regex += re.escape(fmt[position:m.start()])
+            position = m.end()
+
+            if m.group(1) is not None:
+                regex += re.escape(m.group(1))
+            elif m.group(2) is not None:
+                regex += re.escape(m.group(2))
+            else:
+                regex += self._compile_token(m.group(3), locale, translator, groups)
+
+        return regex + re.escape(fmt[position:])
+
+    def _compile_token(self, token, locale, translator, groups):
+        """
+        Returns the regular expression matching a token.
+
+        :rtype: str
+        """
+        if token in self._DEFAULT_DATE_FORMATS:
+            fmt = translator.transchoice('date_formats', token, locale=locale)
+            if fmt == 'date_formats':
+                fmt = self._DEFAULT_DATE_FORMATS[token]
+
+            return self._compile_format(decode(fmt), locale, translator, groups)
+
+        if token in self._PARSING_RULES:
+            regex, field, converter = self._PARSING_RULES[token]
+        elif token.startswith('S'):
+            # Fractional second
+            regex = '[0-9]{{{}}}'.format(len(token))
+            field = 'microsecond'
+            converter = _parse_fraction
+        elif token in self._LOCALIZABLE_TOKENS:
+            field, values = self._get_localized_values(token, locale, translator)
+            if not values:
+                raise ValueError('Unsupported token [{}]'.format(token))
+
+            regex = u'|'.join(
+                re.escape(value)
+                for value in sorted(values, key=len, reverse=True)
+            )
+            values = dict((value.lower(), number) for value, number in values.items())
+            converter = lambda value, values=values: values[value.lower()]
+        else:
+            raise ValueError('Unsupported token [{}]'.format(token))
+
+        groups.append((field, converter))
+
+        return u'({})'.format(regex)
+
+    def _get_localized_values(self, token, locale, translator):
+        """
+        Returns the parsed field of a localizable token
+        and the values it can take, mapped to their meaning.
+
+        :rtype: tuple
+        """
+        field = None
+        ordinal = False
+
+        if token == 'MMM':
+            field, trans_id, numbers = 'month', 'months_abbrev', range(1, 13)
+        elif token == 'MMMM':
+            field, trans_id, numbers = 'month', 'months', range(1, 13)
+        elif token in ('dd', 'ddd'):
+            trans_id, numbers = 'days_abbrev', range(7)
+        elif token == 'dddd':
+            trans_id, numbers = 'days', range(7)
+        elif token == 'Do':
+            field, trans_id, numbers, ordinal = 'day', 'ordinal', range(1, 32), True
+        elif token == 'do':
+            trans_id, numbers, ordinal = 'ordinal', range(7), True
+        elif token == 'Mo':
+            field, trans_id, numbers, ordinal = 'month', 'ordinal', range(1, 13), True
+        elif token == 'Qo':
+            trans_id, numbers, ordinal = 'ordinal', range(1, 5), True
+        elif token == 'DDDo':
+            field, trans_id, numbers, ordinal = 'day_of_year', 'ordinal', range(1, 367), True
+        elif token in ('A', 'a'):
+            # Each meridian is mapped to the hours it applies to
+            field = 'meridian'
+            values = {}
+            for hour in range(24):
+                meridian = self._translate(translator, 'meridian', (hour, 0), locale)
+                values[meridian] = values.get(meridian, ()) + (hour,)
+
+            return field, values
+        else:
+            return field, {}
+
+        values = {}
+        for number in numbers:
+            translation = self._translate(translator, trans_id, number, locale)
+            if ordinal:
+                translation = u'{:d}{}'.format(number, translation)
+
+            values[translation] = number
+
+        return field, values
+
+    def _translate(self, translator, trans_id, number, locale):
+        """
+        Translates an identifier, defaulting to english.
+
+        :rtype: unicode
+        """
+        translation = translator.transchoice(trans_id, number, locale=locale)
+        if translation == trans_id:
+            # Unable to find the corresponding translation
+            # Defaulting to english
+            translation = translator.transchoice(trans_id, number, locale='en')
+
+        return decode(translation)
@@ -35,7 +35,49 @@ class ClassicFormatter(Formatter):
         # Checking for localizable directives
         fmt = re.sub('%(a|A|b|B|p)', lambda m: self._localize_directive(dt, m.group(1), locale), fmt)
 
-        return dt._datetime.strftime(fmt)
+        return datetime.datetime.strftime(dt, fmt)
+
+    def parse(self, time, fmt, locale=None, translator=None):
+        """
+        Parses a string with a given format.
+
+        The format is the one of the native strptime()
+        which does not localize directives.
+
+        :param time: The string to parse
+        :type time: str
+
+        :param fmt: The format to use
+        :type fmt: str
+
+        :param locale: Unused
+        :type locale: str or None
+
+        :param translator: Unused
+        :type translator: Translator or None
+
+        :rtype: dict
+        """
+        dt = datetime.datetime.strptime(time, fmt)
+
+        offset = None
+        if dt.tzinfo is not None:
+            delta = dt.utcoffset()
+            offset = delta.days * 86400 + delta.seconds
+
+        return {
+            'year': dt.year,
+            'month': dt.month,
+            'day': dt.day,
+            'day_of_year': None,
+            'hour': dt.hour,
+            'minute': dt.minute,
+            'second': dt.second,
+            'microsecond': dt.microsecond,
+            'offset': offset,
+            'tz': None,
+            'timestamp': None,
+        }
 
     def _localize_directive(self, dt, directive, locale):
         """
@@ -22,3 +22,28 @@ class Formatter(object):
         :rtype: str
         """
         raise NotImplementedError()
+
+    def parse(self, time, fmt, locale=None, translator=None):
+        """
+        Parses a string with a given format and locale.
+
+        Returns the parsed fields, by name: year, month, day,
+        day_of_year, hour, minute, second, microsecond,
+        offset (in seconds), tz (a timezone name or an offset in seconds)
+        and timestamp. Fields absent from the format are None.
+
+        :param time: The string to parse
+        :type time: str
+
+        :param fmt: The format to use
+        :type fmt: str
+
+        :param locale: The locale to use
+        :type locale: str or None
+
+        :param translator: The translator to use for localized tokens
+        :type translator: Translator or None
+
+        :rtype: dict
+        """
+        raise NotImplementedError()
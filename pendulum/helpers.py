@@ -1,6 +1,28 @@
 # -*- coding: utf-8 -*-
 
+from ._compat import PY2
+from ._extensions.helpers import (
+    POST_TRANSITION, PRE_TRANSITION, TRANSITION_ERROR,
+    NON_EXISTING_TIME, AMBIGUOUS_TIME
+)
+
 try:
-    from ._extensions._helpers import local_time
+    from ._extensions._helpers import (
+        local_time, calendar_fields, days_in_month, is_long_year,
+        parse_iso8601
+    )
 except ImportError:
-    from ._extensions.helpers import local_time
+    from ._extensions.helpers import (
+        local_time, calendar_fields, days_in_month, is_long_year,
+        parse_iso8601
+    )
+
+if PY2:
+    # Python 2 arrays do not support the buffer protocol
+    # the C versions rely on.
+    from ._extensions.helpers import normalize, find_utc_index
+else:
+    try:
+        from ._extensions._helpers import normalize, find_utc_index
+    except ImportError:
+        from ._extensions.helpers import normalize, find_utc_index
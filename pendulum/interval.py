@@ -32,19 +32,35 @@ def _divide_and_round(a, b):
     return q
 
 
+def _get_microseconds(delta):
+    """
+    Returns the duration of a timedelta, in microseconds.
+
+    :type delta: timedelta
+
+    :rtype: int
+    """
+    if isinstance(delta, BaseInterval):
+        return delta._us
+
+    return (
+        (delta.days * SECONDS_PER_DAY + delta.seconds) * 1000000
+        + delta.microseconds
+    )
+
+
 class BaseInterval(timedelta):
     """
     Base class for all inherited interval classes.
+
+    The duration is kept in microseconds, as an integer,
+    from which the components are computed when first needed.
     """
 
-    _y = None
-    _m = None
-    _w = None
-    _d = None
-    _h = None
-    _i = None
-    _s = None
-    _invert = None
+    __slots__ = (
+        '_us', '_components',
+        '_y', '_m', '_h', '_i', '_s', '_invert'
+    )
 
     def __new__(cls, days=0, seconds=0, microseconds=0,
                 milliseconds=0, minutes=0, hours=0, weeks=0):
@@ -52,20 +68,74 @@ class BaseInterval(timedelta):
             cls, days, seconds, microseconds,
             milliseconds, minutes, hours, weeks
         )
+        # The components of timedelta are overridden by BaseInterval
+        self._init(
+            (timedelta.days.__get__(self) * SECONDS_PER_DAY
+             + timedelta.seconds.__get__(self)) * 1000000
+            + timedelta.microseconds.__get__(self)
+        )
+
+        return self
 
-        # Intuitive normalization
-        total = self.total_seconds()
+    @classmethod
+    def _from_microseconds(cls, us):
+        """
+        Creates an interval from a duration in microseconds.
 
-        m = 1
-        if total < 0:
-            m = -1
+        :type us: int
 
-        self._microseconds = abs(round(total % 1 * 1e6)) * m
-        self._seconds = abs(int(total)) % SECONDS_PER_DAY * m
-        self._days = abs(int(total)) // SECONDS_PER_DAY * m
+        :rtype: BaseInterval
+        """
+        self = timedelta.__new__(cls, 0, 0, us)
+        self._init(us)
 
         return self
 
+    def _init(self, us):
+        self._us = us
+        self._components = None
+        self._y = None
+        self._m = None
+        self._h = None
+        self._i = None
+        self._s = None
+        self._invert = None
+
+    def _to_microseconds(self):
+        return self._us
+
+    def _get_components(self):
+        """
+        Returns the days, seconds and microseconds of the interval,
+        each having the sign of the duration (intuitive normalization).
+
+        :rtype: tuple
+        """
+        if self._components is None:
+            us = self._to_microseconds()
+
+            seconds, microseconds = divmod(abs(us), 1000000)
+            days, seconds = divmod(seconds, SECONDS_PER_DAY)
+
+            if us < 0:
+                self._components = (-days, -seconds, -microseconds)
+            else:
+                self._components = (days, seconds, microseconds)
+
+        return self._components
+
+    @property
+    def _days(self):
+        return self._get_components()[0]
+
+    @property
+    def _seconds(self):
+        return self._get_components()[1]
+
+    @property
+    def _microseconds(self):
+        return self._get_components()[2]
+
     def total_minutes(self):
         return self.total_seconds() / SECONDS_PER_MINUTE
 
@@ -147,7 +217,7 @@ class BaseInterval(timedelta):
     @property
     def invert(self):
         if self._invert is None:
-            self._invert = self.total_seconds() < 0
+            self._invert = self._us < 0
 
         return self._invert
 
@@ -186,6 +256,8 @@ class Interval(WordableIntervalMixin, BaseInterval):
     Provides several improvements over the base class.
     """
 
+    __slots__ = ()
+
     @classmethod
     def instance(cls, delta):
         """
@@ -199,7 +271,7 @@ class Interval(WordableIntervalMixin, BaseInterval):
 
     def __add__(self, other):
         if isinstance(other, timedelta):
-            return self.__class__(seconds=self.total_seconds() + other.total_seconds())
+            return self._from_microseconds(self._us + _get_microseconds(other))
 
         return NotImplemented
 
@@ -207,26 +279,22 @@ class Interval(WordableIntervalMixin, BaseInterval):
 
     def __sub__(self, other):
         if isinstance(other, timedelta):
-            return self.__class__(seconds=self.total_seconds() - other.total_seconds())
+            return self._from_microseconds(self._us - _get_microseconds(other))
 
         return NotImplemented
 
     def __neg__(self):
-        return self.__class__(seconds=-self.total_seconds())
-
-    def _to_microseconds(self):
-        return ((self._days * (24*3600) + self._seconds) * 1000000 +
-                self._microseconds)
+        return self._from_microseconds(-self._us)
 
     def __mul__(self, other):
         if isinstance(other, int):
-            return self.__class__(seconds=self.total_seconds() * other)
+            return self._from_microseconds(self._us * other)
 
         if isinstance(other, float):
             usec = self._to_microseconds()
             a, b = other.as_integer_ratio()
 
-            return self.__class__(0, 0, _divide_and_round(usec * a, b))
+            return self._from_microseconds(_divide_and_round(usec * a, b))
 
         return NotImplemented
 
@@ -241,7 +309,7 @@ class Interval(WordableIntervalMixin, BaseInterval):
             return usec // other._to_microseconds()
 
         if isinstance(other, int):
-            return self.__class__(0, 0, usec // other)
+            return self._from_microseconds(usec // other)
 
     def __truediv__(self, other):
         if not isinstance(other, (int, float, timedelta)):
@@ -252,12 +320,12 @@ class Interval(WordableIntervalMixin, BaseInterval):
             return usec / other._to_microseconds()
 
         if isinstance(other, int):
-            return self.__class__(0, 0, _divide_and_round(usec, other))
+            return self._from_microseconds(_divide_and_round(usec, other))
 
         if isinstance(other, float):
             a, b = other.as_integer_ratio()
 
-            return self.__class__(0, 0, _divide_and_round(b * usec, a))
+            return self._from_microseconds(_divide_and_round(b * usec, a))
 
     __div__ = __floordiv__
 
@@ -265,7 +333,7 @@ class Interval(WordableIntervalMixin, BaseInterval):
         if isinstance(other, timedelta):
             r = self._to_microseconds() % other._to_microseconds()
 
-            return self.__class__(0, 0, r)
+            return self._from_microseconds(r)
 
         return NotImplemented
 
@@ -274,7 +342,7 @@ class Interval(WordableIntervalMixin, BaseInterval):
             q, r = divmod(self._to_microseconds(),
                           other._to_microseconds())
 
-            return q, self.__class__(0, 0, r)
+            return q, self._from_microseconds(r)
 
         return NotImplemented
 
@@ -290,18 +358,5 @@ class AbsoluteInterval(Interval):
     Interval that expresses a time difference in absolute values.
     """
 
-    def __new__(cls, days=0, seconds=0, microseconds=0,
-                milliseconds=0, minutes=0, hours=0, weeks=0):
-        self = timedelta.__new__(
-            cls, days, seconds, microseconds,
-            milliseconds, minutes, hours, weeks
-        )
-
-        # Intuitive normalization
-        total = abs(self.total_seconds())
-
-        self._microseconds = round(total % 1 * 1e6)
-        self._seconds = int(total) % SECONDS_PER_DAY
-        self._days = int(total) // SECONDS_PER_DAY
-
-        return self
+    def _to_microseconds(self):
+        return abs(self._us)
@@ -6,6 +6,8 @@ from ..translator import Translator
 
 class TranslatableMixin(object):
 
+    __slots__ = ()
+
     _translator = None
 
     @classmethod
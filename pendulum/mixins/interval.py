@@ -5,6 +5,8 @@ from .default import TranslatableMixin
 
 class WordableIntervalMixin(TranslatableMixin):
 
+    __slots__ = ()
+
     def in_words(self, locale=None, separator=' '):
         """
         Get the current interval in words in the current locale.
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compact binary encoding of Pendulum instances.
+
+An instance is encoded as its UTC unix time in microseconds
+and its timezone: either a fixed offset, in seconds,
+with its name if it is not the default one,
+or the name of the timezone.
+
+pack() encodes a single instance:
+
+    version (uint8) | unix time (int64) | zone
+
+pack_many() encodes many instances in columns, the timezones
+being interned in a table referenced by their index:
+
+    version (uint8) | count (uint32) | zone count (uint16) | zones
+    | unix times (count x int64) | zone indexes (count x uint16)
+
+The zone indexes are omitted when all the instances share
+the same timezone. A zone is encoded as its kind (uint8) followed
+by the offset (int32), the length (uint8) and the UTF-8 encoded name
+or both. All the values are little-endian.
+
+Decoding converts the UTC unix times to local times directly,
+without localizing the local times again.
+"""
+
+import sys
+import struct
+
+from array import array
+from datetime import datetime, timedelta
+
+from ._compat import PY2, INT64_TYPECODE
+from .tz import batch
+from .tz.timezone import Timezone, FixedTimezone, UTCTimezone, fixed_timezone
+
+_VERSION = 1
+
+_FIXED_ZONE = 0
+_NAMED_ZONE = 1
+_NAMED_FIXED_ZONE = 2
+
+_HEADER = struct.Struct('<Bq')
+_MANY_HEADER = struct.Struct('<BIH')
+_ZONE_KIND = struct.Struct('<B')
+_FIXED_ZONE_OFFSET = struct.Struct('<i')
+_NAMED_ZONE_LENGTH = struct.Struct('<B')
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _zone_key(tz):
+    """
+    Returns what identifies a timezone in an encoding:
+    its offset if it is fixed, with its name if it is not
+    the default one, its name otherwise.
+
+    :type tz: Timezone
+
+    :rtype: int or tuple or str
+    """
+    if isinstance(tz, FixedTimezone) and tz is not UTCTimezone:
+        offset = int(tz._tzinfo.offset)
+
+        if tz.name != fixed_timezone(offset).name:
+            return offset, tz.name
+
+        return offset
+
+    return tz.name
+
+
+def _pack_name(name):
+    name = name.encode('utf-8')
+
+    return _NAMED_ZONE_LENGTH.pack(len(name)) + name
+
+
+def _pack_zone(key):
+    if isinstance(key, int):
+        return _ZONE_KIND.pack(_FIXED_ZONE) + _FIXED_ZONE_OFFSET.pack(key)
+
+    if isinstance(key, tuple):
+        offset, name = key
+
+        return (
+            _ZONE_KIND.pack(_NAMED_FIXED_ZONE)
+            + _FIXED_ZONE_OFFSET.pack(offset) + _pack_name(name)
+        )
+
+    return _ZONE_KIND.pack(_NAMED_ZONE) + _pack_name(key)
+
+
+def _unpack_name(data, position):
+    """
+    Returns the name encoded at the given position
+    and the position following it.
+
+    :rtype: tuple
+    """
+    length, = _NAMED_ZONE_LENGTH.unpack_from(data, position)
+    position += _NAMED_ZONE_LENGTH.size
+    name = _to_bytes(data[position:position + length]).decode('utf-8')
+
+    return name, position + length
+
+
+def _unpack_zone(data, position):
+    """
+    Returns the timezone encoded at the given position
+    and the position following it.
+
+    :type data: bytes or memoryview
+
+    :type position: int
+
+    :rtype: tuple
+    """
+    kind, = _ZONE_KIND.unpack_from(data, position)
+    position += _ZONE_KIND.size
+
+    if kind == _FIXED_ZONE:
+        offset, = _FIXED_ZONE_OFFSET.unpack_from(data, position)
+
+        return fixed_timezone(offset), position + _FIXED_ZONE_OFFSET.size
+
+    if kind == _NAMED_FIXED_ZONE:
+        offset, = _FIXED_ZONE_OFFSET.unpack_from(data, position)
+        name, position = _unpack_name(data, position + _FIXED_ZONE_OFFSET.size)
+
+        return FixedTimezone(offset, name), position
+
+    if kind != _NAMED_ZONE:
+        raise ValueError('Invalid zone kind [{}]'.format(kind))
+
+    name, position = _unpack_name(data, position)
+
+    return Timezone.load(name), position
+
+
+def _to_bytes(data):
+    """
+    Returns a slice of packed data as bytes.
+
+    On Python 2, bytes() of a memoryview is its representation,
+    so the data goes through a bytearray instead.
+
+    :rtype: bytes
+    """
+    if isinstance(data, bytes):
+        return data
+
+    return bytes(bytearray(data))
+
+
+def _check_version(version):
+    if version != _VERSION:
+        raise ValueError('Unsupported encoding version [{}]'.format(version))
+
+
+def _column(typecode, data, position, count):
+    """
+    Returns a column of little-endian integers
+    and the position following it.
+
+    :rtype: tuple
+    """
+    column = array(typecode)
+    end = position + count * column.itemsize
+
+    if len(data) < end:
+        raise ValueError('Truncated data')
+
+    if PY2:
+        column.fromstring(_to_bytes(data[position:end]))
+    else:
+        column.frombytes(_to_bytes(data[position:end]))
+
+    if _BIG_ENDIAN:
+        column.byteswap()
+
+    return column, end
+
+
+def _column_bytes(column):
+    if _BIG_ENDIAN:
+        column.byteswap()
+
+    if PY2:
+        return column.tostring()
+
+    return column.tobytes()
+
+
+def pack(dt):
+    """
+    Encodes an instance.
+
+    :type dt: Pendulum
+
+    :rtype: bytes
+    """
+    return _HEADER.pack(_VERSION, dt._get_key()) + _pack_zone(_zone_key(dt.tz))
+
+
+def unpack(cls, data):
+    """
+    Decodes an instance encoded by pack().
+
+    :param cls: The class of the instance to create
+    :type cls: type
+
+    :type data: bytes or memoryview
+
+    :rtype: Pendulum
+    """
+    version, unix_time = _HEADER.unpack_from(data)
+    _check_version(version)
+
+    tz, _ = _unpack_zone(data, _HEADER.size)
+
+    dt = _EPOCH + timedelta(microseconds=unix_time)
+    tzinfo = tz._get_utc_tzinfo(dt)
+    dt += tzinfo.adjusted_offset
+
+    return cls(
+        dt.year, dt.month, dt.day,
+        dt.hour, dt.minute, dt.second, dt.microsecond,
+        tzinfo
+    )
+
+
+def pack_many(dts):
+    """
+    Encodes many instances.
+
+    :type dts: iterable
+
+    :rtype: bytes
+    """
+    zones = {}
+    unix_times = array(INT64_TYPECODE)
+    zone_indexes = array('H')
+
+    for dt in dts:
+        key = _zone_key(dt.tz)
+
+        index = zones.get(key)
+        if index is None:
+            index = zones[key] = len(zones)
+
+        unix_times.append(dt._get_key())
+        zone_indexes.append(index)
+
+    data = [_MANY_HEADER.pack(_VERSION, len(unix_times), len(zones))]
+    data += [_pack_zone(key) for key in sorted(zones, key=zones.get)]
+    data.append(_column_bytes(unix_times))
+
+    if len(zones) > 1:
+        data.append(_column_bytes(zone_indexes))
+
+    return b''.join(data)
+
+
+def unpack_many(cls, data):
+    """
+    Decodes many instances encoded by pack_many().
+
+    The instances sharing a timezone are converted all at once.
+
+    :param cls: The class of the instances to create
+    :type cls: type
+
+    :type data: bytes or memoryview
+
+    :rtype: list
+    """
+    version, count, zone_count = _MANY_HEADER.unpack_from(data)
+    _check_version(version)
+
+    position = _MANY_HEADER.size
+    zones = []
+    for _ in range(zone_count):
+        tz, position = _unpack_zone(data, position)
+        zones.append(tz)
+
+    unix_times, position = _column(INT64_TYPECODE, data, position, count)
+
+    if zone_count == 1:
+        return [
+            cls(*fields)
+            for fields in batch.fromutc_many(zones[0], unix_times, 'us')
+        ]
+
+    zone_indexes, _ = _column('H', data, position, count)
+
+    positions = [[] for _ in zones]
+    for i, index in enumerate(zone_indexes):
+        positions[index].append(i)
+
+    instances = [None] * count
+    for tz, zone_positions in zip(zones, positions):
+        all_fields = batch.fromutc_many(
+            tz, [unix_times[i] for i in zone_positions], 'us'
+        )
+
+        for i, fields in zip(zone_positions, all_fields):
+            instances[i] = cls(*fields)
+
+    return instances
@@ -8,15 +8,21 @@ import datetime
 import locale as _locale
 
 from contextlib import contextmanager
-from dateutil.relativedelta import relativedelta
 from dateutil import parser as dateparser
 
 from .period import Period
 from .exceptions import PendulumException
 from .mixins.default import TranslatableMixin
-from .tz import Timezone, UTC, FixedTimezone, local_timezone
+from .tz import Timezone, UTC, FixedTimezone, local_timezone, fixed_timezone
 from .tz.timezone_info import TimezoneInfo
+from .tz import batch as _batch
+from . import packing as _packing
+from .helpers import (
+    calendar_fields, days_in_month, is_long_year, parse_iso8601
+)
 from .formatting import FORMATTERS
+from ._compat import basestring
+from .clock import Clock, CLOCKS
 from .constants import (
     SUNDAY, MONDAY, TUESDAY, WEDNESDAY,
     THURSDAY, FRIDAY, SATURDAY,
@@ -75,6 +81,7 @@ class Pendulum(datetime.datetime, TranslatableMixin):
     _test_now = None
 
     _EPOCH = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+    _EPOCH_ORDINAL = _EPOCH.toordinal()
 
     _MODIFIERS_VALID_UNITS = ['day', 'week', 'month', 'year', 'decade', 'century']
 
@@ -83,6 +90,12 @@ class Pendulum(datetime.datetime, TranslatableMixin):
     _DEFAULT_FORMATTER = 'classic'
     _FORMATTER = _DEFAULT_FORMATTER
 
+    _DEFAULT_CLOCK = 'precise'
+    _CLOCK = CLOCKS[_DEFAULT_CLOCK]
+
+    # The date, time and tzinfo are those of the underlying datetime
+    __slots__ = ('_tz', '_timestamp', '_calendar', '_key')
+
     @classmethod
     def _safe_create_datetime_zone(cls, obj):
         """
@@ -101,7 +114,7 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         if isinstance(obj, (int, float)):
             timezone_offset = obj * 60 * 60
 
-            return FixedTimezone(timezone_offset)
+            return fixed_timezone(timezone_offset)
         elif isinstance(obj, datetime.tzinfo) and not isinstance(obj, Timezone):
             # pytz
             if hasattr(obj, 'localize'):
@@ -143,59 +156,60 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
     def __new__(cls, year, month, day,
                 hour=0, minute=0, second=0, microsecond=0,
-                tzinfo=None):
+                tzinfo=UTC):
         """
         Constructor.
 
-        This will just create a dummy datetime. The heavy lifting will be done
-        in __init__().
+        The date and time are localized once in the given timezone
+        and the resulting fields and tzinfo are directly
+        those of the underlying datetime.
 
-        :type year: int or str
-        """
-        obj = super(Pendulum, cls).__new__(cls, year, month, day, hour, minute, second, microsecond, None)
-
-        return obj
+        :type year: int
+        :type month: int
+        :type day: int
+        :type hour: int
+        :type minute: int
+        :type second: int
+        :type microsecond: int
 
-    def __init__(self, year, month, day,
-                 hour=0, minute=0, second=0, microsecond=0,
-                 tzinfo=UTC):
+        :type tzinfo: Timezone or TimezoneInfo or str or int or None
+        """
         # If a TimezoneInfo is passed we do not convert
         if isinstance(tzinfo, TimezoneInfo):
-            self._tz = tzinfo.tz
-
-            self._year = year
-            self._month = month
-            self._day = day
-            self._hour = hour
-            self._minute = minute
-            self._second = second
-            self._microsecond = microsecond
-            self._tzinfo = tzinfo
-
-            dt = datetime.datetime(
-                year, month, day,
-                hour, minute, second, microsecond,
-                tzinfo
-            )
+            tz = tzinfo.tz
         else:
-            self._tz = self._safe_create_datetime_zone(tzinfo)
+            tz = cls._safe_create_datetime_zone(tzinfo)
 
-            dt = self._tz.convert(datetime.datetime(
+            (year, month, day,
+             hour, minute, second, microsecond,
+             tzinfo) = tz._normalize(datetime.datetime(
                 year, month, day,
                 hour, minute, second, microsecond
-            ), dst_rule=self._TRANSITION_RULE)
+            ), dst_rule=cls._TRANSITION_RULE)
 
-            self._year = dt.year
-            self._month = dt.month
-            self._day = dt.day
-            self._hour = dt.hour
-            self._minute = dt.minute
-            self._second = dt.second
-            self._microsecond = dt.microsecond
-            self._tzinfo = dt.tzinfo
+        obj = super(Pendulum, cls).__new__(
+            cls, year, month, day,
+            hour, minute, second, microsecond,
+            tzinfo
+        )
+        obj._tz = tz
+        obj._timestamp = None
+        obj._calendar = None
+        obj._key = None
 
-        self._timestamp = None
-        self._datetime = dt
+        return obj
+
+    def _to_datetime(self):
+        """
+        Returns the instance as a native datetime.
+
+        :rtype: datetime.datetime
+        """
+        return datetime.datetime(
+            self.year, self.month, self.day,
+            self.hour, self.minute, self.second, self.microsecond,
+            self.tzinfo
+        )
 
     @classmethod
     def instance(cls, dt, tz=UTC):
@@ -248,12 +262,35 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         if time == 'now':
             return cls.now(None)
 
-        dt = dateparser.parse(time)
+        dt = None
+
+        # Strict ISO 8601 strings are parsed directly,
+        # anything else is handed to dateutil
+        try:
+            parsed = parse_iso8601(time)
+        except UnicodeEncodeError:
+            # Non-ASCII unicode strings on Python 2,
+            # which cannot be ISO 8601 strings anyway
+            parsed = None
+
+        if parsed is not None:
+            try:
+                dt = datetime.datetime(*parsed[:7])
+            except ValueError:
+                pass
+            else:
+                offset = parsed[7]
+
+        if dt is None:
+            dt = dateparser.parse(time)
 
-        if dt.tzinfo:
-            offset = dt.utcoffset()
+            offset = None
+            if dt.tzinfo:
+                offset = dt.utcoffset()
+                offset = offset.days * 86400 + offset.seconds
 
-            tz = offset.total_seconds() / 3600
+        if offset is not None:
+            tz = fixed_timezone(offset)
 
         return cls(
             dt.year, dt.month, dt.day,
@@ -281,16 +318,12 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
             return test_instance
 
-        if tz is None or tz == 'local':
-            dt = datetime.datetime.now()
-        elif tz is UTC or tz == 'UTC':
-            dt = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        if tz is UTC or tz == 'UTC':
+            tz = UTC.tz
         else:
-            dt = datetime.datetime.utcnow().replace(tzinfo=UTC)
             tz = cls._safe_create_datetime_zone(tz)
-            dt = tz.convert(dt)
 
-        return cls.instance(dt, tz)
+        return cls._CLOCK.now(cls, tz)
 
     @classmethod
     def utcnow(cls):
@@ -421,7 +454,7 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         )
 
     @classmethod
-    def create_from_format(cls, time, fmt, tz=UTC):
+    def create_from_format(cls, time, fmt, tz=UTC, locale=None, formatter='classic'):
         """
         Create a Pendulum instance from a specific format.
 
@@ -434,11 +467,74 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         :param tz: The timezone
         :type tz: tzinfo or str or int or None
 
+        :param locale: The locale to use
+        :type locale: str or None
+
+        :param formatter: The formatter whose format to use
+        :type formatter: str
+
         :rtype: Pendulum
         """
-        dt = datetime.datetime.strptime(time, fmt)
+        if formatter not in FORMATTERS:
+            raise ValueError('Invalid formatter [{}]'.format(formatter))
 
-        return cls.instance(dt, tz)
+        if not locale:
+            locale = cls.get_locale()
+
+        parsed = FORMATTERS[formatter].parse(time, fmt, locale, cls.translator())
+
+        return cls._create_from_parsed(parsed, tz)
+
+    @classmethod
+    def _create_from_parsed(cls, parsed, tz=UTC):
+        """
+        Create a Pendulum instance from the fields
+        returned by a formatter parse() method.
+
+        :type parsed: dict
+
+        :type tz: tzinfo or str or int or None
+
+        :rtype: Pendulum
+        """
+        if parsed['tz'] is not None:
+            tz = parsed['tz']
+            if not isinstance(tz, basestring):
+                tz = fixed_timezone(tz)
+        elif parsed['offset'] is not None:
+            tz = fixed_timezone(parsed['offset'])
+
+        if parsed['timestamp'] is not None:
+            return cls.create_from_timestamp(parsed['timestamp'], tz)
+
+        year = parsed['year']
+        month = parsed['month']
+        day = parsed['day']
+
+        if year is None and month is None and day is None:
+            if parsed['day_of_year'] is None:
+                # Only a time has been given
+                today = cls.now(tz)
+                year, month, day = today.year, today.month, today.day
+            else:
+                year = cls.now(tz).year
+
+        if year is None:
+            year = cls.now(tz).year
+
+        if parsed['day_of_year'] is not None:
+            date = (
+                datetime.date(year, 1, 1)
+                + datetime.timedelta(days=parsed['day_of_year'] - 1)
+            )
+            month, day = date.month, date.day
+
+        return cls(
+            year, month or 1, day or 1,
+            parsed['hour'] or 0, parsed['minute'] or 0,
+            parsed['second'] or 0, parsed['microsecond'] or 0,
+            tzinfo=tz
+        )
 
     @classmethod
     def create_from_timestamp(cls, timestamp, tz=UTC):
@@ -465,9 +561,37 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
         return instance
 
+    @classmethod
+    def create_from_timestamps(cls, timestamps, tz=UTC, unit='s'):
+        """
+        Create Pendulum instances from many timestamps.
+
+        The timezone is resolved once and the transitions
+        are looked up for all the timestamps at once.
+
+        :param timestamps: The timestamps: a NumPy array,
+                           any object supporting the buffer protocol
+                           or an iterable of numbers.
+        :type timestamps: numpy.ndarray or array or iterable
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+
+        :param unit: The unit of the timestamps: s (seconds),
+                     ms (milliseconds) or us (microseconds).
+        :type unit: str
+
+        :rtype: list
+        """
+        tz = cls._safe_create_datetime_zone(tz)
+
+        return [
+            cls(*fields) for fields in _batch.fromutc_many(tz, timestamps, unit)
+        ]
+
     @classmethod
     def strptime(cls, time, fmt):
-        return cls.create_from_format(time, fmt)
+        return cls.create_from_format(time, fmt, formatter='classic')
 
     def copy(self):
         """
@@ -475,7 +599,7 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
         :rtype: Pendulum
         """
-        return self.instance(self._datetime)
+        return self.instance(self)
 
     ### Getters/Setters
 
@@ -518,53 +642,33 @@ class Pendulum(datetime.datetime, TranslatableMixin):
     def timestamp_(self, timestamp, tz=UTC):
         return self.create_from_timestamp(timestamp, tz)
 
-    @property
-    def year(self):
-        return self._year
-
-    @property
-    def month(self):
-        return self._month
-
-    @property
-    def day(self):
-        return self._day
-
-    @property
-    def hour(self):
-        return self._hour
-
-    @property
-    def minute(self):
-        return self._minute
-
-    @property
-    def second(self):
-        return self._second
+    def _calendar_fields(self):
+        """
+        Returns the day of the week, day of the year, week of the year,
+        number of days in the month and quarter of the instance.
 
-    @property
-    def microsecond(self):
-        return self._microsecond
+        :rtype: tuple
+        """
+        if self._calendar is None:
+            self._calendar = calendar_fields(self.year, self.month, self.day)
 
-    @property
-    def tzinfo(self):
-        return self._tzinfo
+        return self._calendar
 
     @property
     def day_of_week(self):
-        return int(self.format('%w', formatter='classic'))
+        return self._calendar_fields()[0]
 
     @property
     def day_of_year(self):
-        return int(self.format('%-j', formatter='classic'))
+        return self._calendar_fields()[1]
 
     @property
     def week_of_year(self):
-        return self.isocalendar()[1]
+        return self._calendar_fields()[2]
 
     @property
     def days_in_month(self):
-        return calendar.monthrange(self.year, self.month)[1]
+        return self._calendar_fields()[3]
 
     @property
     def timestamp(self):
@@ -573,13 +677,15 @@ class Pendulum(datetime.datetime, TranslatableMixin):
     @property
     def float_timestamp(self):
         if self._timestamp is None:
-            self._timestamp = (self._datetime - self._EPOCH).total_seconds()
+            self._timestamp = datetime.datetime.__sub__(
+                self, self._EPOCH
+            ).total_seconds()
 
         return self._timestamp
 
     @property
     def week_of_month(self):
-        return math.ceil(self._day / DAYS_PER_WEEK)
+        return math.ceil(self.day / DAYS_PER_WEEK)
 
     @property
     def age(self):
@@ -587,7 +693,7 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
     @property
     def quarter(self):
-        return int(math.ceil(self._month / 3))
+        return self._calendar_fields()[4]
 
     @property
     def offset(self):
@@ -627,7 +733,7 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         return self._tz
 
     def get_offset(self):
-        return int(self._tzinfo.offset)
+        return int(self.tzinfo.offset)
 
     def with_date(self, year, month, day):
         """
@@ -668,10 +774,9 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
         :rtype: Pendulum
         """
-        dt = self._datetime.replace(
-            hour=int(hour), minute=int(minute), second=int(second),
-            microsecond=microsecond,
-            tzinfo=None
+        dt = datetime.datetime(
+            self.year, self.month, self.day,
+            int(hour), int(minute), int(second), microsecond
         )
 
         return self.instance(dt, self._tz)
@@ -689,11 +794,9 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
         :rtype: Pendulum
         """
-        dt = self._datetime.replace(
-            year=year, month=month, day=day,
-            hour=int(hour), minute=int(minute), second=int(second),
-            microsecond=microsecond,
-            tzinfo=None
+        dt = datetime.datetime(
+            year, month, day,
+            int(hour), int(minute), int(second), microsecond
         )
 
         return self.instance(dt, self._tz)
@@ -879,6 +982,40 @@ class Pendulum(datetime.datetime, TranslatableMixin):
     def has_test_now(cls):
         return cls.get_test_now() is not None
 
+    @classmethod
+    def set_clock(cls, clock=None):
+        """
+        Sets the clock used to get the current time.
+
+        The available clocks are "precise", the default,
+        and "coarse" which has a resolution of one second
+        but caches the current instance per timezone.
+
+        A test now instance, if set, takes precedence over the clock.
+
+        :param clock: The name of the clock or a custom Clock instance.
+        :type clock: str or Clock or None
+        """
+        if clock is None:
+            clock = cls._DEFAULT_CLOCK
+
+        if not isinstance(clock, Clock):
+            if clock not in CLOCKS:
+                raise ValueError('Invalid clock [{}]'.format(clock))
+
+            clock = CLOCKS[clock]
+
+        cls._CLOCK = clock
+
+    @classmethod
+    def get_clock(cls):
+        """
+        Gets the clock used to get the current time.
+
+        :rtype: Clock
+        """
+        return cls._CLOCK
+
     # String Formatting
 
     @classmethod
@@ -1104,39 +1241,77 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         return self.format(self.W3C, formatter='classic')
 
     # Comparisons
+    def _get_key(self):
+        """
+        Returns the UTC time of the instance, in microseconds
+        since the epoch, used to compare and hash instances.
+
+        :rtype: int
+        """
+        if self._key is None:
+            offset = self.tzinfo.adjusted_offset
+
+            self._key = (
+                (self.toordinal() - self._EPOCH_ORDINAL - offset.days) * 86400
+                + self.hour * 3600 + self.minute * 60 + self.second
+                - offset.seconds
+            ) * 1000000 + self.microsecond
+
+        return self._key
+
     def __eq__(self, other):
+        # The keys are read directly once computed
+        # since comparisons are called many times when sorting.
+        if isinstance(other, Pendulum):
+            return (self._key or self._get_key()) == (other._key or other._get_key())
+
         try:
-            return self._datetime == self._get_datetime(other)
+            return datetime.datetime.__eq__(self, self._get_datetime(other))
         except ValueError:
             return NotImplemented
 
     def __ne__(self, other):
+        if isinstance(other, Pendulum):
+            return (self._key or self._get_key()) != (other._key or other._get_key())
+
         try:
-            return self._datetime != self._get_datetime(other)
+            return datetime.datetime.__ne__(self, self._get_datetime(other))
         except ValueError:
             return NotImplemented
 
     def __gt__(self, other):
+        if isinstance(other, Pendulum):
+            return (self._key or self._get_key()) > (other._key or other._get_key())
+
         try:
-            return self._datetime > self._get_datetime(other)
+            return datetime.datetime.__gt__(self, self._get_datetime(other))
         except ValueError:
             return NotImplemented
 
     def __ge__(self, other):
+        if isinstance(other, Pendulum):
+            return (self._key or self._get_key()) >= (other._key or other._get_key())
+
         try:
-            return self._datetime >= self._get_datetime(other)
+            return datetime.datetime.__ge__(self, self._get_datetime(other))
         except ValueError:
             return NotImplemented
 
     def __lt__(self, other):
+        if isinstance(other, Pendulum):
+            return (self._key or self._get_key()) < (other._key or other._get_key())
+
         try:
-            return self._datetime < self._get_datetime(other)
+            return datetime.datetime.__lt__(self, self._get_datetime(other))
         except ValueError:
             return NotImplemented
 
     def __le__(self, other):
+        if isinstance(other, Pendulum):
+            return (self._key or self._get_key()) <= (other._key or other._get_key())
+
         try:
-            return self._datetime <= self._get_datetime(other)
+            return datetime.datetime.__le__(self, self._get_datetime(other))
         except ValueError:
             return NotImplemented
 
@@ -1321,7 +1496,7 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
         :rtype: bool
         """
-        return Pendulum.create(self.year, 12, 28, 0, 0, 0, tz=self._tz).isocalendar()[1] == 53
+        return is_long_year(self.year)
 
     def is_same_day(self, dt):
         """
@@ -1437,23 +1612,48 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
         :rtype: Pendulum
         """
-        delta = relativedelta(
-            years=years, months=months, weeks=weeks, days=days,
+        if years != int(years) or months != int(months):
+            raise ValueError('Non-integer years and months are ambiguous')
+
+        delta = datetime.timedelta(
+            weeks=weeks, days=days,
             hours=hours, minutes=minutes, seconds=seconds,
             microseconds=microseconds
         )
 
-        dt = self._datetime + delta
-
-        if any([years, months, weeks, days]):
+        if years or months or weeks or days:
             # If we specified any of years, months, weeks or days
-            # we will not apply the transition (if any)
-            dt = self._tz.convert(dt.replace(tzinfo=None))
-        else:
-            # Else, we need to apply the transition properly (if any)
-            dt = self._tz.convert(dt)
+            # the duration is added to the wall clock time
+            # which is then normalized: we will not apply the transition (if any)
+            year, month, day = self.year, self.month, self.day
 
-        return self.instance(dt)
+            if years or months:
+                year, month = divmod(year * 12 + month - 1 + int(years) * 12 + int(months), 12)
+                month += 1
+                day = min(day, days_in_month(year, month))
+
+            dt = datetime.datetime(
+                year, month, day,
+                self.hour, self.minute, self.second, self.microsecond
+            ) + delta
+
+            return self.__class__(*self._tz._normalize(dt))
+
+        # Else, the duration is added to the UTC time
+        # so that the transition (if any) is applied properly
+        dt = datetime.datetime(
+            self.year, self.month, self.day,
+            self.hour, self.minute, self.second, self.microsecond
+        ) - self.tzinfo.adjusted_offset + delta
+
+        tzinfo = self._tz._get_utc_tzinfo(dt)
+        dt += tzinfo.adjusted_offset
+
+        return self.__class__(
+            dt.year, dt.month, dt.day,
+            dt.hour, dt.minute, dt.second, dt.microsecond,
+            tzinfo
+        )
 
     def subtract(self, years=0, months=0, weeks=0, days=0,
             hours=0, minutes=0, seconds=0, microseconds=0):
@@ -1818,11 +2018,9 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         if day_of_week is None:
             day_of_week = self.day_of_week
 
-        dt = self.start_of('day').add(days=1)
-        while dt.day_of_week != day_of_week:
-            dt = dt.add(days=1)
+        days = (day_of_week - self.day_of_week - 1) % DAYS_PER_WEEK + 1
 
-        return dt
+        return self.start_of('day').add(days=days)
 
     def previous(self, day_of_week=None):
         """
@@ -1839,11 +2037,9 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         if day_of_week is None:
             day_of_week = self.day_of_week
 
-        dt = self.start_of('day').subtract(days=1)
-        while dt.day_of_week != day_of_week:
-            dt = dt.subtract(days=1)
+        days = (self.day_of_week - day_of_week - 1) % DAYS_PER_WEEK + 1
 
-        return dt
+        return self.start_of('day').subtract(days=days)
 
     def first_of(self, unit, day_of_week=None):
         """
@@ -2135,7 +2331,7 @@ class Pendulum(datetime.datetime, TranslatableMixin):
             return None
 
         if isinstance(value, Pendulum):
-            return value._datetime if not pendulum else value
+            return value
 
         if isinstance(value, datetime.datetime):
             if value.tzinfo is None:
@@ -2195,21 +2391,15 @@ class Pendulum(datetime.datetime, TranslatableMixin):
     def combine(cls, date, time):
         return cls.instance(datetime.datetime.combine(date, time))
 
-    def timetuple(self):
-        return self._datetime.timetuple()
-
-    def utctimetuple(self):
-        return self._datetime.utctimetuple()
-
     def replace(self, year=None, month=None, day=None, hour=None,
                 minute=None, second=None, microsecond=None, tzinfo=True):
-        year = year if year is not None else self._year
-        month = month if month is not None else self._month
-        day = day if day is not None else self._day
-        hour = hour if hour is not None else self._hour
-        minute = minute if minute is not None else self._minute
-        second = second if second is not None else self._second
-        microsecond = microsecond if microsecond is not None else self._microsecond
+        year = year if year is not None else self.year
+        month = month if month is not None else self.month
+        day = day if day is not None else self.day
+        hour = hour if hour is not None else self.hour
+        minute = minute if minute is not None else self.minute
+        second = second if second is not None else self.second
+        microsecond = microsecond if microsecond is not None else self.microsecond
 
         # Checking tzinfo
         if tzinfo is not None and tzinfo is not True:
@@ -2217,28 +2407,16 @@ class Pendulum(datetime.datetime, TranslatableMixin):
         elif tzinfo is None:
             tzinfo = tzinfo
         else:
-            tzinfo = self._tzinfo
+            tzinfo = self.tzinfo
 
         return self.instance(
-            self._datetime.replace(year=year, month=month, day=day,
-                                   hour=hour, minute=minute, second=second,
-                                   microsecond=microsecond, tzinfo=tzinfo)
+            datetime.datetime(year, month, day,
+                              hour, minute, second, microsecond,
+                              tzinfo)
         )
 
     def astimezone(self, tz=None):
-        return self.instance(self._datetime.astimezone(tz))
-
-    def isoformat(self, sep='T'):
-        return self._datetime.isoformat(sep)
-
-    def utcoffset(self):
-        return self._tzinfo.utcoffset(self)
-
-    def tzname(self):
-        return self._datetime.tzname()
-
-    def dst(self):
-        return self._datetime.dst()
+        return self.instance(self._to_datetime().astimezone(tz))
 
     def __format__(self, format_spec):
         if len(format_spec) > 0:
@@ -2246,27 +2424,63 @@ class Pendulum(datetime.datetime, TranslatableMixin):
 
         return str(self)
 
-    def __hash__(self):
-        return self._datetime.__hash__()
+    # The native hash is cached by the instance itself
+    # and is consistent with the comparison keys
+    __hash__ = datetime.datetime.__hash__
 
-    def __getnewargs__(self):
-        return(self, )
+    def pack(self):
+        """
+        Encodes the instance in a compact binary form:
+        its UTC unix time in microseconds and its timezone.
 
-    def _getstate(self):
-        tz = self.timezone_name
+        :rtype: bytes
+        """
+        return _packing.pack(self)
 
-        # Fix for fixed timezones not being properly unpickled
-        if isinstance(self.tz, FixedTimezone):
-            tz = self.offset_hours
+    @classmethod
+    def unpack(cls, data):
+        """
+        Decodes an instance encoded by pack().
 
-        return (
-            self.year, self.month, self.day,
-            self.hour, self.minute, self.second, self.microsecond,
-            tz
-        )
+        :param data: The encoded instance
+        :type data: bytes or memoryview
+
+        :rtype: Pendulum
+        """
+        return _packing.unpack(cls, data)
+
+    @classmethod
+    def pack_many(cls, dts):
+        """
+        Encodes many instances in a compact binary form.
+
+        The timezones are stored once
+        and referenced by each instance.
+
+        :param dts: The instances to encode
+        :type dts: iterable
+
+        :rtype: bytes
+        """
+        return _packing.pack_many(dts)
+
+    @classmethod
+    def unpack_many(cls, data):
+        """
+        Decodes many instances encoded by pack_many().
+
+        :param data: The encoded instances
+        :type data: bytes or memoryview
+
+        :rtype: list
+        """
+        return _packing.unpack_many(cls, data)
 
     def __reduce__(self):
-        return self.__class__, self._getstate()
+        return self.__reduce_ex__(2)
+
+    def __reduce_ex__(self, protocol):
+        return _packing.unpack, (self.__class__, self.pack())
 
 Pendulum.min = Pendulum.instance(datetime.datetime.min.replace(tzinfo=UTC))
 Pendulum.max = Pendulum.instance(datetime.datetime.max.replace(tzinfo=UTC))
@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import operator
+from datetime import datetime, timedelta
+
 from .mixins.interval import WordableIntervalMixin
 from .interval import BaseInterval, Interval
+from .helpers import days_in_month
+from .period_index import _get_key, _get_bounds
+from .tz import batch
 
 
 class Period(WordableIntervalMixin, BaseInterval):
@@ -11,22 +16,29 @@ class Period(WordableIntervalMixin, BaseInterval):
     time difference.
     """
 
-    def __new__(cls, start, end, absolute=False):
-        from .pendulum import Pendulum
+    _CALENDAR_UNITS = ('years', 'months', 'weeks', 'days')
 
-        if absolute and start > end:
-            end, start = start, end
+    # Fixed units, in microseconds
+    _FIXED_UNITS = {
+        'hours': 3600000000,
+        'minutes': 60000000,
+        'seconds': 1000000,
+        'microseconds': 1,
+    }
 
-        if isinstance(start, Pendulum):
-            start = start._datetime
+    # Number of instances converted at once by xrange() for fixed units
+    _XRANGE_CHUNK_SIZE = 1024
 
-        if isinstance(end, Pendulum):
-            end = end._datetime
+    def __new__(cls, start, end, absolute=False):
+        if absolute and start > end:
+            end, start = start, end
 
-        delta = end - start
+        # Pendulum instances are subtracted as native datetimes
+        # so that we get a timedelta
+        delta = datetime.__sub__(end, start)
 
         return super(Period, cls).__new__(
-            cls, seconds=delta.total_seconds()
+            cls, delta.days, delta.seconds, delta.microseconds
         )
 
     def __init__(self, start, end, absolute=False):
@@ -59,53 +71,314 @@ class Period(WordableIntervalMixin, BaseInterval):
     def end(self):
         return self._end
 
-    def in_weekdays(self):
-        start, end = self.start.start_of('day'), self.end.start_of('day')
+    def _count_days(self):
+        """
+        Returns the number of days spanned by the period, both included,
+        and how many of them are weekend days.
+
+        The days are counted on the calendar of the start of the period
+        by whole weeks, each having the same number of weekend days,
+        plus the remaining days.
+
+        :rtype: tuple
+        """
+        start, end = self.start, self.end
         if not self._absolute and self.invert:
-            start, end = self.end.start_of('day'), self.start.start_of('day')
+            start, end = end, start
+
+        if end.tz is not start.tz:
+            end = end.start_of('day').in_tz(start.tz)
 
-        days = 0
-        while start <= end:
-            if start.is_weekday():
-                days += 1
+        days = (end.date() - start.date()).days + 1
+        if days <= 0:
+            return 0, 0
 
-            start = start.add(days=1)
+        weekend_days = set(start.get_weekend_days())
+        weeks, remaining = divmod(days, 7)
 
-        return days * (-1 if not self._absolute and self.invert else 1)
+        weekend_count = weeks * len(weekend_days)
+        for day_of_week in range(start.day_of_week, start.day_of_week + remaining):
+            if day_of_week % 7 in weekend_days:
+                weekend_count += 1
+
+        return days, weekend_count
+
+    def in_weekdays(self):
+        days, weekend_days = self._count_days()
+
+        return (days - weekend_days) * (-1 if not self._absolute and self.invert else 1)
 
     def in_weekend_days(self):
-        start, end = self.start.start_of('day'), self.end.start_of('day')
-        if not self._absolute and self.invert:
-            start, end = self.end.start_of('day'), self.start.start_of('day')
+        _, weekend_days = self._count_days()
+
+        return weekend_days * (-1 if not self._absolute and self.invert else 1)
+
+    def range(self, unit, step=1, as_array=False):
+        """
+        Returns the instances of the period
+        separated by a given number of a unit.
 
-        days = 0
-        while start <= end:
-            if start.is_weekend():
-                days += 1
+        With as_array, the instances are not created:
+        their UTC unix times in microseconds are returned
+        as a NumPy int64 array, or with "datetime64",
+        their local times as a datetime64[us] array
+        and their UTC offsets, in seconds, as an int64 array.
 
-            start = start.add(days=1)
+        :param unit: The unit: years, months, weeks, days,
+                     hours, minutes, seconds or microseconds.
+        :type unit: str
 
-        return days * (-1 if not self._absolute and self.invert else 1)
+        :param step: The number of units between two instances
+        :type step: int
 
-    def range(self, unit):
-        return list(self.xrange(unit))
+        :param as_array: Whether to return arrays: True or "datetime64".
+        :type as_array: bool or str
 
-    def xrange(self, unit):
-        method = 'add'
-        op = operator.le
+        :rtype: list or numpy.ndarray or tuple
+        """
+        if not as_array:
+            return list(self.xrange(unit, step))
+
+        if as_array is not True and as_array != 'datetime64':
+            raise ValueError('Invalid array type [{}]'.format(as_array))
+
+        if batch.np is None:
+            raise ImportError('NumPy is required to return arrays')
+
+        epochs = self._range_array(unit, self._get_step(unit, step))
+        if as_array is True:
+            return epochs
+
+        offsets = batch._adjusted_offsets_numpy(self.start.tz)[
+            batch._utc_type_indexes_numpy(self.start.tz, epochs // 1000000)
+        ]
+
+        return (epochs + offsets * 1000000).astype('datetime64[us]'), offsets
+
+    def _get_step(self, unit, step):
+        """
+        Checks a unit and a step and returns the step
+        in the direction of the period.
+
+        :rtype: int
+        """
+        if unit not in self._CALENDAR_UNITS and unit not in self._FIXED_UNITS:
+            raise ValueError('Invalid unit [{}]'.format(unit))
+
+        if step != int(step) or step < 1:
+            raise ValueError('The step must be a positive integer')
+
+        step = int(step)
         if not self._absolute and self.invert:
-            method = 'subtract'
-            op = operator.ge
+            step = -step
+
+        return step
+
+    def xrange(self, unit, step=1):
+        """
+        Iterates over the instances of the period
+        separated by a given number of a unit.
+
+        Each instance is computed from the previous one:
+        calendar units are added to the wall clock time of the start,
+        the months being clamped to their number of days,
+        while fixed units are added to the UTC time.
+
+        :param unit: The unit: years, months, weeks, days,
+                     hours, minutes, seconds or microseconds.
+        :type unit: str
+
+        :param step: The number of units between two instances
+        :type step: int
+
+        :rtype: generator
+        """
+        step = self._get_step(unit, step)
+
+        if unit in self._FIXED_UNITS:
+            return self._xrange_fixed(self._FIXED_UNITS[unit] * step)
+
+        return self._xrange_calendar(unit, step)
+
+    @staticmethod
+    def _to_naive(dt):
+        """
+        Returns the wall clock time of an instance as a naive datetime.
+
+        :type dt: Pendulum
+
+        :rtype: datetime
+        """
+        return datetime(
+            dt.year, dt.month, dt.day,
+            dt.hour, dt.minute, dt.second, dt.microsecond
+        )
+
+    def _xrange_fixed(self, step):
+        """
+        Iterates over the period by adding a fixed duration
+        to the UTC time of the start.
+
+        The UTC times are converted in chunks
+        so that the transitions are looked up once per chunk.
+
+        :param step: The duration, in microseconds
+        :type step: int
+
+        :rtype: generator
+        """
+        start, end = self.start, self.end
+        op = operator.le if step > 0 else operator.ge
+
+        if not op(start, end):
+            return
+
+        yield start
+
+        cls = start.__class__
+        tz = start.tz
+        start_key = start._get_key()
+        count = (end._get_key() - start_key) // step
+
+        for first in range(1, count + 1, self._XRANGE_CHUNK_SIZE):
+            keys = [
+                start_key + step * i
+                for i in range(first, min(first + self._XRANGE_CHUNK_SIZE, count + 1))
+            ]
+
+            for fields in batch.fromutc_many(tz, keys, 'us'):
+                yield cls(*fields)
+
+    def _range_array(self, unit, step):
+        """
+        Returns the UTC unix times, in microseconds,
+        of the instances xrange() would create, using NumPy.
+
+        :type unit: str
+
+        :type step: int
+
+        :rtype: numpy.ndarray
+        """
+        np = batch.np
+        start, end = self.start, self.end
+        start_key, end_key = start._get_key(), end._get_key()
+
+        if (end_key - start_key) * step < 0:
+            return np.empty(0, dtype=np.int64)
+
+        if unit in self._FIXED_UNITS:
+            step *= self._FIXED_UNITS[unit]
+
+            return start_key + step * np.arange(
+                (end_key - start_key) // step + 1, dtype=np.int64
+            )
+
+        # Local times, as unix times in microseconds,
+        # a few more than needed since local and UTC times
+        # are at most a day apart.
+        time = (
+            (start.hour * 3600 + start.minute * 60 + start.second) * 1000000
+            + start.microsecond
+        )
 
+        if unit in ('years', 'months'):
+            if unit == 'years':
+                step *= 12
+
+            months = start.year * 12 + start.month - 1
+            count = abs(end.year * 12 + end.month - 1 - months) // abs(step) + 2
+
+            year, month = np.divmod(
+                months + step * np.arange(count, dtype=np.int64), 12
+            )
+            month += 1
+            first_days = batch._days_from_civil(year, month, 1)
+            next_first_days = batch._days_from_civil(year + month // 12, month % 12 + 1, 1)
+            local = (
+                first_days + np.minimum(start.day, next_first_days - first_days) - 1
+            ) * 86400000000 + time
+        else:
+            step *= 7 if unit == 'weeks' else 1
+            count = abs(end_key - start_key) // abs(step * 86400000000) + 3
+
+            days = start.toordinal() - start._EPOCH_ORDINAL
+            local = (
+                (days + step * np.arange(count, dtype=np.int64)) * 86400000000
+                + time
+            )
+
+        tz = start.tz
+        utc, _, _ = tz.localize_many(local, unit='us')
+
+        # Instances are offset by their UTC offset adjusted to whole minutes
+        type_indexes = batch._utc_type_indexes_numpy(tz, utc // 1000000)
+        utc += (
+            np.asarray(tz._utc_offsets, dtype=np.int64)[type_indexes]
+            - batch._adjusted_offsets_numpy(tz)[type_indexes]
+        ) * 1000000
+
+        # The start itself is not normalized again
+        utc[0] = start_key
+
+        outside = utc > end_key if step > 0 else utc < end_key
+        if outside.any():
+            utc = utc[:int(outside.argmax())]
+
+        return utc
+
+    def _xrange_calendar(self, unit, step):
+        """
+        Iterates over the period by adding a calendar unit
+        to the wall clock time of the start.
+
+        :type unit: str
+
+        :type step: int
+
+        :rtype: generator
+        """
         start, end = self.start, self.end
+        cls = start.__class__
+        tz = start.tz
+        op = operator.le if step > 0 else operator.ge
+
+        if not op(start, end):
+            return
 
-        i = 1
-        while op(start, end):
-            yield start
+        yield start
 
-            start = getattr(self.start, method)(**{unit: i})
+        wall = self._to_naive(start)
 
-            i += 1
+        if unit in ('years', 'months'):
+            if unit == 'years':
+                step *= 12
+
+            months = start.year * 12 + start.month - 1
+
+            while True:
+                months += step
+                year, month = divmod(months, 12)
+                month += 1
+
+                dt = cls(*tz._normalize(wall.replace(
+                    year=year, month=month,
+                    day=min(start.day, days_in_month(year, month))
+                )))
+                if not op(dt, end):
+                    return
+
+                yield dt
+
+        delta = timedelta(days=step * (7 if unit == 'weeks' else 1))
+        while True:
+            wall += delta
+
+            dt = cls(*tz._normalize(wall))
+            if not op(dt, end):
+                return
+
+            yield dt
 
     def intersect(self, *periods):
         """
@@ -137,18 +410,15 @@ class Period(WordableIntervalMixin, BaseInterval):
 
         :rtype: Interval
         """
-        return Interval(seconds=self.total_seconds())
+        return Interval._from_microseconds(self._us)
 
     def __iter__(self):
         return self.xrange('days')
 
     def __contains__(self, item):
-        from .pendulum import Pendulum
-
-        if not isinstance(item, Pendulum):
-            item = Pendulum.instance(item)
+        start, end = _get_bounds(self)
 
-        return item.between(self.start, self.end)
+        return start <= _get_key(item) <= end
 
     def __add__(self, other):
         return self.as_interval().__add__(other)
@@ -187,3 +457,11 @@ class Period(WordableIntervalMixin, BaseInterval):
         return '<Period [{} -> {}]>'.format(
             self._start, self._end
         )
+
+    def __reduce__(self):
+        start, end = self._start, self._end
+        if self._absolute and self._invert:
+            # Restores the original order so that invert is kept
+            start, end = end, start
+
+        return self.__class__, (start, end, self._absolute)
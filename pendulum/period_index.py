@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left, bisect_right
+
+
+def _get_key(dt):
+    """
+    Returns the UTC time, in microseconds since the epoch,
+    of an instance or a datetime.
+
+    :type dt: Pendulum or datetime
+
+    :rtype: int
+    """
+    from .pendulum import Pendulum
+
+    if not isinstance(dt, Pendulum):
+        dt = Pendulum.instance(dt)
+
+    return dt._get_key()
+
+
+def _get_bounds(period):
+    """
+    Returns the UTC times, in microseconds since the epoch,
+    of the earliest and the latest ends of a period.
+
+    :type period: Period
+
+    :rtype: tuple
+    """
+    start, end = period.start._get_key(), period.end._get_key()
+    if start > end:
+        start, end = end, start
+
+    return start, end
+
+
+def _get_end(period, key):
+    """
+    Returns the end of a period at a given UTC time.
+
+    :type period: Period
+
+    :type key: int
+
+    :rtype: Pendulum
+    """
+    if period.start._get_key() == key:
+        return period.start
+
+    return period.end
+
+
+class PeriodIndex(object):
+    """
+    An immutable collection of periods answering which of them
+    contain an instant or overlap a time span,
+    and combining them as sets of instants.
+
+    The periods are sorted by start and stored in a centered interval tree
+    so that the periods containing an instant are found
+    in O(log n + k) time, k being the number of periods found,
+    while the sorted starts and ends give their number in O(log n) time.
+    The set operations sweep the sorted periods once.
+
+    Periods include both their ends, whatever their direction.
+    """
+
+    def __init__(self, periods=()):
+        bounds = sorted(
+            (_get_bounds(period) + (period,) for period in periods),
+            key=lambda b: (b[0], b[1])
+        )
+
+        self._periods = [b[2] for b in bounds]
+        self._starts = [b[0] for b in bounds]
+        self._ends = [b[1] for b in bounds]
+        self._sorted_ends = sorted(self._ends)
+
+        # Built on first use
+        self._root = None
+        self._coalesced = None
+
+    def _build(self):
+        """
+        Builds the interval tree.
+
+        Each node is centered on the start of the median of its periods
+        and holds the periods containing its center, sorted by start
+        and by descending end. The periods ending before the center
+        go to the left child, those starting after it to the right child,
+        so that each child has at most half of the periods of its parent.
+
+        The nodes are stored in flat lists, indexed by node,
+        the children of a node being -1 when it has none.
+        """
+        starts, ends = self._starts, self._ends
+
+        self._centers = []
+        self._by_start = []
+        self._by_end = []
+        self._left = []
+        self._right = []
+
+        if not starts:
+            self._root = -1
+
+            return
+
+        self._root = 0
+
+        # Positions of the periods of a node, in start order,
+        # with the node and the side of its parent to attach it to
+        stack = [(list(range(len(starts))), None, None)]
+        while stack:
+            positions, parent, children = stack.pop()
+
+            node = len(self._centers)
+            if parent is not None:
+                children[parent] = node
+
+            center = starts[positions[len(positions) // 2]]
+            left = []
+            right = []
+            centered = []
+            for i in positions:
+                if ends[i] < center:
+                    left.append(i)
+                elif starts[i] > center:
+                    right.append(i)
+                else:
+                    centered.append(i)
+
+            self._centers.append(center)
+            self._by_start.append(centered)
+            self._by_end.append(sorted(centered, key=ends.__getitem__, reverse=True))
+            self._left.append(-1)
+            self._right.append(-1)
+
+            if left:
+                stack.append((left, node, self._left))
+
+            if right:
+                stack.append((right, node, self._right))
+
+    def _containing(self, key):
+        """
+        Returns the positions of the periods containing a UTC time,
+        in no particular order.
+
+        :type key: int
+
+        :rtype: list
+        """
+        if self._root is None:
+            self._build()
+
+        starts, ends = self._starts, self._ends
+        positions = []
+
+        node = self._root
+        while node != -1:
+            center = self._centers[node]
+
+            if key < center:
+                for i in self._by_start[node]:
+                    if starts[i] > key:
+                        break
+
+                    positions.append(i)
+
+                node = self._left[node]
+            elif key > center:
+                for i in self._by_end[node]:
+                    if ends[i] < key:
+                        break
+
+                    positions.append(i)
+
+                node = self._right[node]
+            else:
+                positions.extend(self._by_start[node])
+
+                break
+
+        return positions
+
+    def containing(self, dt):
+        """
+        Returns the periods containing an instant, sorted by start.
+
+        :type dt: Pendulum or datetime
+
+        :rtype: list
+        """
+        periods = self._periods
+
+        return [periods[i] for i in sorted(self._containing(_get_key(dt)))]
+
+    def overlapping(self, start, end):
+        """
+        Returns the periods overlapping a time span,
+        both ends included, sorted by start.
+
+        :type start: Pendulum or datetime
+        :type end: Pendulum or datetime
+
+        :rtype: list
+        """
+        start, end = _get_key(start), _get_key(end)
+        if start > end:
+            start, end = end, start
+
+        periods = self._periods
+
+        # The periods containing the start
+        # and those starting within the time span
+        return (
+            [periods[i] for i in sorted(self._containing(start))]
+            + periods[
+                bisect_right(self._starts, start):bisect_right(self._starts, end)
+            ]
+        )
+
+    def count(self, start, end=None):
+        """
+        Returns the number of periods containing an instant
+        or, if an end is given, overlapping a time span.
+
+        :type start: Pendulum or datetime
+        :type end: Pendulum or datetime or None
+
+        :rtype: int
+        """
+        start = _get_key(start)
+        if end is None:
+            end = start
+        else:
+            end = _get_key(end)
+            if start > end:
+                start, end = end, start
+
+        # The periods starting before the end of the time span,
+        # minus those ending before its start
+        return (
+            bisect_right(self._starts, end)
+            - bisect_left(self._sorted_ends, start)
+        )
+
+    def _coalesce(self):
+        """
+        Returns the bounds of the disjoint time spans
+        covered by the periods, sorted, as lists of
+        their start and end times and the instances at these times.
+
+        :rtype: list
+        """
+        if self._coalesced is not None:
+            return self._coalesced
+
+        coalesced = []
+        last = None
+        for start, end, period in zip(self._starts, self._ends, self._periods):
+            if last is not None and start <= last[1]:
+                # Overlapping or touching the previous time span
+                if end > last[1]:
+                    last[1] = end
+                    last[3] = _get_end(period, end)
+
+                continue
+
+            last = [start, end, _get_end(period, start), _get_end(period, end)]
+            coalesced.append(last)
+
+        self._coalesced = coalesced
+        self._coalesced_ends = [c[1] for c in coalesced]
+
+        return coalesced
+
+    def coalesce(self):
+        """
+        Returns the disjoint periods covering the same instants
+        as the periods of the index, sorted,
+        overlapping and touching periods being merged.
+
+        :rtype: list
+        """
+        from .period import Period
+
+        return [
+            Period(start_dt, end_dt)
+            for _, _, start_dt, end_dt in self._coalesce()
+        ]
+
+    def complement(self, start, end):
+        """
+        Returns the periods of a time span covered by no period, sorted.
+
+        The returned periods are bounded by the ends
+        of the periods of the index or of the time span.
+
+        :type start: Pendulum or datetime
+        :type end: Pendulum or datetime
+
+        :rtype: list
+        """
+        from .pendulum import Pendulum
+        from .period import Period
+
+        if not isinstance(start, Pendulum):
+            start = Pendulum.instance(start)
+
+        if not isinstance(end, Pendulum):
+            end = Pendulum.instance(end)
+
+        if start > end:
+            start, end = end, start
+
+        coalesced = self._coalesce()
+        end_key = end._get_key()
+        current, current_dt = start._get_key(), start
+
+        # Skips the time spans ending before the start
+        first = bisect_left(self._coalesced_ends, current)
+
+        periods = []
+        for span_start, span_end, span_start_dt, span_end_dt in coalesced[first:]:
+            if span_start > end_key:
+                break
+
+            if span_start > current:
+                periods.append(Period(current_dt, span_start_dt))
+
+            if span_end > current:
+                current, current_dt = span_end, span_end_dt
+
+        if current < end_key:
+            periods.append(Period(current_dt, end))
+
+        return periods
+
+    def gaps(self):
+        """
+        Returns the periods between the periods of the index
+        covered by none of them, sorted.
+
+        :rtype: list
+        """
+        coalesced = self._coalesce()
+        if not coalesced:
+            return []
+
+        return self.complement(coalesced[0][2], coalesced[-1][3])
+
+    def difference(self, periods):
+        """
+        Returns the periods covering the instants
+        covered by the periods of the index but not by the given ones, sorted.
+
+        The returned periods are bounded by the ends
+        of the periods of the index or of the given ones.
+
+        :type periods: PeriodIndex or iterable
+
+        :rtype: list
+        """
+        from .period import Period
+
+        if not isinstance(periods, PeriodIndex):
+            periods = PeriodIndex(periods)
+
+        others = periods._coalesce()
+        count = len(others)
+
+        result = []
+        j = 0
+        for start, end, start_dt, end_dt in self._coalesce():
+            # Skips the periods ending before the time span
+            while j < count and others[j][1] < start:
+                j += 1
+
+            current, current_dt = start, start_dt
+            removed = False
+
+            k = j
+            while k < count and others[k][0] <= end:
+                other_start, other_end, other_start_dt, other_end_dt = others[k]
+
+                if other_start > current:
+                    result.append(Period(current_dt, other_start_dt))
+
+                if other_end >= current:
+                    current, current_dt = other_end, other_end_dt
+                    removed = True
+
+                k += 1
+
+            if not removed:
+                result.append(Period(start_dt, end_dt))
+            elif current < end:
+                result.append(Period(current_dt, end_dt))
+
+        return result
+
+    def __len__(self):
+        return len(self._periods)
+
+    def __iter__(self):
+        return iter(self._periods)
+
+    def __repr__(self):
+        return '<PeriodIndex [{} periods]>'.format(len(self))
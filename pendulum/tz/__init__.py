@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
-from .timezone import Timezone, FixedTimezone, UTC
+import pytz
+
+from .timezone import Timezone, FixedTimezone, UTC, fixed_timezone
 from .local_timezone import LocalTimezone
+from .loader import Loader
+from .database import ZoneDatabase, compile_database
 
 
 def timezone(name):
@@ -23,3 +27,90 @@ def local_timezone():
     :rtype: Timezone
     """
     return LocalTimezone.get()
+
+
+def preload(names):
+    """
+    Loads the given timezones and pins them in the cache
+    so that they are never evicted.
+
+    Calling it in a master process before forking lets the workers
+    share the loaded timezones instead of loading them on first use.
+
+    :param names: The names of the timezones.
+    :type names: list
+
+    :rtype: list
+    """
+    zones = []
+    for name in names:
+        zone = Timezone.load(name)
+        Timezone._cache.pin(name, zone)
+
+        zones.append(zone)
+
+    return zones
+
+
+def preload_all():
+    """
+    Loads and pins every known timezone
+    (those of the compiled database if one is used).
+
+    :rtype: list
+    """
+    database = Loader.get_database()
+    if database is not None:
+        names = database.names
+    else:
+        names = pytz.all_timezones
+
+    return preload(names)
+
+
+def set_cache_policy(policy, maxsize=None):
+    """
+    Sets the policy of the timezone cache.
+
+    :param policy: unbounded (the default), lru or pinned.
+    :type policy: str
+
+    :param maxsize: The maximum number of cached timezones, besides
+                    the preloaded ones, for the lru policy.
+    :type maxsize: int or None
+    """
+    Timezone._cache.configure(policy, maxsize)
+
+
+def cache_info():
+    """
+    Returns the policy, the size and the statistics
+    (hits, misses, evictions and total load time in seconds)
+    of the timezone cache.
+
+    :rtype: dict
+    """
+    return Timezone._cache.info()
+
+
+def use_database(path=None):
+    """
+    Loads timezones from a compiled timezone database
+    (see compile_database()) instead of the pytz zoneinfo files.
+
+    The database is memory-mapped so that loading a timezone
+    does not need to parse any file.
+
+    :param path: The path of the database or None to stop using it.
+    :type path: str or None
+
+    :rtype: ZoneDatabase or None
+    """
+    Loader.database_path = None
+
+    if path is None:
+        Loader.database = None
+    else:
+        Loader.database = ZoneDatabase(path)
+
+    return Loader.database
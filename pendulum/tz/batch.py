@@ -0,0 +1,639 @@
+# -*- coding: utf-8 -*-
+
+"""
+Conversions of many unix times at once.
+
+When NumPy is installed, the conversions are vectorized
+and return NumPy arrays. Otherwise, they loop over the given
+unix times and return arrays of the array module.
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+from .. import _compat
+from ..helpers import local_time, PRE_TRANSITION, TRANSITION_ERROR
+from .exceptions import NonExistingTime, AmbiguousTime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+FIELDS = (
+    'year', 'month', 'day',
+    'hour', 'minute', 'second', 'microsecond',
+    'offset', 'is_dst'
+)
+
+_UNITS = {
+    's': 1,
+    'ms': 1000,
+    'us': 1000000,
+}
+
+_USECS_PER_SEC = 1000000
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Unix times of 0001-01-01 and 9999-12-31 23:59:59
+_MIN_UNIX_TIME = -62135596800
+_MAX_UNIX_TIME = 253402300799
+
+
+def _get_unit(unit):
+    if unit not in _UNITS:
+        raise ValueError('Invalid unit [{}]'.format(unit))
+
+    return _UNITS[unit]
+
+
+def _as_array(epochs, dtype=None):
+    """
+    Returns the unix times as a NumPy array.
+
+    :rtype: numpy.ndarray
+    """
+    if not isinstance(epochs, (np.ndarray, list, tuple)):
+        try:
+            # Buffers are not copied
+            return np.asarray(memoryview(epochs), dtype=dtype)
+        except TypeError:
+            epochs = list(epochs)
+
+    return np.asarray(epochs, dtype=dtype)
+
+
+def _year(unix_time):
+    """
+    Returns the year of a UTC unix time, clamped to the supported years.
+
+    :type unix_time: int
+
+    :rtype: int
+    """
+    unix_time = min(max(unix_time, _MIN_UNIX_TIME), _MAX_UNIX_TIME)
+
+    return (_EPOCH + timedelta(seconds=int(unix_time))).year
+
+
+def convert_many(tz, epochs, unit='s'):
+    """
+    Converts UTC unix times to local time fields in the given timezone.
+
+    :param tz: The timezone.
+    :type tz: Timezone
+
+    :param epochs: The UTC unix times: a NumPy array,
+                   any object supporting the buffer protocol
+                   or an iterable of integers.
+    :type epochs: numpy.ndarray or array or iterable
+
+    :param unit: The unit of the unix times: s (seconds),
+                 ms (milliseconds) or us (microseconds).
+    :type unit: str
+
+    :return: The local fields (see FIELDS), by name.
+    :rtype: dict
+    """
+    factor = _get_unit(unit)
+
+    if np is not None:
+        return _convert_many_numpy(tz, epochs, factor)
+
+    return _convert_many(tz, epochs, factor)
+
+
+def _convert_many(tz, epochs, factor):
+    if not isinstance(epochs, (list, tuple, array)):
+        epochs = list(epochs)
+
+    results = dict(
+        (field, array(_compat.INT64_TYPECODE)) for field in FIELDS[:-1]
+    )
+    results['is_dst'] = array('B')
+    if not epochs:
+        return results
+
+    transition_times, _, _, transition_type_indexes = tz._get_transition_table(
+        _year(min(epochs) // factor), _year(max(epochs) // factor) + 1
+    )
+    transition_types = tz._transition_types
+    default_transition_type_index = tz._default_transition_type_index
+
+    usecs_per_unit = _USECS_PER_SEC // factor
+
+    appends = [results[field].append for field in FIELDS]
+    for epoch in epochs:
+        sec, remainder = divmod(int(epoch), factor)
+        microsecond = remainder * usecs_per_unit
+
+        idx = bisect_right(transition_times, sec) - 1
+        if idx < 0:
+            transition_type_index = default_transition_type_index
+        else:
+            transition_type_index = transition_type_indexes[idx]
+
+        transition_type = transition_types[transition_type_index]
+        fields = local_time(sec, transition_type.utc_offset)[:-1] + (
+            microsecond,
+            transition_type.utc_offset,
+            transition_type.is_dst
+        )
+
+        for append, value in zip(appends, fields):
+            append(value)
+
+    return results
+
+
+def _convert_many_numpy(tz, epochs, factor):
+    epochs = _as_array(epochs, np.int64)
+
+    if factor == 1:
+        secs = epochs
+        microseconds = np.zeros(epochs.shape, dtype=np.int64)
+    else:
+        secs, remainders = np.divmod(epochs, factor)
+        microseconds = remainders * (_USECS_PER_SEC // factor)
+
+    if not epochs.size:
+        first_year = last_year = 1970
+    else:
+        first_year = _year(int(secs.min()))
+        last_year = _year(int(secs.max())) + 1
+
+    transition_times, _, _, transition_type_indexes = tz._get_transition_table(
+        first_year, last_year
+    )
+    type_indexes = _utc_type_indexes(
+        tz, secs, transition_times, transition_type_indexes
+    )
+
+    offsets = np.asarray(tz._utc_offsets, dtype=np.int64)[type_indexes]
+    is_dst = np.array(
+        [tt.is_dst for tt in tz._transition_types], dtype=bool
+    )[type_indexes]
+
+    local = secs + offsets
+    days, seconds = np.divmod(local, 86400)
+    year, month, day = _civil_from_days(days)
+    hour, seconds = np.divmod(seconds, 3600)
+    minute, second = np.divmod(seconds, 60)
+
+    return {
+        'year': year,
+        'month': month,
+        'day': day,
+        'hour': hour,
+        'minute': minute,
+        'second': second,
+        'microsecond': microseconds,
+        'offset': offsets,
+        'is_dst': is_dst,
+    }
+
+
+def _utc_type_indexes(tz, secs, transition_times, transition_type_indexes):
+    """
+    Returns the transition type indexes in effect at the given UTC unix times.
+
+    :rtype: numpy.ndarray
+    """
+    transition_times = np.asarray(transition_times, dtype=np.int64)
+    transition_type_indexes = np.asarray(transition_type_indexes, dtype=np.intp)
+
+    if not transition_times.size:
+        return np.full(secs.shape, tz._default_transition_type_index, dtype=np.intp)
+
+    idx = np.searchsorted(transition_times, secs, side='right') - 1
+
+    return np.where(
+        idx < 0,
+        tz._default_transition_type_index,
+        transition_type_indexes[np.maximum(idx, 0)]
+    )
+
+
+def fromutc_many(tz, epochs, unit='s'):
+    """
+    Converts UTC unix times to local times in the given timezone,
+    like Timezone.fromutc() does for a single datetime.
+
+    Unlike convert_many(), the conversions use the offsets
+    adjusted to whole minutes, as datetimes do,
+    and the unix times may be floats.
+
+    :param tz: The timezone.
+    :type tz: Timezone
+
+    :param epochs: The UTC unix times: a NumPy array,
+                   any object supporting the buffer protocol
+                   or an iterable of numbers.
+    :type epochs: numpy.ndarray or array or iterable
+
+    :param unit: The unit of the unix times: s (seconds),
+                 ms (milliseconds) or us (microseconds).
+    :type unit: str
+
+    :return: The local year, month, day, hour, minute, second,
+             microsecond and TimezoneInfo of each unix time.
+    :rtype: iterator
+    """
+    factor = _get_unit(unit)
+
+    if np is not None:
+        return _fromutc_many_numpy(tz, epochs, factor)
+
+    return _fromutc_many(tz, epochs, factor)
+
+
+def _fromutc_many(tz, epochs, factor):
+    if not isinstance(epochs, (list, tuple, array)):
+        epochs = list(epochs)
+
+    if not epochs:
+        return
+
+    transition_times, _, _, transition_type_indexes = tz._get_transition_table(
+        _year(int(min(epochs) // factor)), _year(int(max(epochs) // factor)) + 1
+    )
+    tzinfos = tz._tzinfos
+    default_transition_type_index = tz._default_transition_type_index
+    count = len(transition_times)
+    usecs_per_unit = _USECS_PER_SEC // factor
+
+    # Bounds of the transition interval of the previous unix time,
+    # so that the search is skipped for consecutive times in the same interval.
+    start = end = 0
+
+    for epoch in epochs:
+        if isinstance(epoch, float):
+            epoch = int(round(epoch * usecs_per_unit))
+        else:
+            epoch = int(epoch) * usecs_per_unit
+
+        sec, microsecond = divmod(epoch, _USECS_PER_SEC)
+
+        if not start <= sec < end:
+            idx = bisect_right(transition_times, sec)
+            if idx:
+                start = transition_times[idx - 1]
+                tzinfo = tzinfos[transition_type_indexes[idx - 1]]
+            else:
+                start = _MIN_UNIX_TIME * 2
+                tzinfo = tzinfos[default_transition_type_index]
+
+            if idx < count:
+                end = transition_times[idx]
+            else:
+                end = _MAX_UNIX_TIME * 2
+
+            offset = tzinfo.adjusted_offset.days * 86400 + tzinfo.adjusted_offset.seconds
+
+        yield local_time(sec, offset)[:-1] + (microsecond, tzinfo)
+
+
+def _fromutc_many_numpy(tz, epochs, factor):
+    epochs = _as_array(epochs)
+    usecs_per_unit = _USECS_PER_SEC // factor
+
+    if epochs.dtype.kind == 'f':
+        epochs = np.round(epochs * usecs_per_unit).astype(np.int64)
+    else:
+        epochs = epochs.astype(np.int64) * usecs_per_unit
+
+    if not epochs.size:
+        return iter(())
+
+    secs, microseconds = np.divmod(epochs, _USECS_PER_SEC)
+
+    type_indexes = _utc_type_indexes_numpy(tz, secs)
+    offsets = _adjusted_offsets_numpy(tz)[type_indexes]
+
+    days, seconds = np.divmod(secs + offsets, 86400)
+    year, month, day = _civil_from_days(days)
+    hour, seconds = np.divmod(seconds, 3600)
+    minute, second = np.divmod(seconds, 60)
+
+    tzinfos = tz._tzinfos
+
+    return zip(
+        year.tolist(), month.tolist(), day.tolist(),
+        hour.tolist(), minute.tolist(), second.tolist(),
+        microseconds.tolist(),
+        [tzinfos[i] for i in type_indexes.tolist()]
+    )
+
+
+def _utc_type_indexes_numpy(tz, secs):
+    """
+    Returns the transition type indexes in effect at the given UTC unix times,
+    loading the transitions of the years they span.
+
+    :type secs: numpy.ndarray
+
+    :rtype: numpy.ndarray
+    """
+    if not secs.size:
+        return np.zeros(secs.shape, dtype=np.intp)
+
+    transition_times, _, _, transition_type_indexes = tz._get_transition_table(
+        _year(int(secs.min())), _year(int(secs.max())) + 1
+    )
+
+    return _utc_type_indexes(tz, secs, transition_times, transition_type_indexes)
+
+
+def _adjusted_offsets_numpy(tz):
+    """
+    Returns the offsets of each transition type of a timezone,
+    adjusted to whole minutes as datetimes do.
+
+    :rtype: numpy.ndarray
+    """
+    return np.array(
+        [tzinfo.adjusted_offset.days * 86400 + tzinfo.adjusted_offset.seconds
+         for tzinfo in tz._tzinfos],
+        dtype=np.int64
+    )
+
+
+def localize_many(tz, epochs, dst_rule, unit='s'):
+    """
+    Converts local unix times (naive wall-clock times
+    expressed as unix times) of the given timezone to UTC unix times.
+
+    Skipped and repeated times are handled like Timezone._normalize()
+    does. With the TRANSITION_ERROR rule, the first skipped or repeated
+    time raises an error.
+
+    :param tz: The timezone.
+    :type tz: Timezone
+
+    :param epochs: The local unix times: a NumPy array,
+                   any object supporting the buffer protocol
+                   or an iterable of integers.
+    :type epochs: numpy.ndarray or array or iterable
+
+    :param dst_rule: The transition rule code (see pendulum.helpers).
+    :type dst_rule: int
+
+    :param unit: The unit of the unix times: s (seconds),
+                 ms (milliseconds) or us (microseconds).
+    :type unit: str
+
+    :return: The UTC unix times, in the same unit,
+             whether each time is ambiguous and whether it does not exist.
+    :rtype: tuple
+    """
+    factor = _get_unit(unit)
+
+    if np is not None:
+        epochs = _as_array(epochs, np.int64)
+        results = _localize_many_numpy(tz, epochs, factor, dst_rule)
+    else:
+        if not isinstance(epochs, (list, tuple, array)):
+            epochs = list(epochs)
+
+        results = _localize_many(tz, epochs, factor, dst_rule)
+
+    if dst_rule == TRANSITION_ERROR:
+        _, ambiguous, nonexistent = results
+
+        if np is not None:
+            errors = np.flatnonzero(ambiguous | nonexistent)
+            first_error = int(errors[0]) if errors.size else None
+        else:
+            first_error = next(
+                (i for i, flags in enumerate(zip(ambiguous, nonexistent))
+                 if any(flags)),
+                None
+            )
+
+        if first_error is not None:
+            sec, remainder = divmod(int(epochs[first_error]), factor)
+            dt = _EPOCH + timedelta(
+                seconds=sec, microseconds=remainder * (_USECS_PER_SEC // factor)
+            )
+
+            if nonexistent[first_error]:
+                raise NonExistingTime(dt)
+
+            raise AmbiguousTime(dt)
+
+    return results
+
+
+def _localize(sec, microsecond,
+              pre_times, times, transition_type_indexes,
+              utc_offsets, default_transition_type_index, dst_rule):
+    """
+    Returns the UTC unix time of a local unix time
+    and whether it is ambiguous or does not exist.
+
+    :rtype: tuple
+    """
+    # Since transition times are whole seconds, dt <= t
+    # is equivalent to sec < t or (sec == t and microsecond == 0)
+    if not times or sec < times[0]:
+        return sec - utc_offsets[default_transition_type_index], False, False
+
+    last = len(times) - 1
+    if sec >= times[last]:
+        i = last
+    else:
+        i = bisect_right(times, sec)
+
+        # DST -> No DST
+        pre_time = pre_times[i - 1]
+        if sec < pre_time or (sec == pre_time and not microsecond):
+            i -= 1
+
+    pre_time = pre_times[i]
+    time = times[i]
+    transition_type_index = transition_type_indexes[i]
+    if i:
+        pre_transition_type_index = transition_type_indexes[i - 1]
+    else:
+        pre_transition_type_index = transition_type_index
+
+    if pre_time <= sec < time:
+        # Skipped time
+        return sec - utc_offsets[pre_transition_type_index], False, True
+
+    if time <= sec and (sec < pre_time or (sec == pre_time and not microsecond)):
+        # Repeated time
+        if dst_rule == PRE_TRANSITION:
+            transition_type_index = pre_transition_type_index
+
+        return sec - utc_offsets[transition_type_index], True, False
+
+    if i != last or sec < time:
+        # In between transitions
+        transition_type_index = pre_transition_type_index
+
+    return sec - utc_offsets[transition_type_index], False, False
+
+
+def _local_years(epochs, factor):
+    """
+    Returns the first and last years of the transitions
+    needed to handle the given local unix times.
+
+    :rtype: tuple
+    """
+    # Local times are at most a day away from UTC times
+    return (
+        _year(min(epochs) // factor - 86400),
+        _year(max(epochs) // factor + 86400) + 1
+    )
+
+
+def _localize_many(tz, epochs, factor, dst_rule):
+    utc = array(_compat.INT64_TYPECODE)
+    ambiguous = array('B')
+    nonexistent = array('B')
+    if not epochs:
+        return utc, ambiguous, nonexistent
+
+    first_year, last_year = _local_years(epochs, factor)
+    _, pre_times, times, transition_type_indexes = tz._get_transition_table(
+        first_year, last_year
+    )
+    utc_offsets = tz._utc_offsets
+    default_transition_type_index = tz._default_transition_type_index
+
+    for epoch in epochs:
+        sec, microsecond = divmod(int(epoch), factor)
+
+        unix_time, is_ambiguous, is_nonexistent = _localize(
+            sec, microsecond,
+            pre_times, times, transition_type_indexes,
+            utc_offsets, default_transition_type_index, dst_rule
+        )
+
+        utc.append(unix_time * factor + microsecond)
+        ambiguous.append(is_ambiguous)
+        nonexistent.append(is_nonexistent)
+
+    return utc, ambiguous, nonexistent
+
+
+def _localize_many_numpy(tz, epochs, factor, dst_rule):
+    secs, microseconds = np.divmod(epochs, factor)
+
+    utc_offsets = np.asarray(tz._utc_offsets, dtype=np.int64)
+    if not epochs.size:
+        first_year = last_year = 1970
+    else:
+        first_year, last_year = _local_years(
+            [int(secs.min()), int(secs.max())], 1
+        )
+
+    _, pre_times, times, transition_type_indexes = tz._get_transition_table(
+        first_year, last_year
+    )
+    pre_times = np.asarray(pre_times, dtype=np.int64)
+    times = np.asarray(times, dtype=np.int64)
+    transition_type_indexes = np.asarray(transition_type_indexes, dtype=np.intp)
+
+    default_offset = utc_offsets[tz._default_transition_type_index]
+    if not times.size:
+        false = np.zeros(epochs.shape, dtype=bool)
+
+        return (secs - default_offset) * factor + microseconds, false, false.copy()
+
+    # Since transition times are whole seconds, dt <= t
+    # is equivalent to sec < t or (sec == t and microsecond == 0)
+    at_second = microseconds == 0
+    last = len(times) - 1
+
+    i = np.searchsorted(times, secs, side='right')
+    previous_pre_times = pre_times[np.maximum(i - 1, 0)]
+
+    # DST -> No DST
+    i = np.where(
+        (secs < previous_pre_times) | ((secs == previous_pre_times) & at_second),
+        i - 1, i
+    )
+    i = np.clip(i, 0, last)
+
+    pre_time = pre_times[i]
+    time = times[i]
+    transition_type_index = transition_type_indexes[i]
+    pre_transition_type_index = transition_type_indexes[np.maximum(i - 1, 0)]
+
+    before_first = secs < times[0]
+    skipped = ~before_first & (pre_time <= secs) & (secs < time)
+    repeated = (
+        ~before_first & (time <= secs)
+        & ((secs < pre_time) | ((secs == pre_time) & at_second))
+    )
+    in_between = ~skipped & ~repeated & ((i != last) | (secs < time))
+
+    use_pre = skipped | in_between
+    if dst_rule == PRE_TRANSITION:
+        use_pre |= repeated
+
+    offsets = utc_offsets[
+        np.where(use_pre, pre_transition_type_index, transition_type_index)
+    ]
+    offsets = np.where(before_first, default_offset, offsets)
+
+    return (secs - offsets) * factor + microseconds, repeated, skipped
+
+
+def _civil_from_days(days):
+    """
+    Returns the year, month and day of days since 1970-01-01
+    in the proleptic Gregorian calendar.
+
+    :type days: numpy.ndarray
+
+    :rtype: tuple
+    """
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era
+        - day_of_era // 1460
+        + day_of_era // 36524
+        - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+
+    # Months start in March so that February 29th is the last day of the year
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = np.where(shifted_month < 10, shifted_month + 3, shifted_month - 9)
+    year = year_of_era + era * 400 + (month <= 2)
+
+    return year, month, day
+
+
+def _days_from_civil(year, month, day):
+    """
+    Returns the days since 1970-01-01 of dates
+    in the proleptic Gregorian calendar.
+
+    :type year: numpy.ndarray
+    :type month: numpy.ndarray
+    :type day: numpy.ndarray
+
+    :rtype: numpy.ndarray
+    """
+    # Months start in March so that February 29th is the last day of the year
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    shifted_month = np.where(month > 2, month - 3, month + 9)
+    day_of_year = (153 * shifted_month + 2) // 5 + day - 1
+    day_of_era = (
+        year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    )
+
+    return era * 146097 + day_of_era - 719468
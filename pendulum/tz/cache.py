@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class TimezoneCache(object):
+    """
+    Cache of the loaded timezones.
+
+    Three policies are available:
+
+        - unbounded: every loaded timezone is kept (the default),
+        - lru: at most maxsize timezones, besides the pinned ones,
+          are kept, the least recently used ones are evicted first,
+        - pinned: only the pinned (preloaded) timezones are kept,
+          the other ones are loaded on each access.
+
+    Pinned timezones are never evicted, whatever the policy.
+    """
+
+    UNBOUNDED = 'unbounded'
+    LRU = 'lru'
+    PINNED = 'pinned'
+
+    def __init__(self, policy=UNBOUNDED, maxsize=None):
+        self._zones = OrderedDict()
+        self._pinned = {}
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_time = 0.0
+
+        self.configure(policy, maxsize)
+
+    @property
+    def policy(self):
+        return self._policy
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def configure(self, policy=UNBOUNDED, maxsize=None):
+        """
+        Changes the cache policy.
+
+        Timezones in excess of the new policy are evicted.
+
+        :param policy: The cache policy (unbounded, lru or pinned).
+        :type policy: str
+
+        :param maxsize: The maximum number of timezones kept
+                        by the lru policy.
+        :type maxsize: int or None
+        """
+        if policy not in (self.UNBOUNDED, self.LRU, self.PINNED):
+            raise ValueError('Invalid cache policy [{}]'.format(policy))
+
+        if policy == self.LRU:
+            if maxsize is None or maxsize < 1:
+                raise ValueError(
+                    'The lru cache policy needs a positive maxsize'
+                )
+        else:
+            maxsize = None
+
+        with self._lock:
+            self._policy = policy
+            self._maxsize = maxsize
+
+            if policy == self.PINNED:
+                self.evictions += len(self._zones)
+                self._zones.clear()
+            else:
+                self._shrink()
+
+    def get(self, name):
+        """
+        Returns the cached timezone with the given name
+        or None if it is not cached.
+
+        :type name: str
+
+        :rtype: Timezone or None
+        """
+        with self._lock:
+            zone = self._pinned.get(name)
+            if zone is None:
+                zone = self._zones.get(name)
+
+                if zone is not None and self._policy == self.LRU:
+                    # Marks it as the most recently used
+                    self._zones[name] = self._zones.pop(name)
+
+            if zone is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return zone
+
+    def add(self, name, zone, load_time=0.0):
+        """
+        Adds a newly loaded timezone to the cache.
+
+        :param name: The name of the timezone.
+        :type name: str
+
+        :param zone: The timezone.
+        :type zone: Timezone
+
+        :param load_time: The time it took to load the timezone, in seconds.
+        :type load_time: float
+        """
+        with self._lock:
+            self.load_time += load_time
+
+            if self._policy == self.PINNED:
+                return
+
+            self._zones[name] = zone
+            self._shrink()
+
+    def pin(self, name, zone):
+        """
+        Pins a timezone so that it is never evicted.
+
+        :type name: str
+
+        :type zone: Timezone
+        """
+        with self._lock:
+            self._zones.pop(name, None)
+            self._pinned[name] = zone
+
+    def clear(self, pinned=False):
+        """
+        Removes the cached timezones.
+
+        :param pinned: Whether to also remove the pinned timezones.
+        :type pinned: bool
+        """
+        with self._lock:
+            self._zones.clear()
+
+            if pinned:
+                self._pinned.clear()
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.load_time = 0.0
+
+    def info(self):
+        """
+        Returns the policy, the size and the statistics of the cache.
+
+        :rtype: dict
+        """
+        return {
+            'policy': self._policy,
+            'maxsize': self._maxsize,
+            'size': len(self._zones) + len(self._pinned),
+            'pinned': len(self._pinned),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'load_time': self.load_time,
+        }
+
+    def __contains__(self, name):
+        return name in self._pinned or name in self._zones
+
+    def __len__(self):
+        return len(self._zones) + len(self._pinned)
+
+    def _shrink(self):
+        if self._maxsize is None:
+            return
+
+        while len(self._zones) > self._maxsize:
+            self._zones.popitem(last=False)
+            self.evictions += 1
+
+    def __repr__(self):
+        return '<TimezoneCache [{}, {}/{}]>'.format(
+            self._policy, len(self), self._maxsize
+        )
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+import mmap
+import sys
+import pytz
+
+from array import array
+from struct import pack, unpack_from, calcsize
+
+from .. import _compat
+from .loader import Loader
+from .transition_type import TransitionType
+
+
+# File layout (native byte order, 8-byte aligned sections):
+#
+#   - header: magic, format version, byte order,
+#             number of zones, offset of the name index
+#   - one record per zone:
+#       - record header: number of transitions, number of transition types,
+#                        default transition type index, abbreviations size,
+#                        POSIX TZ rule size
+#       - UTC transition times (int64)
+#       - local times before the transitions (int64)
+#       - local times after the transitions (int64)
+#       - transition type indexes (uint8)
+#       - transition types: offset (int32), is_dst (uint8),
+#                           abbreviation size (uint8) and offset (uint16)
+#       - abbreviations
+#       - POSIX TZ rule
+#   - name index: (name size, name, record offset) for each zone
+_MAGIC = b'PTZD'
+_VERSION = 2
+_HEADER = '=4sBBxxIQ'
+_RECORD_HEADER = '=IIIIIxxxx'
+_TRANSITION_TYPE = '=iBBH'
+_INDEX_ENTRY = '=H'
+_INDEX_OFFSET = '=Q'
+_BYTE_ORDER = {'little': 0, 'big': 1}[sys.byteorder]
+
+
+def _align(size):
+    return (size + 7) & ~7
+
+
+def _pad(data):
+    return data + b'\0' * (_align(len(data)) - len(data))
+
+
+def _to_bytes(column):
+    if hasattr(column, 'tobytes'):
+        return column.tobytes()
+
+    return column.tostring()
+
+
+def compile_database(path, names=None):
+    """
+    Compiles the given timezones (all known timezones by default)
+    into a single binary file that can be loaded with ZoneDatabase.
+
+    :param path: The path of the file to write.
+    :type path: str
+
+    :param names: The names of the timezones to compile.
+    :type names: list or None
+
+    :return: The number of compiled timezones.
+    :rtype: int
+    """
+    if names is None:
+        names = pytz.all_timezones
+
+    records = []
+    index = []
+    offset = _align(calcsize(_HEADER))
+    for name in names:
+        name = _compat.decode(name)
+        with pytz.open_resource(name) as f:
+            (transition_times,
+             pre_times,
+             times,
+             transition_type_indexes,
+             transition_types,
+             default_transition_type_index,
+             posix_rule) = Loader._load(f)
+
+        abbrevs = b''
+        types = b''
+        for transition_type in transition_types:
+            abbrev = _compat.encode(transition_type.abbrev)
+            types += pack(
+                _TRANSITION_TYPE,
+                transition_type.utc_offset, transition_type.is_dst,
+                len(abbrev), len(abbrevs)
+            )
+            abbrevs += abbrev
+
+        rule = _compat.encode(posix_rule or '')
+
+        record = pack(
+            _RECORD_HEADER,
+            len(transition_times), len(transition_types),
+            default_transition_type_index, len(abbrevs), len(rule)
+        )
+        for column in (transition_times, pre_times, times):
+            record += _to_bytes(array(_compat.INT64_TYPECODE, column))
+
+        record += _pad(_to_bytes(array('B', transition_type_indexes)))
+        record += _pad(types + abbrevs + rule)
+
+        records.append(record)
+        index.append((_compat.encode(name), offset))
+        offset += len(record)
+
+    index_data = []
+    for name, record_offset in index:
+        index_data.append(pack(_INDEX_ENTRY, len(name)) + name)
+        index_data.append(pack(_INDEX_OFFSET, record_offset))
+
+    with open(path, 'wb') as f:
+        f.write(_pad(pack(_HEADER, _MAGIC, _VERSION, _BYTE_ORDER,
+                          len(index), offset)))
+
+        for record in records:
+            f.write(record)
+
+        f.write(b''.join(index_data))
+
+    return len(index)
+
+
+class ZoneDatabase(object):
+    """
+    A compiled timezone database.
+
+    The file is memory-mapped so that the transition columns
+    of the loaded timezones are views on the mapped file
+    and are shared between processes.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, byte_order,
+         count, index_offset) = unpack_from(_HEADER, self._map)
+
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Invalid timezone database [{}]'.format(path))
+
+        if byte_order != _BYTE_ORDER:
+            raise ValueError(
+                'Timezone database [{}] was compiled '
+                'for another byte order'.format(path)
+            )
+
+        self._path = path
+        self._view = None
+        if not _compat.PY2:
+            self._view = memoryview(self._map)
+
+        self._index = {}
+        position = index_offset
+        for _ in range(count):
+            size, = unpack_from(_INDEX_ENTRY, self._map, position)
+            position += calcsize(_INDEX_ENTRY)
+            name = _compat.decode(self._map[position:position + size])
+            position += size
+            self._index[name], = unpack_from(_INDEX_OFFSET, self._map, position)
+            position += calcsize(_INDEX_OFFSET)
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def names(self):
+        return list(self._index.keys())
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def load(self, name):
+        """
+        Loads the transition data of the timezone with the given name.
+
+        It returns the same data as Loader.load().
+
+        :param name: The name of the timezone
+        :type name: str
+
+        :rtype: tuple
+        """
+        if name not in self._index:
+            raise ValueError('Unknown timezone [{}]'.format(name))
+
+        position = self._index[name]
+        (transition_count, type_count,
+         default_transition_type_index,
+         abbrevs_size, rule_size) = unpack_from(_RECORD_HEADER, self._map, position)
+        position += calcsize(_RECORD_HEADER)
+
+        columns = []
+        for _ in range(3):
+            columns.append(
+                self._column(_compat.INT64_TYPECODE, position, transition_count)
+            )
+            position += 8 * transition_count
+
+        transition_type_indexes = self._column('B', position, transition_count)
+        position += _align(transition_count)
+
+        types_size = calcsize(_TRANSITION_TYPE)
+        abbrevs_position = position + type_count * types_size
+        transition_types = tuple()
+        for _ in range(type_count):
+            (utc_offset, is_dst,
+             abbrev_size, abbrev_offset) = unpack_from(
+                _TRANSITION_TYPE, self._map, position
+            )
+            position += types_size
+
+            start = abbrevs_position + abbrev_offset
+            abbrev = _compat.decode(self._map[start:start + abbrev_size])
+            transition_types += (
+                TransitionType(utc_offset, bool(is_dst), str(abbrev)),
+            )
+
+        posix_rule = None
+        if rule_size:
+            start = abbrevs_position + abbrevs_size
+            posix_rule = str(_compat.decode(self._map[start:start + rule_size]))
+
+        return (
+            columns[0],
+            columns[1],
+            columns[2],
+            transition_type_indexes,
+            transition_types,
+            default_transition_type_index,
+            posix_rule
+        )
+
+    def _column(self, typecode, position, count):
+        size = array(typecode).itemsize * count
+
+        if self._view is not None:
+            # Zero-copy view on the mapped file
+            return self._view[position:position + size].cast(typecode)
+
+        column = array(typecode)
+        column.fromstring(self._map[position:position + size])
+
+        return column
+
+    def __repr__(self):
+        return '<ZoneDatabase [{}]>'.format(self._path)
@@ -2,14 +2,13 @@
 
 import inspect
 import os
+import warnings
 import pytz
 
-from datetime import datetime
-from struct import unpack, calcsize
+from array import array
+from struct import unpack, calcsize, error as StructError
 
 from .. import _compat
-from ..helpers import local_time
-from .transition import Transition
 from .transition_type import TransitionType
 
 
@@ -29,9 +28,47 @@ class Loader(object):
 
     path = os.path.join(os.path.dirname(inspect.getfile(pytz)), 'zoneinfo')
 
+    # Compiled timezone database (see pendulum.tz.database)
+    database = None
+
+    # Path of a compiled timezone database to open on the first load
+    database_path = os.environ.get('PENDULUM_TZ_DATABASE') or None
+
+    @classmethod
+    def get_database(cls):
+        """
+        Returns the compiled timezone database in use, if any,
+        opening the one at database_path on first use.
+
+        If it cannot be opened, a warning is issued
+        and the zoneinfo files are used instead.
+
+        :rtype: ZoneDatabase or None
+        """
+        if cls.database is None and cls.database_path is not None:
+            from .database import ZoneDatabase
+
+            path = cls.database_path
+            cls.database_path = None
+
+            try:
+                cls.database = ZoneDatabase(path)
+            except (IOError, OSError, ValueError, StructError) as e:
+                warnings.warn(
+                    'Unable to use the timezone database [{}]: {}. '
+                    'Using the zoneinfo files instead.'.format(path, e)
+                )
+
+        return cls.database
+
     @classmethod
     def load(cls, name):
         name = _compat.decode(name)
+
+        database = cls.get_database()
+        if database is not None and name in database:
+            return database.load(name)
+
         try:
             with pytz.open_resource(name) as f:
                 return cls._load(f)
@@ -56,13 +93,39 @@ class Loader(object):
         # Make sure it is a tzfile(5) file
         assert magic == _byte_string('TZif'), 'Got magic %s' % repr(magic)
 
+        time_fmt = 'l'
+        if fmt >= _byte_string('2'):
+            # Version 2+ files hold a second set of data
+            # with 64-bit transition times, followed by a POSIX TZ rule.
+            # We skip the version 1 data to read it.
+            fp.read(
+                timecnt * 5 + typecnt * 6 + charcnt
+                + leapcnt * 8 + ttisstdcnt + ttisgmtcnt
+            )
+
+            (magic, fmt, ttisgmtcnt, ttisstdcnt, leapcnt, timecnt,
+             typecnt, charcnt) = unpack(head_fmt, fp.read(head_size))
+
+            assert magic == _byte_string('TZif'), 'Got magic %s' % repr(magic)
+
+            time_fmt = 'q'
+
         # Read out the transition times,
         # localtime indices and ttinfo structures.
-        data_fmt = '>%(timecnt)dl %(timecnt)dB %(ttinfo)s %(charcnt)ds' % dict(
-            timecnt=timecnt, ttinfo='lBB' * typecnt, charcnt=charcnt)
+        data_fmt = '>%(timecnt)d%(time)s %(timecnt)dB %(ttinfo)s %(charcnt)ds' % dict(
+            timecnt=timecnt, time=time_fmt, ttinfo='lBB' * typecnt, charcnt=charcnt)
         data_size = calcsize(data_fmt)
         data = unpack(data_fmt, fp.read(data_size))
 
+        posix_rule = None
+        if time_fmt == 'q':
+            # Skip leap seconds and standard/wall and UT/local indicators
+            fp.read(leapcnt * 12 + ttisstdcnt + ttisgmtcnt)
+
+            footer = fp.read().strip()
+            if footer:
+                posix_rule = _std_string(footer)
+
         # make sure we unpacked the right number of values
         assert len(data) == 2 * timecnt + 3 * typecnt + 1
         transition_times = tuple(trans for trans in data[:timecnt])
@@ -92,59 +155,54 @@ class Loader(object):
             )
             i += 3
 
-        # Now build the timezone object
-        if not transition_times:
-            transitions = tuple()
-
-            if transition_types:
-                transitions += (Transition(0, 0, datetime(1970, 1, 1), datetime(1970, 1, 1), 0),)
-        else:
-            # calculate transition info
-            transitions = tuple()
-            for i in range(len(transition_times)):
-                transition_type_index = lindexes[i]
-
-                if i == 0:
-                    pre_transition_type_index = lindexes[i]
-                else:
-                    pre_transition_type_index = lindexes[i - 1]
-
-                pre_time = datetime(
-                    *local_time(transition_times[i],
-                                transition_types[pre_transition_type_index].utc_offset)
-                )
-                time = datetime(
-                    *local_time(transition_times[i],
-                                transition_types[transition_type_index].utc_offset)
-                )
-                tr = Transition(
-                    transition_times[i],
-                    transition_type_index,
-                    pre_time,
-                    time,
-                    pre_transition_type_index
-                )
-
-                transitions += (tr,)
+        # Now build the transition table.
+        # Every column holds plain integers:
+        #   - the UTC unix time of the transition,
+        #   - the local unix time before the transition,
+        #   - the local unix time after the transition,
+        #   - the index of the transition type.
+        utc_times = array(_compat.INT64_TYPECODE, transition_times)
+        pre_times = array(_compat.INT64_TYPECODE)
+        times = array(_compat.INT64_TYPECODE)
+        transition_type_indexes = array('B', lindexes)
+        for i, unix_time in enumerate(transition_times):
+            transition_type_index = lindexes[i]
+
+            if i == 0:
+                pre_transition_type_index = lindexes[i]
+            else:
+                pre_transition_type_index = lindexes[i - 1]
+
+            pre_times.append(
+                unix_time
+                + transition_types[pre_transition_type_index].utc_offset
+            )
+            times.append(
+                unix_time
+                + transition_types[transition_type_index].utc_offset
+            )
 
         # Determine the before-first-transition type
         default_transition_type_index = 0
-        if transitions:
+        if transition_times:
             index = 0
             if transition_types[0].is_dst:
-                index = transition_types.index(transitions[0].transition_type)
+                index = lindexes[0]
                 while index != 0 and transition_types[index].is_dst:
                     index -= 1
 
             while index != len(transition_types) and transition_types[index].is_dst:
                 index += 1
 
-            if index != len(transitions):
+            if index != len(transition_types):
                 default_transition_type_index = index
 
         return (
-            transitions,
+            utc_times,
+            pre_times,
+            times,
+            transition_type_indexes,
             transition_types,
             default_transition_type_index,
-            tuple(map(lambda tr: tr.utc_time, transitions))
+            posix_rule
         )
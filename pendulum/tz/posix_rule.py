@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+from datetime import date
+
+from .transition_type import TransitionType
+
+
+_ABBREV = r'(?:<([A-Za-z0-9+\-]+)>|([A-Za-z]{3,}))'
+_OFFSET = r'([+-]?\d{1,3}(?::\d{1,2}(?::\d{1,2})?)?)'
+_DATE = r'(J\d{1,3}|\d{1,3}|M\d{1,2}\.\d\.\d)(?:/([+-]?\d{1,3}(?::\d{1,2}(?::\d{1,2})?)?))?'
+
+_RULE_RE = re.compile(
+    '^' + _ABBREV + _OFFSET
+    + '(?:' + _ABBREV + _OFFSET + '?'
+    + '(?:,' + _DATE + ',' + _DATE + ')?)?$'
+)
+
+# 719163 is the proleptic ordinal of 1970-01-01
+_EPOCH_ORDINAL = 719163
+
+# Default time of day of the transitions: 02:00:00
+_DEFAULT_TIME = 7200
+
+
+def _parse_time(value):
+    """
+    Parses a POSIX time ([+-]hh[:mm[:ss]]) into seconds.
+
+    :type value: str
+
+    :rtype: int
+    """
+    sign = 1
+    if value[0] in '+-':
+        if value[0] == '-':
+            sign = -1
+
+        value = value[1:]
+
+    parts = [int(part) for part in value.split(':')] + [0, 0]
+
+    return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+def _parse_date(value, time):
+    if value.startswith('M'):
+        month, week, day_of_week = [int(part) for part in value[1:].split('.')]
+
+        if not (1 <= month <= 12 and 1 <= week <= 5 and 0 <= day_of_week <= 6):
+            raise ValueError('Invalid date rule [{}]'.format(value))
+
+        rule = ('M', month, week, day_of_week)
+    elif value.startswith('J'):
+        rule = ('J', int(value[1:]))
+    else:
+        rule = ('', int(value))
+
+    if time is None:
+        return rule + (_DEFAULT_TIME,)
+
+    return rule + (_parse_time(time),)
+
+
+class PosixRule(object):
+    """
+    A POSIX TZ rule, as found in the footer of version 2+ TZif files.
+
+    It describes the local time types and the daylight saving time
+    transitions of a timezone after its last explicit transition.
+    """
+
+    def __init__(self, std, dst=None, start=None, end=None):
+        """
+        :param std: The standard time type.
+        :type std: TransitionType
+
+        :param dst: The daylight saving time type.
+        :type dst: TransitionType or None
+
+        :param start: The date rule of the transition to daylight saving time.
+        :type start: tuple or None
+
+        :param end: The date rule of the transition to standard time.
+        :type end: tuple or None
+        """
+        self._std = std
+        self._dst = dst
+        self._start = start
+        self._end = end
+
+    @classmethod
+    def parse(cls, rule):
+        """
+        Parses a POSIX TZ rule string, like "CET-1CEST,M3.5.0,M10.5.0/3".
+
+        :type rule: str
+
+        :rtype: PosixRule
+        """
+        m = _RULE_RE.match(rule)
+        if not m:
+            raise ValueError('Invalid POSIX TZ rule [{}]'.format(rule))
+
+        (std_abbrev, std_name, std_offset,
+         dst_abbrev, dst_name, dst_offset,
+         start, start_time, end, end_time) = m.groups()
+
+        # POSIX offsets are positive west of Greenwich
+        std_offset = -_parse_time(std_offset)
+        std = TransitionType(std_offset, False, std_abbrev or std_name)
+
+        if not (dst_abbrev or dst_name):
+            return cls(std)
+
+        if dst_offset is None:
+            dst_offset = std_offset + 3600
+        else:
+            dst_offset = -_parse_time(dst_offset)
+
+        dst = TransitionType(dst_offset, True, dst_abbrev or dst_name)
+
+        if start is None:
+            # No rule specified, we fall back on the US rules
+            start, start_time, end, end_time = 'M3.2.0', None, 'M11.1.0', None
+
+        return cls(
+            std, dst,
+            _parse_date(start, start_time),
+            _parse_date(end, end_time)
+        )
+
+    @property
+    def std(self):
+        return self._std
+
+    @property
+    def dst(self):
+        return self._dst
+
+    @property
+    def has_dst(self):
+        return self._dst is not None
+
+    def transitions(self, year):
+        """
+        Returns the transitions occurring in the given year,
+        as (unix_time, is_dst) tuples sorted by time,
+        where is_dst indicates the type in effect after the transition.
+
+        :type year: int
+
+        :rtype: list
+        """
+        if not self.has_dst:
+            return []
+
+        # The transition times are expressed in the local time
+        # in effect before the transition.
+        start = self._local_time(year, self._start) - self._std.utc_offset
+        end = self._local_time(year, self._end) - self._dst.utc_offset
+
+        return sorted([(start, True), (end, False)])
+
+    def _local_time(self, year, rule):
+        """
+        Returns the local unix time of a date rule for the given year.
+
+        :rtype: int
+        """
+        time = rule[-1]
+        if rule[0] == 'M':
+            _, month, week, day_of_week, _ = rule
+            first = date(year, month, 1)
+            # date.weekday() starts on Monday while POSIX starts on Sunday
+            day = 1 + (day_of_week - (first.weekday() + 1)) % 7 + (week - 1) * 7
+            if month == 12:
+                days_in_month = 31
+            else:
+                days_in_month = (date(year, month + 1, 1) - first).days
+
+            while day > days_in_month:
+                day -= 7
+
+            ordinal = first.toordinal() + day - 1
+        elif rule[0] == 'J':
+            # 1 <= n <= 365, February 29th is never counted
+            day = rule[1]
+            ordinal = date(year, 1, 1).toordinal() + day - 1
+            if day >= 60 and (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+                ordinal += 1
+        else:
+            # 0 <= n <= 365, February 29th is counted
+            ordinal = date(year, 1, 1).toordinal() + rule[1]
+
+        return (ordinal - _EPOCH_ORDINAL) * 86400 + time
+
+    def __repr__(self):
+        return '<PosixRule [{}, {}]>'.format(self._std, self._dst)
@@ -1,49 +1,243 @@
 # -*- coding: utf-8 -*-
 
-from datetime import datetime, tzinfo
+from datetime import datetime, timedelta, tzinfo
 from bisect import bisect_right
+from collections import OrderedDict
+from threading import local
+from array import array
+from timeit import default_timer
 
 from .loader import Loader
+from .cache import TimezoneCache
 from .timezone_info import TimezoneInfo, UTC
-from ..helpers import local_time as _local_time
+from .. import _compat
+from ..helpers import (
+    normalize as _normalize,
+    find_utc_index as _find_utc_index,
+    POST_TRANSITION as _POST_TRANSITION,
+    PRE_TRANSITION as _PRE_TRANSITION,
+    TRANSITION_ERROR as _TRANSITION_ERROR,
+    NON_EXISTING_TIME as _NON_EXISTING_TIME
+)
+from .transition import Transition
 from .transition_type import TransitionType
+from .posix_rule import PosixRule
+from . import batch as _batch
 from .exceptions import NonExistingTime, AmbiguousTime
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _unix_time(dt):
+    """
+    Returns the unix time, in whole seconds, of a naive datetime.
+
+    :type dt: datetime
+
+    :rtype: int
+    """
+    delta = dt - _EPOCH
+
+    return delta.days * 86400 + delta.seconds
+
+
+class _LookupHints(local):
+    """
+    Last local transition lookup, kept per thread
+    so that threads sharing a timezone do not overwrite each other's.
+    """
+
+    def __init__(self):
+        # (unix time, transition index) of the last local lookup
+        self.local = None
+
+        # Running totals of the lookups of this thread
+        self.hits = 0
+        self.narrowed = 0
+        self.misses = 0
+
+
 class Timezone(tzinfo):
     """
     Represents a named timezone.
 
     It inherits from tzinfo in order to be passed to astimezone().
+
+    The transitions are stored as parallel columns of integers
+    (UTC unix times, local unix times before and after each transition
+    and transition type indexes). Transition objects
+    are only built on demand by the transitions property.
     """
 
-    _cache = {}
+    _cache = TimezoneCache()
+
+    # Maximum number of years for which
+    # the transitions generated from the POSIX rule are kept.
+    _RULE_TRANSITIONS_CACHE_SIZE = 64
+
+    # Size, in seconds, of the UTC time buckets indexing the transitions
+    # so that fromutc() does not need to search them.
+    # 16 days is less than the gap between almost all transitions.
+    _UTC_INDEX_BUCKET_SIZE = 16 * 86400
 
     PRE_TRANSITION = 'pre'
     POST_TRANSITION = 'post'
     TRANSITION_ERROR = 'error'
 
-    def __init__(self, name, transitions,
+    # Transition rules codes understood by the normalize() helper
+    _DST_RULES = {
+        PRE_TRANSITION: _PRE_TRANSITION,
+        POST_TRANSITION: _POST_TRANSITION,
+        TRANSITION_ERROR: _TRANSITION_ERROR,
+    }
+
+    def __init__(self, name, transition_times,
+                 pre_times, times,
+                 transition_type_indexes,
                  transition_types,
                  default_transition_type_index,
-                 utc_transition_times):
+                 posix_rule=None):
+        """
+        :param name: The name of the timezone.
+        :type name: str
+
+        :param transition_times: The UTC unix times of the transitions.
+        :type transition_times: array
+
+        :param pre_times: The local unix times before the transitions.
+        :type pre_times: array
+
+        :param times: The local unix times after the transitions.
+        :type times: array
+
+        :param transition_type_indexes: The transition type index
+                                        of each transition.
+        :type transition_type_indexes: array
+
+        :type transition_types: tuple of TransitionType
+
+        :type default_transition_type_index: int
+
+        :param posix_rule: The POSIX TZ rule to use
+                           after the last transition.
+        :type posix_rule: str or None
+        """
         self._name = name
-        self._transitions = transitions
+        self._transition_times = transition_times
+        self._pre_times = pre_times
+        self._times = times
+        self._transition_type_indexes = transition_type_indexes
+
+        # Only rules with daylight saving time have transitions
+        # to generate, otherwise the last transition type stays in effect.
+        self._rule = None
+        self._rule_type_indexes = None
+        self._rule_transitions = OrderedDict()
+        if posix_rule:
+            rule = PosixRule.parse(posix_rule)
+
+            if rule.has_dst:
+                self._rule = rule
+                self._rule_type_indexes = tuple()
+                for transition_type in (rule.std, rule.dst):
+                    index, transition_types = self._get_transition_type_index(
+                        transition_types, transition_type
+                    )
+                    self._rule_type_indexes += (index,)
+
         self._transition_types = transition_types
+        self._utc_offsets = array('i', [tt.utc_offset for tt in transition_types])
         self._tzinfos = tuple(
             map(lambda tt: TimezoneInfo(self, tt), transition_types)
         )
         self._default_transition_type_index = default_transition_type_index
-        self._utc_transition_times = utc_transition_times
-        self._local_hint = {}
+        self._hints = _LookupHints()
+
+        # Built on first use by _find_utc_index()
+        self._utc_index = None
+
+    @staticmethod
+    def _get_transition_type_index(transition_types, transition_type):
+        """
+        Returns the index of the given transition type,
+        adding it to the transition types if necessary.
+
+        :type transition_types: tuple
+
+        :type transition_type: TransitionType
+
+        :rtype: tuple
+        """
+        key = (transition_type.utc_offset,
+               transition_type.is_dst,
+               transition_type.abbrev)
+        for i, tt in enumerate(transition_types):
+            if (tt.utc_offset, tt.is_dst, tt.abbrev) == key:
+                return i, transition_types
+
+        transition_types = tuple(transition_types) + (transition_type,)
+
+        return len(transition_types) - 1, transition_types
 
     @property
     def name(self):
         return self._name
 
+    @property
+    def hint_stats(self):
+        """
+        The number of local transition lookups of the current thread
+        in this timezone, since its first lookup:
+
+        * hits: the same local second as the previous lookup,
+          answered without any search.
+        * narrowed: a search restricted to the transitions
+          before or after the previous lookup.
+        * misses: a search of all the transitions,
+          for the first lookup of the thread.
+
+        Lookups after the last transition, which use the POSIX rule,
+        are not counted.
+
+        :rtype: dict
+        """
+        hints = self._hints
+
+        return {
+            'hits': hints.hits,
+            'narrowed': hints.narrowed,
+            'misses': hints.misses
+        }
+
     @property
     def transitions(self):
-        return self._transitions
+        return tuple(
+            self._get_transition(i)
+            for i in range(len(self._transition_times))
+        )
+
+    def _get_transition(self, index):
+        """
+        Builds the Transition at the given index.
+
+        :type index: int
+
+        :rtype: Transition
+        """
+        transition_type_index = self._transition_type_indexes[index]
+        if index == 0:
+            pre_transition_type_index = transition_type_index
+        else:
+            pre_transition_type_index = self._transition_type_indexes[index - 1]
+
+        return Transition(
+            self._transition_times[index],
+            transition_type_index,
+            _EPOCH + timedelta(seconds=self._pre_times[index]),
+            _EPOCH + timedelta(seconds=self._times[index]),
+            pre_transition_type_index
+        )
 
     @classmethod
     def load(cls, name):
@@ -60,21 +254,14 @@ class Timezone(tzinfo):
         if name.upper() == 'UTC':
             return UTCTimezone
 
-        if name not in cls._cache:
-            (transitions,
-             transition_types,
-             default_transition_type_index,
-             utc_transition_times) = Loader.load(name)
-
-            zone = cls(name,
-                       transitions,
-                       transition_types,
-                       default_transition_type_index,
-                       utc_transition_times)
+        zone = cls._cache.get(name)
+        if zone is None:
+            start = default_timer()
+            zone = cls(name, *Loader.load(name))
 
-            cls._cache[name] = zone
+            cls._cache.add(name, zone, default_timer() - start)
 
-        return cls._cache[name]
+        return zone
 
     def convert(self, dt, dst_rule=POST_TRANSITION):
         """
@@ -97,6 +284,59 @@ class Timezone(tzinfo):
 
         return dt.__class__(*converted)
 
+    def convert_many(self, epochs, unit='s'):
+        """
+        Converts UTC unix times to local time.
+
+        It returns, by name, arrays of the local year, month, day,
+        hour, minute, second, microsecond, offset to UTC (in seconds)
+        and daylight saving time flag.
+
+        The arrays are NumPy arrays if NumPy is installed.
+
+        :param epochs: The UTC unix times.
+        :type epochs: numpy.ndarray or array or iterable
+
+        :param unit: The unit of the unix times:
+                     s (seconds), ms (milliseconds)
+                     or us (microseconds).
+        :type unit: str
+
+        :rtype: dict
+        """
+        return _batch.convert_many(self, epochs, unit)
+
+    def localize_many(self, epochs, dst_rule=POST_TRANSITION, unit='s'):
+        """
+        Converts naive local times, expressed as unix times,
+        to UTC unix times.
+
+        Skipped and repeated times are handled according to dst_rule,
+        like convert() does for naive datetimes.
+
+        It returns the UTC unix times, in the same unit,
+        and arrays of flags telling whether each time is ambiguous
+        (repeated) and whether it does not exist (skipped).
+
+        The arrays are NumPy arrays if NumPy is installed.
+
+        :param epochs: The local unix times.
+        :type epochs: numpy.ndarray or array or iterable
+
+        :param dst_rule: The transition rule.
+        :type dst_rule: str
+
+        :param unit: The unit of the unix times:
+                     s (seconds), ms (milliseconds)
+                     or us (microseconds).
+        :type unit: str
+
+        :rtype: tuple
+        """
+        return _batch.localize_many(
+            self, epochs, self._DST_RULES[dst_rule], unit
+        )
+
     def _normalize(self, dt, dst_rule=POST_TRANSITION):
         # if tzinfo is set, something wrong happened
         if dt.tzinfo is not None:
@@ -105,101 +345,66 @@ class Timezone(tzinfo):
                 'Use _convert() instead.'
             )
 
-        if not self._transitions:
-            # Use the default offset
-            offset = self._tzinfos[self._default_transition_type_index].offset
-            unix_time = (dt - datetime(1970, 1, 1)).total_seconds() - offset
-
-            return self._to_local_time(
-                unix_time, self._default_transition_type_index
-            )
-
-        # Find the first transition after our target date/time
-        begin = self._transitions[0]
-        end = self._transitions[-1]
-
-        if dt < begin.time:
-            tr = begin
-        elif not dt < end.time:
-            tr = end
+        # The local time is handled as an integer unix time
+        # and its microseconds.
+        sec = _unix_time(dt)
+        microsecond = dt.microsecond
+
+        times = self._times
+        if self._rule is not None and (not times or sec >= times[-1]):
+            # After the last transition,
+            # the transitions are given by the POSIX rule.
+            (_, pre_times,
+             times, transition_type_indexes) = self._get_rule_transitions(dt.year)
+            hints = hint = None
+            lo, hi = 0, len(times)
         else:
-            idx = self._find_transition_index(dt)
-            tr = self._transitions[idx]
-
-            if idx > 0:
-                pre_tr = self._transitions[idx - 1]
+            pre_times = self._pre_times
+            transition_type_indexes = self._transition_type_indexes
+
+            # Restrict the search of the transition
+            # with the last lookup of this thread.
+            hints = self._hints
+            hint = hints.local
+            lo, hi = 0, len(times)
+            if hint is not None:
+                if sec == hint[0]:
+                    lo = hi = hint[1]
+                elif sec < hint[0]:
+                    hi = hint[1]
+                else:
+                    lo = hint[1]
+
+        (year, month, day,
+         hour, minute, second,
+         transition_type_index, error, idx) = _normalize(
+            sec, microsecond,
+            pre_times, times, transition_type_indexes,
+            self._utc_offsets, self._default_transition_type_index,
+            self._DST_RULES[dst_rule], lo, hi
+        )
 
-                # DST -> No DST
-                if dt <= pre_tr.pre_time:
-                    tr = pre_tr
+        if error:
+            if error == _NON_EXISTING_TIME:
+                raise NonExistingTime(dt)
 
-        transition_type_index = tr._transition_type_index
-        if tr is begin:
-            if not tr.pre_time < dt:
-                # Before first transition, so use the default offset.
-                offset = self._tzinfos[self._default_transition_type_index].offset
-                unix_time = (dt - datetime(1970, 1, 1)).total_seconds() - offset
+            raise AmbiguousTime(dt)
 
-                return self._to_local_time(
-                    unix_time, self._default_transition_type_index
-                )
-            else:
-                # tr.pre_time < dt < tr.time
-                # Skipped time
-                if dst_rule == self.TRANSITION_ERROR:
-                    raise NonExistingTime(dt)
-                elif dst_rule == self.PRE_TRANSITION:
-                    # We do not apply the transition
-                    (unix_time,
-                     transition_type_index) = self._get_previous_transition_time(tr, dt)
-                else:
-                    unix_time = tr.unix_time - (tr.pre_time - dt).total_seconds()
-        elif tr is end:
-            if tr.pre_time < dt:
-                # After the last transition.
-                unix_time = tr.unix_time + (dt - tr.time).total_seconds()
-            else:
-                # tr.time <= dt <= tr.pre_time
-                # Repeated time
-                if dst_rule == self.TRANSITION_ERROR:
-                    raise AmbiguousTime(dt)
-                elif dst_rule == self.PRE_TRANSITION:
-                    # We do not apply the transition
-                    (unix_time,
-                     transition_type_index) = self._get_previous_transition_time(tr, dt)
-                else:
-                    unix_time = tr.unix_time + (dt - tr.time).total_seconds()
-        else:
-            if tr.pre_time <= dt < tr.time:
-                # tr.pre_time <= dt < tr.time
-                # Skipped time
-                if dst_rule == self.TRANSITION_ERROR:
-                    raise NonExistingTime(dt)
-                elif dst_rule == self.PRE_TRANSITION:
-                    # We do not apply the transition
-                    (unix_time,
-                     transition_type_index) = self._get_previous_transition_time(tr, dt)
-                else:
-                    unix_time = tr.unix_time - (tr.pre_time - dt).total_seconds()
-            elif tr.time <= dt <= tr.pre_time:
-                # tr.time <= dt <= tr.pre_time
-                # Repeated time
-                if dst_rule == self.TRANSITION_ERROR:
-                    raise AmbiguousTime(dt)
-                elif dst_rule == self.PRE_TRANSITION:
-                    # We do not apply the transition
-                    (unix_time,
-                     transition_type_index) = self._get_previous_transition_time(tr, dt)
-                else:
-                    unix_time = tr.unix_time + (dt - tr.time).total_seconds()
+        if idx >= 0 and hints is not None:
+            if hint is None:
+                hints.misses += 1
+            elif sec == hint[0]:
+                hints.hits += 1
             else:
-                # In between transitions
-                # The actual transition type is the previous transition one
+                hints.narrowed += 1
 
-                (unix_time,
-                 transition_type_index) = self._get_previous_transition_time(tr, dt)
+            hints.local = (sec, idx)
 
-        return self._to_local_time(unix_time, transition_type_index)
+        return (
+            year, month, day,
+            hour, minute, second, microsecond,
+            self._tzinfos[transition_type_index]
+        )
 
     def _convert(self, dt):
         """
@@ -217,16 +422,6 @@ class Timezone(tzinfo):
 
         return dt.astimezone(self)
 
-    def _to_local_time(self, unix_time, transition_type_index):
-        tzinfo = self._tzinfos[transition_type_index]
-
-        local_time = _local_time(
-            unix_time,
-            tzinfo.offset
-        )
-
-        return local_time + (tzinfo,)
-
     def _get_timestamp(self, dt):
         if hasattr(dt, 'float_timestamp'):
             return dt.float_timestamp
@@ -238,38 +433,107 @@ class Timezone(tzinfo):
 
         return t
 
-    def _find_transition_index(self, dt, prop='_time'):
-        lo, hi = 0, len(self._transitions)
-        hint = self._local_hint.get(prop)
-        if hint:
-            if dt == hint[0]:
-                return hint[1]
-            elif dt < hint[0]:
-                hi = hint[1]
-            else:
-                lo = hint[1]
+    def _get_rule_transitions(self, year):
+        """
+        Returns the transitions surrounding the given year
+        generated from the POSIX rule, preceded by the last two
+        explicit transitions.
 
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if dt < getattr(self._transitions[mid], prop):
-                hi = mid
-            else:
-                lo = mid + 1
+        The transitions are generated lazily
+        and kept in a bounded cache.
+
+        :type year: int
 
-        self._local_hint[prop] = (dt, lo)
+        :rtype: tuple
+        """
+        transitions = self._rule_transitions.get(year)
+        if transitions is not None:
+            return transitions
+
+        transitions = self._build_transition_table(year - 1, year + 1, 2)
+
+        if len(self._rule_transitions) >= self._RULE_TRANSITIONS_CACHE_SIZE:
+            self._rule_transitions.popitem(last=False)
+
+        self._rule_transitions[year] = transitions
+
+        return transitions
+
+    def _get_transition_table(self, first_year, last_year):
+        """
+        Returns every transition up to the given year:
+        the explicit transitions followed,
+        if the timezone has a POSIX rule, by the transitions
+        it generates between the given years.
+
+        :type first_year: int
+
+        :type last_year: int
+
+        :rtype: tuple
+        """
+        if self._rule is None:
+            return (
+                self._transition_times, self._pre_times,
+                self._times, self._transition_type_indexes
+            )
+
+        if self._transition_times:
+            # The rule only applies after the last explicit transition
+            last_transition = _EPOCH + timedelta(seconds=self._transition_times[-1])
+            first_year = max(first_year, last_transition.year)
+
+        return self._build_transition_table(first_year, last_year)
+
+    def _build_transition_table(self, first_year, last_year, count=None):
+        """
+        Builds the transition columns made of the last count
+        (all if None) explicit transitions followed by the transitions
+        generated from the POSIX rule between the given years.
 
-        return lo
+        :type first_year: int
 
-    def _get_previous_transition_time(self, tr, dt):
-        diff = (dt - tr.pre_time).total_seconds()
-        if -1 < diff < 0 and tr.unix_time < 0:
-            diff -= 1
+        :type last_year: int
 
-        unix_time = tr.unix_time + diff
+        :type count: int or None
 
-        transition_type_index = tr.pre_transition_type_index
+        :rtype: tuple
+        """
+        start = 0 if count is None else -count
+        transition_times = list(self._transition_times[start:])
+        pre_times = list(self._pre_times[start:])
+        times = list(self._times[start:])
+        transition_type_indexes = list(self._transition_type_indexes[start:])
+
+        std_index, dst_index = self._rule_type_indexes
+        for y in range(max(1, first_year), min(9999, last_year) + 1):
+            for unix_time, is_dst in self._rule.transitions(y):
+                if transition_times and unix_time <= transition_times[-1]:
+                    continue
+
+                transition_type_index = dst_index if is_dst else std_index
+                if transition_type_indexes:
+                    pre_transition_type_index = transition_type_indexes[-1]
+                else:
+                    pre_transition_type_index = std_index if is_dst else dst_index
 
-        return unix_time, transition_type_index
+                transition_times.append(unix_time)
+                pre_times.append(
+                    unix_time
+                    + self._transition_types[pre_transition_type_index].utc_offset
+                )
+                times.append(
+                    unix_time
+                    + self._transition_types[transition_type_index].utc_offset
+                )
+                transition_type_indexes.append(transition_type_index)
+
+        return (
+            array(_compat.INT64_TYPECODE, transition_times),
+            array(_compat.INT64_TYPECODE, pre_times),
+            array(_compat.INT64_TYPECODE, times),
+            array('B', transition_type_indexes)
+        )
 
     def tzname(self, dt):
         return self.abbrev
@@ -296,29 +560,87 @@ class Timezone(tzinfo):
 
     def fromutc(self, dt):
         dt = dt.replace(tzinfo=None)
-
-        idx = self._find_utc_index(dt)
-        tr = self._transitions[idx]
-        tzinfo = self._tzinfos[tr._transition_type_index]
+        tzinfo = self._get_utc_tzinfo(dt)
 
         return (dt + tzinfo.adjusted_offset).replace(tzinfo=tzinfo)
 
-    def _find_utc_index(self, dt):
-        lo, hi = 0, len(self._utc_transition_times)
-        hint = self._local_hint.get('_utc')
-        if hint:
-            if dt == hint[0]:
-                return hint[1]
-            elif dt < hint[0]:
-                hi = hint[1] + 1
-            else:
-                lo = hint[1]
+    def _get_utc_tzinfo(self, dt):
+        """
+        Returns the TimezoneInfo in effect at a naive UTC datetime.
+
+        :type dt: datetime
+
+        :rtype: TimezoneInfo
+        """
+        unix_time = _unix_time(dt)
+
+        transition_times = self._transition_times
+        if self._rule is not None and (not transition_times
+                                       or unix_time >= transition_times[-1]):
+            # After the last transition,
+            # the transitions are given by the POSIX rule.
+            (transition_times, _, _,
+             transition_type_indexes) = self._get_rule_transitions(dt.year)
+            utc_index = None
+        else:
+            transition_type_indexes = self._transition_type_indexes
+            utc_index = self._utc_index
+            if utc_index is None and transition_times:
+                utc_index = self._build_utc_index()
+
+        idx = _find_utc_index(
+            unix_time, transition_times, utc_index, self._UTC_INDEX_BUCKET_SIZE
+        ) - 1
+
+        if idx < 0:
+            # Before the first transition, so use the default type.
+            transition_type_index = self._default_transition_type_index
+        else:
+            transition_type_index = transition_type_indexes[idx]
+
+        return self._tzinfos[transition_type_index]
+
+    def _find_utc_index(self, unix_time):
+        """
+        Returns the index of the first transition
+        after the given UTC unix time.
+
+        :type unix_time: int
 
-        idx = max(0, bisect_right(self._utc_transition_times, dt, lo, hi) - 1)
+        :rtype: int
+        """
+        transition_times = self._transition_times
 
-        self._local_hint['_utc'] = (dt, idx)
+        utc_index = self._utc_index
+        if utc_index is None and transition_times:
+            utc_index = self._build_utc_index()
 
-        return idx
+        return _find_utc_index(
+            unix_time, transition_times, utc_index, self._UTC_INDEX_BUCKET_SIZE
+        )
+
+    def _build_utc_index(self):
+        """
+        Builds the index mapping fixed-size buckets of UTC time
+        to the first transition after the start of each bucket.
+
+        :rtype: array
+        """
+        transition_times = self._transition_times
+        first = transition_times[0]
+        size = self._UTC_INDEX_BUCKET_SIZE
+        count = (transition_times[-1] - first) // size + 1
+
+        utc_index = array('H')
+        idx = 0
+        for bucket in range(count):
+            start = first + bucket * size
+            idx = bisect_right(transition_times, start, idx)
+            utc_index.append(idx)
+
+        self._utc_index = utc_index
+
+        return utc_index
 
     def __repr__(self):
         return '<Timezone [{}]>'.format(self._name)
@@ -345,13 +667,18 @@ class FixedTimezone(Timezone):
         if not transition_type:
             transition_type = TransitionType(int(offset), False, '')
 
-        super(FixedTimezone, self).__init__(name, [], [], 0, (datetime(1970, 1, 1),))
+        super(FixedTimezone, self).__init__(
+            name, (), (), (), (), (transition_type,), 0
+        )
 
-        self._tzinfos = (TimezoneInfo(self, transition_type),)
         self._tzinfo = self._tzinfos[0]
 
     def _normalize(self, dt, dst_rule=Timezone.POST_TRANSITION):
-        return dt.replace(tzinfo=self._tzinfo)
+        return (
+            dt.year, dt.month, dt.day,
+            dt.hour, dt.minute, dt.second, dt.microsecond,
+            self._tzinfo
+        )
 
     def utcoffset(self, dt):
         if dt is None:
@@ -370,6 +697,34 @@ class FixedTimezone(Timezone):
 
         return (dt + self._tzinfo.adjusted_offset).replace(tzinfo=self._tzinfo)
 
+    def _get_utc_tzinfo(self, dt):
+        return self._tzinfo
+
+
+# Interned fixed timezones, by offset
+_fixed_timezones = {}
+
+
+def fixed_timezone(offset):
+    """
+    Returns the fixed timezone with the given offset.
+
+    The instances are interned so that equal offsets
+    always share the same timezone.
+
+    :param offset: offset to UTC in seconds.
+    :type offset: int or float
+
+    :rtype: FixedTimezone
+    """
+    offset = int(offset)
+
+    tz = _fixed_timezones.get(offset)
+    if tz is None:
+        tz = _fixed_timezones.setdefault(offset, FixedTimezone(offset))
+
+    return tz
+
 
 class _UTC(FixedTimezone):
 
@@ -381,4 +736,7 @@ class _UTC(FixedTimezone):
     def fromutc(self, dt):
         return dt.replace(tzinfo=UTC)
 
+    def _get_utc_tzinfo(self, dt):
+        return UTC
+
 UTCTimezone = _UTC()
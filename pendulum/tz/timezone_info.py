@@ -75,12 +75,7 @@ class TimezoneInfo(tzinfo):
         return offset
 
     def fromutc(self, dt):
-        dt = dt.replace(tzinfo=None)
-
-        idx = max(0, self._tz._find_transition_index(dt, '_utc_time') - 1)
-        tzinfo = self._tz._tzinfos[self._tz._transitions[idx]._transition_type_index]
-
-        return (dt + tzinfo.adjusted_offset).replace(tzinfo=tzinfo)
+        return self._tz.fromutc(dt)
 
     def __repr__(self):
         return '<TimezoneInfo [{}, {}, {}]>'.format(
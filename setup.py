@@ -85,6 +85,9 @@ kwargs = dict(
         'pytz',
         'python-dateutil',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     include_package_data=True,
     tests_require=['pytest'],
     test_suite='nose.collector',
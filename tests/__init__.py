@@ -4,7 +4,7 @@ from unittest import TestCase
 from contextlib import contextmanager
 
 from pendulum import Pendulum, Interval
-from pendulum.tz import LocalTimezone, timezone, Timezone
+from pendulum.tz import LocalTimezone, timezone, Timezone, batch
 
 
 class AbstractTestCase(TestCase):
@@ -19,6 +19,7 @@ class AbstractTestCase(TestCase):
         Pendulum.reset_to_string_format()
         Pendulum.set_transition_rule(Timezone.POST_TRANSITION)
         Pendulum.set_formatter()
+        Pendulum.set_clock()
 
     def assertPendulum(self, d, year, month, day,
                        hour=None, minute=None, second=None, microsecond=None):
@@ -79,3 +80,30 @@ class AbstractTestCase(TestCase):
         yield
 
         Pendulum.set_test_now()
+
+
+class AbstractBatchTestCase(AbstractTestCase):
+    """
+    Base class of the tests of the batch conversions,
+    which have a NumPy and a pure-Python implementation.
+    """
+
+    def setUp(self):
+        super(AbstractBatchTestCase, self).setUp()
+
+        self.np = batch.np
+
+    def tearDown(self):
+        batch.np = self.np
+
+        super(AbstractBatchTestCase, self).tearDown()
+
+    def implementations(self):
+        """
+        Switches to each batch implementation in turn:
+        with NumPy, if installed, then without it.
+        """
+        for np in (self.np, None) if self.np is not None else (None,):
+            batch.np = np
+
+            yield np
@@ -226,3 +226,90 @@ class ClassicFormatterTest(AbstractTestCase):
         d = Pendulum(2016, 8, 28, 7, 3, 6, 123456)
 
         self.assertEqual('J', f.format(d, 'J'))
+
+    def test_parse(self):
+        f = AlternativeFormatter()
+
+        parsed = f.parse('2016-08-28 07:03:06.123456 +02:00', 'YYYY-MM-DD HH:mm:ss.SSSSSS ZZ')
+        self.assertEqual(
+            (2016, 8, 28, 7, 3, 6, 123456, 7200),
+            tuple(parsed[field] for field in
+                  ('year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond', 'offset'))
+        )
+        self.assertIsNone(parsed['tz'])
+        self.assertIsNone(parsed['timestamp'])
+        self.assertIsNone(parsed['day_of_year'])
+
+    def test_parse_two_digit_year(self):
+        f = AlternativeFormatter()
+
+        self.assertEqual(2068, f.parse('68', 'YY')['year'])
+        self.assertEqual(1969, f.parse('69', 'YY')['year'])
+
+    def test_parse_fractional_seconds(self):
+        f = AlternativeFormatter()
+
+        self.assertEqual(100000, f.parse('1', 'S')['microsecond'])
+        self.assertEqual(123000, f.parse('123', 'SSS')['microsecond'])
+        self.assertEqual(123456, f.parse('123456789', 'SSSSSSSSS')['microsecond'])
+
+    def test_parse_localized_tokens(self):
+        f = AlternativeFormatter()
+
+        parsed = f.parse('28 août 2016', 'D MMMM YYYY', locale='fr')
+        self.assertEqual(8, parsed['month'])
+
+        parsed = f.parse('28 AOÛT 2016', 'D MMMM YYYY', locale='fr')
+        self.assertEqual(8, parsed['month'])
+
+        parsed = f.parse('Sunday, August 28th', 'dddd, MMMM Do', locale='dummy')
+        self.assertEqual(8, parsed['month'])
+        self.assertEqual(28, parsed['day'])
+
+    def test_parse_unicode_strings(self):
+        f = AlternativeFormatter()
+
+        parsed = f.parse(u'28 août 2016', u'D MMMM YYYY', locale='fr')
+        self.assertEqual(8, parsed['month'])
+
+        parsed = f.parse(u'28 AOÛT 2016', 'D MMMM YYYY', locale='fr')
+        self.assertEqual(8, parsed['month'])
+
+        self.assertRaises(ValueError, f.parse, u'28 aoûtt 2016', 'D MMMM YYYY', locale='fr')
+
+    def test_parse_date_formats(self):
+        f = AlternativeFormatter()
+
+        parsed = f.parse('dimanche 28 août 2016 07:03', 'LLLL', locale='fr')
+        self.assertEqual(
+            (2016, 8, 28, 7, 3),
+            tuple(parsed[field] for field in ('year', 'month', 'day', 'hour', 'minute'))
+        )
+
+        parsed = f.parse('Sunday, August 28, 2016 7:03 PM', 'LLLL', locale='dummy')
+        self.assertEqual(19, parsed['hour'])
+
+    def test_parse_caches_compiled_formats(self):
+        f = AlternativeFormatter()
+
+        f.parse('2016-08-28', 'YYYY-MM-DD')
+        pattern = list(f._patterns.values())[0]
+
+        f.parse('2017-09-29', 'YYYY-MM-DD')
+        self.assertEqual(1, len(f._patterns))
+        self.assertIs(pattern, list(f._patterns.values())[0])
+
+    def test_parse_cache_is_bounded(self):
+        f = AlternativeFormatter()
+
+        for i in range(f._PATTERNS_CACHE_SIZE + 10):
+            f.parse('2016 {}'.format(i), 'YYYY [{}]'.format(i))
+
+        self.assertEqual(f._PATTERNS_CACHE_SIZE, len(f._patterns))
+        self.assertNotIn('YYYY [0]', [key[0] for key in f._patterns])
+
+    def test_parse_not_matching(self):
+        f = AlternativeFormatter()
+
+        self.assertRaises(ValueError, f.parse, '2016-08-28', 'YYYY-MM')
+        self.assertRaises(ValueError, f.parse, '2016-08-28\n', 'YYYY-MM-DD')
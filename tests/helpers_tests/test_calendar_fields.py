@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import calendar
+from datetime import date, timedelta
+
+from pendulum._extensions import helpers
+from .. import AbstractTestCase
+
+try:
+    from pendulum._extensions import _helpers
+except ImportError:
+    _helpers = None
+
+
+class CalendarFieldsTest(AbstractTestCase):
+
+    def _dates(self):
+        for year in (1, 4, 100, 400, 1900, 2000, 2004, 2015, 2016, 2020, 9999):
+            d = date(year, 1, 1)
+            while d.year == year:
+                yield d
+
+                if d == date.max:
+                    break
+
+                d += timedelta(days=1)
+
+    def _expected(self, d):
+        return (
+            d.isoweekday() % 7,
+            d.timetuple().tm_yday,
+            d.isocalendar()[1],
+            calendar.monthrange(d.year, d.month)[1],
+            (d.month - 1) // 3 + 1
+        )
+
+    def test_calendar_fields(self):
+        for d in self._dates():
+            self.assertEqual(
+                self._expected(d),
+                helpers.calendar_fields(d.year, d.month, d.day)
+            )
+
+    def test_days_in_month(self):
+        for year in (1900, 2000, 2015, 2016):
+            for month in range(1, 13):
+                self.assertEqual(
+                    calendar.monthrange(year, month)[1],
+                    helpers.days_in_month(year, month)
+                )
+
+    def test_is_long_year(self):
+        for year in range(1, 2100):
+            self.assertEqual(
+                date(year, 12, 28).isocalendar()[1] == 53,
+                helpers.is_long_year(year)
+            )
+
+    def test_c_calendar_fields_matches_python_calendar_fields(self):
+        if _helpers is None:
+            self.skipTest('The C extension is not built')
+
+        for d in self._dates():
+            self.assertEqual(
+                helpers.calendar_fields(d.year, d.month, d.day),
+                _helpers.calendar_fields(d.year, d.month, d.day)
+            )
+
+        for year in range(1, 2100):
+            self.assertEqual(
+                helpers.is_long_year(year),
+                _helpers.is_long_year(year)
+            )
+
+            for month in range(1, 13):
+                self.assertEqual(
+                    helpers.days_in_month(year, month),
+                    _helpers.days_in_month(year, month)
+                )
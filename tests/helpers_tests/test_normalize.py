@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+
+from pendulum.tz import timezone
+from pendulum.tz.timezone import _unix_time
+from pendulum._extensions import helpers
+from pendulum._compat import PY2
+from .. import AbstractTestCase
+
+try:
+    from pendulum._extensions import _helpers
+except ImportError:
+    _helpers = None
+
+
+class NormalizeTest(AbstractTestCase):
+
+    def _normalize(self, module, tz, dt, dst_rule):
+        return module.normalize(
+            _unix_time(dt), dt.microsecond,
+            tz._pre_times, tz._times, tz._transition_type_indexes,
+            tz._utc_offsets, tz._default_transition_type_index,
+            dst_rule, 0, len(tz._times)
+        )
+
+    def test_normalize(self):
+        tz = timezone('Europe/Paris')
+
+        self.assertEqual(
+            (2016, 3, 27, 3, 30, 0),
+            self._normalize(helpers, tz, datetime(2016, 3, 27, 2, 30), helpers.POST_TRANSITION)[:6]
+        )
+        self.assertEqual(
+            (2016, 3, 27, 2, 30, 0),
+            self._normalize(helpers, tz, datetime(2016, 3, 27, 2, 30), helpers.PRE_TRANSITION)[:6]
+        )
+        self.assertEqual(
+            helpers.NON_EXISTING_TIME,
+            self._normalize(helpers, tz, datetime(2016, 3, 27, 2, 30), helpers.TRANSITION_ERROR)[7]
+        )
+        self.assertEqual(
+            helpers.AMBIGUOUS_TIME,
+            self._normalize(helpers, tz, datetime(2016, 10, 30, 2, 30), helpers.TRANSITION_ERROR)[7]
+        )
+
+    def test_c_normalize_matches_python_normalize(self):
+        if _helpers is None:
+            self.skipTest('The C extension is not built')
+
+        if PY2:
+            self.skipTest('The C extension is not used on Python 2')
+
+        tz = timezone('Europe/Paris')
+        dts = [
+            datetime(1800, 1, 1),
+            datetime(2016, 3, 27, 2, 30),
+            datetime(2016, 3, 27, 3),
+            datetime(2016, 10, 30, 2, 30),
+            datetime(2016, 10, 30, 2, 59, 59, 999999),
+            datetime(2016, 10, 30, 3),
+            datetime(2016, 6, 1, 12),
+        ]
+
+        for dt in dts:
+            for dst_rule in (helpers.POST_TRANSITION,
+                             helpers.PRE_TRANSITION,
+                             helpers.TRANSITION_ERROR):
+                self.assertEqual(
+                    self._normalize(helpers, tz, dt, dst_rule),
+                    self._normalize(_helpers, tz, dt, dst_rule)
+                )
+
+    def test_c_find_utc_index_matches_python_find_utc_index(self):
+        if _helpers is None:
+            self.skipTest('The C extension is not built')
+
+        if PY2:
+            self.skipTest('The C extension is not used on Python 2')
+
+        tz = timezone('Europe/Paris')
+        transition_times = tz._transition_times
+        utc_index = tz._build_utc_index()
+
+        for unix_time in transition_times:
+            for t in (unix_time - 1, unix_time, unix_time + 1):
+                self.assertEqual(
+                    helpers.find_utc_index(t, transition_times, utc_index, tz._UTC_INDEX_BUCKET_SIZE),
+                    _helpers.find_utc_index(t, transition_times, utc_index, tz._UTC_INDEX_BUCKET_SIZE)
+                )
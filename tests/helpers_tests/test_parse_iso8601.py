@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from pendulum._extensions import helpers
+from .. import AbstractTestCase
+
+try:
+    from pendulum._extensions import _helpers
+except ImportError:
+    _helpers = None
+
+
+class ParseIso8601Test(AbstractTestCase):
+
+    VALID = {
+        '2016-04-15': (2016, 4, 15, 0, 0, 0, 0, None),
+        '20160415': (2016, 4, 15, 0, 0, 0, 0, None),
+        '2016-04-15T18:21': (2016, 4, 15, 18, 21, 0, 0, None),
+        '2016-04-15 18:21:08': (2016, 4, 15, 18, 21, 8, 0, None),
+        '2016-04-15T18:21:08.123': (2016, 4, 15, 18, 21, 8, 123000, None),
+        '2016-04-15T18:21:08,7454873': (2016, 4, 15, 18, 21, 8, 745487, None),
+        '2016-04-15T18:21:08Z': (2016, 4, 15, 18, 21, 8, 0, 0),
+        '2016-04-15t18:21:08z': (2016, 4, 15, 18, 21, 8, 0, 0),
+        '2016-04-15T18:21:08+05:30': (2016, 4, 15, 18, 21, 8, 0, 19800),
+        '2016-04-15T18:21:08-0030': (2016, 4, 15, 18, 21, 8, 0, -1800),
+        '2016-04-15T18:21+05': (2016, 4, 15, 18, 21, 0, 0, 18000),
+        '20160415T182108.5Z': (2016, 4, 15, 18, 21, 8, 500000, 0),
+    }
+
+    INVALID = [
+        '', '2016', '2016-04', '2016-0415', '2016-W15', '2016-105',
+        '2016-04-15T', '2016-04-15T18', '2016-04-15T1821:08',
+        '2016-04-15T18:21:08.', '2016-04-15T18:21:08+05:',
+        '2016-04-15T18:21:08+24:00', '2016-04-15Z', '2016-04-15\n',
+        'May 21 1975',
+    ]
+
+    def _modules(self):
+        modules = [helpers]
+        if _helpers is not None:
+            modules.append(_helpers)
+
+        return modules
+
+    def test_parse_iso8601(self):
+        for module in self._modules():
+            for text, expected in self.VALID.items():
+                self.assertEqual(expected, module.parse_iso8601(text))
+
+    def test_parse_iso8601_invalid(self):
+        for module in self._modules():
+            for text in self.INVALID:
+                self.assertIsNone(module.parse_iso8601(text))
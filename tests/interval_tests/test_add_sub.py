@@ -47,3 +47,19 @@ class AddSubTestCase(AbstractTestCase):
     def test_neg(self):
         p = Interval(days=23, seconds=32)
         self.assertInterval(-p, -3, -2, 0, 0, -32)
+
+    def test_add_is_exact(self):
+        p = Interval(days=100000, microseconds=1)
+
+        self.assertInterval(p + Interval(microseconds=1), 14285, 5, 0, 0, 0, 2)
+        self.assertInterval(p - Interval(microseconds=2), 14285, 4, 23, 59, 59, 999999)
+
+    def test_sum_is_exact(self):
+        p = sum([Interval(microseconds=100000)] * 1000, Interval())
+
+        self.assertEqual(Interval(seconds=100), p)
+        self.assertInterval(p, 0, 0, 0, 1, 40, 0)
+
+    def test_neg_microseconds(self):
+        p = Interval(days=1, microseconds=5)
+        self.assertInterval(-p, 0, -1, 0, 0, 0, -5)
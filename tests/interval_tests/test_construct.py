@@ -58,3 +58,10 @@ class ConstructTest(AbstractTestCase):
 
         pi = Interval(days=-1177, seconds=-7284, microseconds=-1000000)
         self.assertTrue(pi.invert)
+
+    def test_negative_fraction_of_second(self):
+        pi = Interval(seconds=-1.25)
+        self.assertInterval(pi, 0, 0, 0, 0, -1, -250000)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(Interval(days=1), '__dict__'))
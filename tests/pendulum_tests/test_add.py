@@ -30,6 +30,17 @@ class AddTest(AbstractTestCase):
     def test_add_month_with_overflow(self):
         self.assertEqual(2, Pendulum(2012, 1, 31).add(months=1).month)
 
+    def test_add_months_clamps_day(self):
+        self.assertPendulum(Pendulum(2012, 1, 31).add(months=1), 2012, 2, 29)
+        self.assertPendulum(Pendulum(2013, 1, 31).add(months=13), 2014, 2, 28)
+        self.assertPendulum(Pendulum(2012, 3, 31).add(months=-1), 2012, 2, 29)
+        self.assertPendulum(Pendulum(2012, 2, 29).add(years=1), 2013, 2, 28)
+
+    def test_add_non_integer_months(self):
+        self.assertRaises(ValueError, Pendulum(2012, 1, 31).add, months=1.5)
+        self.assertRaises(ValueError, Pendulum(2012, 1, 31).add, years=0.5)
+        self.assertPendulum(Pendulum(2012, 1, 31).add(years=1.0), 2013, 1, 31)
+
     def test_add_days_positive(self):
         self.assertEqual(1, Pendulum(1975, 5, 31).add(days=1).day)
 
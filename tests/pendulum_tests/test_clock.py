@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import pendulum
+from pendulum import Pendulum
+from pendulum.clock import Clock, PreciseClock, CoarseClock
+
+from .. import AbstractTestCase
+
+
+class FixedClock(Clock):
+
+    def __init__(self, unix_time):
+        self.unix_time = unix_time
+
+    def time(self):
+        return self.unix_time
+
+
+class FixedCoarseClock(CoarseClock):
+
+    def __init__(self, unix_time):
+        super(FixedCoarseClock, self).__init__()
+
+        self.unix_time = unix_time
+
+    def time(self):
+        return self.unix_time
+
+
+class ClockTest(AbstractTestCase):
+
+    def test_default_clock(self):
+        self.assertIsInstance(Pendulum.get_clock(), PreciseClock)
+
+    def test_set_clock(self):
+        pendulum.set_clock('coarse')
+        self.assertIsInstance(pendulum.get_clock(), CoarseClock)
+
+        pendulum.set_clock()
+        self.assertIsInstance(pendulum.get_clock(), PreciseClock)
+
+    def test_set_invalid_clock(self):
+        self.assertRaises(ValueError, pendulum.set_clock, 'foo')
+
+    def test_custom_clock(self):
+        # 2016-03-27 01:30:00.5 UTC
+        pendulum.set_clock(FixedClock(1459042200.5))
+
+        now = pendulum.now('Europe/Paris')
+        self.assertPendulum(now, 2016, 3, 27, 3, 30, 0, 500000)
+        self.assertEqual(7200, now.offset)
+
+        self.assertPendulum(pendulum.utcnow(), 2016, 3, 27, 1, 30, 0, 500000)
+        self.assertEqual('UTC', pendulum.utcnow().timezone_name)
+
+        now = pendulum.now()
+        self.assertPendulum(now, 2016, 3, 26, 21, 30, 0, 500000)
+        self.assertEqual('America/Toronto', now.timezone_name)
+
+        self.assertPendulum(pendulum.today('Europe/Paris'), 2016, 3, 27, 0, 0, 0, 0)
+        self.assertPendulum(pendulum.tomorrow('Europe/Paris'), 2016, 3, 28, 0, 0, 0, 0)
+        self.assertPendulum(pendulum.yesterday('Europe/Paris'), 2016, 3, 26, 0, 0, 0, 0)
+
+    def test_coarse_clock(self):
+        clock = FixedCoarseClock(1459042200.5)
+        pendulum.set_clock(clock)
+
+        now = pendulum.now('Europe/Paris')
+        self.assertPendulum(now, 2016, 3, 27, 3, 30, 0, 0)
+        self.assertIs(now, pendulum.now('Europe/Paris'))
+        self.assertIsNot(now, pendulum.now('America/Toronto'))
+
+        clock.unix_time += 0.4
+        self.assertIs(now, pendulum.now('Europe/Paris'))
+
+        clock.unix_time += 0.1
+        self.assertPendulum(pendulum.now('Europe/Paris'), 2016, 3, 27, 3, 30, 1, 0)
+
+    def test_coarse_clock_only_keeps_current_second(self):
+        clock = FixedCoarseClock(1459042200)
+        pendulum.set_clock(clock)
+
+        pendulum.now('Europe/Paris')
+        pendulum.now('America/Toronto')
+        self.assertEqual(2, len(clock._instances))
+
+        clock.unix_time += 1
+        pendulum.now('Europe/Paris')
+        self.assertEqual(1, len(clock._instances))
+
+    def test_test_now_takes_precedence_over_clock(self):
+        pendulum.set_clock(FixedClock(0))
+        known = Pendulum.create(2001, 5, 21, 12)
+
+        with pendulum.test(known):
+            self.assertEqual(known, pendulum.now())
+
+        self.assertPendulum(pendulum.utcnow(), 1970, 1, 1, 0, 0, 0, 0)
@@ -427,3 +427,35 @@ class ComparisonTest(AbstractTestCase):
 
         self.assertFalse(dt1 == 'test')
         self.assertFalse(dt1 in ['test'])
+
+    def test_comparison_across_timezones(self):
+        # 02:30+02:00 and 02:30+01:00
+        dt1 = Pendulum(2016, 10, 30, 0, 30, tzinfo='UTC').in_tz('Europe/Paris')
+        dt2 = dt1.add(hours=1)
+        dt3 = dt1.in_tz('America/Toronto')
+        dt4 = Pendulum(2016, 10, 30, 2, 30, tzinfo=1)
+
+        self.assertTrue(dt1 == dt3)
+        self.assertTrue(dt1 < dt2)
+        self.assertTrue(dt2 > dt3)
+        self.assertTrue(dt2 == dt4)
+        self.assertTrue(dt2 <= dt4)
+        self.assertTrue(dt2 >= dt4)
+        self.assertFalse(dt2 != dt4)
+        self.assertEqual([dt1, dt2], sorted([dt4, dt3]))
+
+    def test_comparison_with_sub_minute_offsets(self):
+        # Offset of 0:09:21, used as 0:09 like the native datetime does
+        dt1 = Pendulum(1900, 1, 1, tzinfo='Europe/Paris')
+        dt2 = Pendulum(1899, 12, 31, 23, 51, tzinfo='UTC')
+
+        self.assertEqual(dt1, dt2)
+        self.assertEqual(dt1._to_datetime(), dt2._to_datetime())
+
+    def test_hash_is_consistent_with_equality(self):
+        dt1 = Pendulum(2016, 8, 27, 12, 34, 56, 123456, 'Europe/Paris')
+        dt2 = dt1.in_tz('America/Toronto')
+
+        self.assertEqual(hash(dt1), hash(dt2))
+        self.assertEqual(hash(dt1), hash(dt1._to_datetime()))
+        self.assertEqual(1, len({dt1, dt2, dt1._to_datetime()}))
@@ -50,6 +50,14 @@ class ConstructTest(AbstractTestCase):
         self.assertEqual('-00:30', p.timezone_name)
         self.assertEqual(-1800, p.offset)
 
+    def test_parse_with_same_offset_shares_timezone(self):
+        p1 = Pendulum.parse('2016-04-15T18:21:08+02:00')
+        p2 = Pendulum.parse('2016-04-16T18:21:08+02:00')
+        p3 = Pendulum(2016, 4, 15, tzinfo=2)
+
+        self.assertIs(p1.tz, p2.tz)
+        self.assertIs(p1.tz, p3.tz)
+
     def test_setting_timezone(self):
         tz = 'Europe/London'
         dtz = timezone(tz)
@@ -93,6 +101,27 @@ class ConstructTest(AbstractTestCase):
     def test_parse_with_invalid_string(self):
         self.assertRaises(ValueError, Pendulum.parse, 'Invalid_string')
 
+    def test_parse_with_non_ascii_unicode_string(self):
+        self.assertRaises(ValueError, Pendulum.parse, u'2016-01-01T10:00:00é')
+
+    def test_parse_iso8601_basic_format(self):
+        p = Pendulum.parse('20160415T182108.5Z')
+        self.assertPendulum(p, 2016, 4, 15, 18, 21, 8, 500000)
+        self.assertEqual('+00:00', p.timezone_name)
+
+    def test_parse_iso8601_without_offset_uses_timezone(self):
+        p = Pendulum.parse('2016-04-15 18:21', 'Europe/Paris')
+        self.assertPendulum(p, 2016, 4, 15, 18, 21, 0)
+        self.assertEqual('Europe/Paris', p.timezone_name)
+
+    def test_parse_falls_back_on_dateutil(self):
+        p = Pendulum.parse('May 21 1975 22:32:05 +0100')
+        self.assertPendulum(p, 1975, 5, 21, 22, 32, 5)
+        self.assertEqual(3600, p.offset)
+
+    def test_parse_with_invalid_date(self):
+        self.assertRaises(ValueError, Pendulum.parse, '2016-02-30T18:21:08Z')
+
     def test_today(self):
         today = Pendulum.today()
         self.assertIsInstanceOfPendulum(today)
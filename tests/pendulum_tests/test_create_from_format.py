@@ -37,3 +37,112 @@ class CreateFromFormatTest(AbstractTestCase):
         self.assertPendulum(d, 1975, 5, 21, 22, 32, 11)
         self.assertIsInstanceOfPendulum(d)
         self.assertEqual('UTC', d.timezone_name)
+
+    def test_create_from_format_with_alternative_formatter(self):
+        d = Pendulum.create_from_format(
+            '1975-05-21 22:32:11.123', 'YYYY-MM-DD HH:mm:ss.SSS',
+            formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 11, 123000)
+        self.assertEqual('UTC', d.timezone_name)
+
+    def test_create_from_format_ignores_default_formatter(self):
+        Pendulum.set_formatter('alternative')
+
+        d = Pendulum.create_from_format('1975-05-21 22:32', '%Y-%m-%d %H:%M')
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 0)
+
+        d = Pendulum.strptime('1975-05-21', '%Y-%m-%d')
+        self.assertPendulum(d, 1975, 5, 21, 0, 0, 0)
+
+    def test_create_from_format_with_invalid_formatter(self):
+        self.assertRaises(
+            ValueError,
+            Pendulum.create_from_format, '1975', 'YYYY', formatter='invalid'
+        )
+
+    def test_create_from_format_with_localized_tokens(self):
+        d = Pendulum.create_from_format(
+            'Wednesday, May 21st 75 at 10:32 pm', 'dddd, MMMM Do YY [at] h:mm a',
+            formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 0)
+
+        d = Pendulum.create_from_format(
+            'mercredi 21 mai 1975 22:32', 'dddd D MMMM YYYY HH:mm',
+            locale='fr', formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 0)
+
+    def test_create_from_format_with_meridian(self):
+        for time, hour in [('12:30 AM', 0), ('1:30 am', 1),
+                           ('12:30 PM', 12), ('11:30 PM', 23)]:
+            d = Pendulum.create_from_format(
+                '1975-05-21 ' + time, 'YYYY-MM-DD h:mm A', formatter='alternative'
+            )
+            self.assertPendulum(d, 1975, 5, 21, hour, 30, 0)
+
+    def test_create_from_format_with_date_format_token(self):
+        d = Pendulum.create_from_format(
+            'May 21, 1975 10:32 PM', 'LLL', formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 0)
+
+    def test_create_from_format_with_offset(self):
+        d = Pendulum.create_from_format(
+            '1975-05-21 22:32:11-05:00', 'YYYY-MM-DD HH:mm:ssZ',
+            'Europe/London', formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 11)
+        self.assertEqual(-5 * 3600, d.offset)
+
+        d = Pendulum.create_from_format(
+            '1975-05-21 22:32:11Z', 'YYYY-MM-DD HH:mm:ssZ', formatter='alternative'
+        )
+        self.assertEqual(0, d.offset)
+
+    def test_create_from_format_with_timezone_name(self):
+        d = Pendulum.create_from_format(
+            '1975-05-21 22:32:11 Europe/London', 'YYYY-MM-DD HH:mm:ss zz',
+            formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 11)
+        self.assertEqual('Europe/London', d.timezone_name)
+
+    def test_create_from_format_with_timestamp(self):
+        d = Pendulum.create_from_format(
+            '169943531', 'X', 'Europe/London', formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 23, 32, 11)
+        self.assertEqual('Europe/London', d.timezone_name)
+
+    def test_create_from_format_with_day_of_year(self):
+        d = Pendulum.create_from_format('1976 060', 'YYYY DDDD', formatter='alternative')
+        self.assertPendulum(d, 1976, 2, 29, 0, 0, 0)
+
+    def test_create_from_format_with_time_only(self):
+        Pendulum.set_test_now(Pendulum(1975, 5, 21, 22, 32, 11))
+
+        d = Pendulum.create_from_format('10:15', 'HH:mm', formatter='alternative')
+        self.assertPendulum(d, 1975, 5, 21, 10, 15, 0)
+
+        Pendulum.set_test_now()
+
+    def test_create_from_format_with_escaped_text(self):
+        d = Pendulum.create_from_format(
+            'YYYY 1975 [05] D21', '[YYYY] YYYY \\[MM\\] \\DD', formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 0, 0, 0)
+
+    def test_create_from_format_not_matching(self):
+        self.assertRaises(
+            ValueError,
+            Pendulum.create_from_format, '1975-05-21 22', 'YYYY-MM-DD',
+            formatter='alternative'
+        )
+
+    def test_create_from_format_with_unsupported_token(self):
+        self.assertRaises(
+            ValueError,
+            Pendulum.create_from_format, '21', 'W', formatter='alternative'
+        )
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
+from array import array
+
 import pytz
 from pendulum import Pendulum, timezone
+from pendulum._compat import INT64_TYPECODE
 
-from .. import AbstractTestCase
+from .. import AbstractTestCase, AbstractBatchTestCase
 
 
 class CreateFromTimestampTest(AbstractTestCase):
@@ -27,3 +30,81 @@ class CreateFromTimestampTest(AbstractTestCase):
         d = Pendulum.create_from_timestamp(0, pytz.timezone('America/Toronto'))
         self.assertEqual('America/Toronto', d.timezone_name)
         self.assertPendulum(d, 1969, 12, 31, 19, 0, 0)
+
+
+class CreateFromTimestampsTest(AbstractBatchTestCase):
+
+    def _timestamps(self):
+        return [
+            int(Pendulum(year, month, 1, 1, 30).timestamp)
+            for year in (1900, 1970, 2016, 2037, 2100)
+            for month in (1, 3, 10, 11)
+        ] + [-1, 0, 1, 1477789200, 1477789199, 1477789200]
+
+    def assertTimestamps(self, timestamps, tz, unit='s', factor=1):
+        for _ in self.implementations():
+            dts = Pendulum.create_from_timestamps(timestamps, tz, unit)
+
+            self.assertEqual(len(timestamps), len(dts))
+            for timestamp, dt in zip(timestamps, dts):
+                expected = Pendulum.create_from_timestamp(timestamp / float(factor), tz)
+
+                self.assertIsInstanceOfPendulum(dt)
+                self.assertEqual(expected, dt)
+                self.assertEqual(expected.isoformat(), dt.isoformat())
+                self.assertEqual(expected.timezone_name, dt.timezone_name)
+
+    def test_create_from_timestamps(self):
+        self.assertTimestamps(self._timestamps(), 'Europe/Paris')
+
+    def test_create_from_timestamps_with_timezone(self):
+        self.assertTimestamps(self._timestamps(), timezone('America/Toronto'))
+
+    def test_create_from_timestamps_with_offset(self):
+        self.assertTimestamps(self._timestamps(), -5)
+
+    def test_create_from_timestamps_returns_utc_by_default(self):
+        dts = Pendulum.create_from_timestamps([0])
+
+        self.assertPendulum(dts[0], 1970, 1, 1, 0, 0, 0)
+        self.assertEqual('UTC', dts[0].timezone_name)
+
+    def test_create_from_timestamps_with_array(self):
+        self.assertTimestamps(
+            array(INT64_TYPECODE, self._timestamps()), 'Europe/Paris'
+        )
+
+    def test_create_from_timestamps_with_iterator(self):
+        dts = Pendulum.create_from_timestamps(iter([0, 86400]), 'Europe/Paris')
+
+        self.assertEqual(
+            ['1970-01-01T01:00:00+01:00', '1970-01-02T01:00:00+01:00'],
+            [dt.isoformat() for dt in dts]
+        )
+
+    def test_create_from_timestamps_with_numpy(self):
+        if self.np is None:
+            self.skipTest('NumPy is not installed')
+
+        timestamps = self.np.array(self._timestamps(), dtype=self.np.int64)
+        self.assertTimestamps(timestamps, 'Europe/Paris')
+
+    def test_create_from_timestamps_milliseconds(self):
+        timestamps = [t * 1000 + 123 for t in self._timestamps()]
+
+        self.assertTimestamps(timestamps, 'Europe/Paris', 'ms', 1000)
+
+    def test_create_from_timestamps_floats(self):
+        timestamps = [t + 0.5 for t in self._timestamps()]
+
+        self.assertTimestamps(timestamps, 'Europe/Paris')
+
+    def test_create_from_timestamps_empty(self):
+        for _ in self.implementations():
+            self.assertEqual([], Pendulum.create_from_timestamps([], 'Europe/Paris'))
+
+    def test_create_from_timestamps_invalid_unit(self):
+        self.assertRaises(
+            ValueError,
+            Pendulum.create_from_timestamps, [0], 'Europe/Paris', 'ns'
+        )
@@ -56,6 +56,20 @@ class GettersTest(AbstractTestCase):
         d = Pendulum(2012, 5, 7)
         self.assertEqual(31, d.days_in_month)
 
+    def test_quarter(self):
+        self.assertEqual(1, Pendulum(2012, 3, 31).quarter)
+        self.assertEqual(2, Pendulum(2012, 4, 1).quarter)
+        self.assertEqual(4, Pendulum(2012, 12, 31).quarter)
+
+    def test_calendar_fields_are_computed_once(self):
+        d = Pendulum(2012, 5, 7)
+
+        self.assertIs(d._calendar_fields(), d._calendar_fields())
+        self.assertEqual(
+            (d.day_of_week, d.day_of_year, d.week_of_year, d.days_in_month, d.quarter),
+            d._calendar_fields()
+        )
+
     def test_timestamp(self):
         d = Pendulum(1970, 1, 1, 0, 0, 0)
         self.assertEqual(0, d.timestamp)
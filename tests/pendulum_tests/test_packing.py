@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import pendulum
+from pendulum import Pendulum
+from pendulum.tz import FixedTimezone
+
+from .. import AbstractBatchTestCase
+
+
+class PackingTest(AbstractBatchTestCase):
+
+    def _instances(self):
+        return [
+            Pendulum(2016, 8, 27, 12, 34, 56, 123456, 'Europe/Paris'),
+            # Repeated hour
+            Pendulum(2016, 10, 30, 2, 30, tzinfo='Europe/Paris'),
+            Pendulum(2016, 10, 30, 2, 30, tzinfo='Europe/Paris').add(hours=1),
+            # Offset of 0:09:21
+            Pendulum(1900, 1, 1, tzinfo='Europe/Paris'),
+            Pendulum(2016, 8, 27, tzinfo='America/New_York'),
+            Pendulum(1969, 12, 31, 23, 59, 59, 999999, 'UTC'),
+            Pendulum(2016, 8, 27, 12, tzinfo=-5),
+            Pendulum(2016, 8, 27, 12, tzinfo=5.5),
+            Pendulum(2016, 8, 27, 12, tzinfo=FixedTimezone(3600, 'Foo')),
+            Pendulum.min,
+            Pendulum.max,
+        ]
+
+    def assertSameInstance(self, expected, d):
+        self.assertIsInstance(d, expected.__class__)
+        self.assertEqual(expected.isoformat(), d.isoformat())
+        self.assertEqual(expected.timezone_name, d.timezone_name)
+        self.assertEqual(expected.tzinfo.abbrev, d.tzinfo.abbrev)
+        self.assertEqual(expected.is_dst, d.is_dst)
+
+    def test_pack(self):
+        for dt in self._instances():
+            self.assertSameInstance(dt, Pendulum.unpack(dt.pack()))
+
+    def test_pack_is_compact(self):
+        dt = Pendulum(2016, 8, 27, 12, 34, 56, 123456, 'Europe/Paris')
+
+        self.assertEqual(1 + 8 + 2 + len('Europe/Paris'), len(dt.pack()))
+        self.assertEqual(1 + 8 + 5, len(Pendulum(2016, 8, 27, tzinfo=-5).pack()))
+
+    def test_unpack_subclass(self):
+        class MyPendulum(Pendulum):
+            pass
+
+        dt = MyPendulum(2016, 8, 27, tzinfo='Europe/Paris')
+        self.assertSameInstance(dt, MyPendulum.unpack(dt.pack()))
+
+    def test_unpack_invalid_version(self):
+        data = b'\x02' + Pendulum(2016, 8, 27).pack()[1:]
+
+        self.assertRaises(ValueError, Pendulum.unpack, data)
+
+    def test_pack_many(self):
+        dts = self._instances()
+
+        for _ in self.implementations():
+            unpacked = Pendulum.unpack_many(Pendulum.pack_many(dts))
+
+            self.assertEqual(len(dts), len(unpacked))
+            for dt, d in zip(dts, unpacked):
+                self.assertSameInstance(dt, d)
+
+    def test_pack_many_single_timezone(self):
+        dts = [
+            Pendulum(2016, month, 1, tzinfo='Europe/Paris')
+            for month in range(1, 13)
+        ]
+        data = Pendulum.pack_many(dts)
+
+        # No zone indexes are stored
+        self.assertEqual(7 + 2 + len('Europe/Paris') + 8 * len(dts), len(data))
+
+        for _ in self.implementations():
+            unpacked = Pendulum.unpack_many(memoryview(data))
+            for dt, d in zip(dts, unpacked):
+                self.assertSameInstance(dt, d)
+
+    def test_pack_many_empty(self):
+        self.assertEqual([], Pendulum.unpack_many(Pendulum.pack_many([])))
+
+    def test_unpack_many_truncated(self):
+        data = Pendulum.pack_many(self._instances())
+
+        self.assertRaises(ValueError, Pendulum.unpack_many, data[:-1])
+
+    def test_pickle_with_all_protocols(self):
+        for dt in self._instances():
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                self.assertSameInstance(
+                    dt, pickle.loads(pickle.dumps(dt, protocol))
+                )
+
+    def test_pickle_named_fixed_timezone(self):
+        dt = pendulum.create(2020, 1, 1, tz=FixedTimezone(3600, 'Foo'))
+        d = pickle.loads(pickle.dumps(dt))
+
+        self.assertEqual('Foo', d.timezone_name)
+        self.assertEqual(3600, d.offset)
+        self.assertEqual(dt, d)
+
+        # The default name is not stored
+        dt = pendulum.create(2020, 1, 1, tz=FixedTimezone(3600))
+        self.assertEqual(1 + 8 + 5, len(dt.pack()))
+
+    def test_pickle_does_not_normalize(self):
+        dt = Pendulum(2016, 8, 27, 12, 34, 56, 123456, 'Europe/Paris')
+        data = pickle.dumps(dt)
+        tz = dt.tz
+
+        def fail(*args, **kwargs):
+            raise AssertionError('The instance has been normalized')
+
+        tz._normalize = fail
+        try:
+            self.assertSameInstance(dt, pickle.loads(data))
+        finally:
+            del tz._normalize
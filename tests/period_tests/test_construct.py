@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
+
 from datetime import datetime
 from pendulum import Period, Pendulum
 
@@ -47,3 +50,18 @@ class ConstructTest(AbstractTestCase):
         self.assertIsInstanceOfPendulum(p.end)
         self.assertPendulum(p.start, 2000, 1, 1)
         self.assertPendulum(p.end, 2000, 1, 31)
+
+    def test_pickle(self):
+        dt1 = Pendulum(2000, 1, 1, tzinfo='Europe/Paris')
+        dt2 = Pendulum(2000, 1, 31, 12, 34, 56, 123456, tzinfo='Europe/Paris')
+
+        for p in (Period(dt1, dt2), Period(dt2, dt1), Period(dt2, dt1, True)):
+            for p2 in (pickle.loads(pickle.dumps(p)),
+                       copy.copy(p),
+                       copy.deepcopy(p)):
+                self.assertIsInstance(p2, Period)
+                self.assertEqual(p, p2)
+                self.assertEqual(p.start, p2.start)
+                self.assertEqual(p.end, p2.end)
+                self.assertEqual(p.invert, p2.invert)
+                self.assertEqual(p.in_days(), p2.in_days())
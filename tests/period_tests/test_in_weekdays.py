@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+from pendulum import Pendulum, Period, MONDAY, FRIDAY
+
+from .. import AbstractTestCase
+
+
+class InWeekdaysTest(AbstractTestCase):
+
+    def tearDown(self):
+        Pendulum.set_weekend_days([6, 0])
+
+        super(InWeekdaysTest, self).tearDown()
+
+    def test_in_weekdays(self):
+        # Friday to Monday
+        p = Period(Pendulum(2016, 9, 2, 12), Pendulum(2016, 9, 5, 3))
+
+        self.assertEqual(2, p.in_weekdays())
+        self.assertEqual(2, p.in_weekend_days())
+
+    def test_in_weekdays_same_day(self):
+        p = Period(Pendulum(2016, 9, 3, 1), Pendulum(2016, 9, 3, 23))
+
+        self.assertEqual(0, p.in_weekdays())
+        self.assertEqual(1, p.in_weekend_days())
+
+    def test_in_weekdays_long_period(self):
+        p = Period(Pendulum(2000, 1, 1), Pendulum(2009, 12, 31))
+
+        self.assertEqual(2609, p.in_weekdays())
+        self.assertEqual(1044, p.in_weekend_days())
+
+    def test_in_weekdays_inverted(self):
+        p = Period(Pendulum(2016, 9, 5, 3), Pendulum(2016, 9, 2, 12))
+
+        self.assertEqual(-2, p.in_weekdays())
+        self.assertEqual(-2, p.in_weekend_days())
+
+        p = Period(Pendulum(2016, 9, 5, 3), Pendulum(2016, 9, 2, 12), True)
+
+        self.assertEqual(2, p.in_weekdays())
+        self.assertEqual(2, p.in_weekend_days())
+
+    def test_in_weekdays_with_custom_weekend_days(self):
+        Pendulum.set_weekend_days([FRIDAY, MONDAY, FRIDAY])
+        p = Period(Pendulum(2016, 9, 1), Pendulum(2016, 9, 30))
+
+        self.assertEqual(21, p.in_weekdays())
+        self.assertEqual(9, p.in_weekend_days())
+
+    def test_in_weekdays_across_timezones(self):
+        # The end is on Monday in Paris but still on Sunday in UTC
+        p = Period(
+            Pendulum(2016, 9, 2, 12, tzinfo='Europe/Paris'),
+            Pendulum(2016, 9, 4, 22, 30, tzinfo='UTC')
+        )
+
+        self.assertEqual(1, p.in_weekdays())
+        self.assertEqual(2, p.in_weekend_days())
+
+    def test_in_weekdays_with_transition_at_midnight(self):
+        # Midnight does not exist on 2015-10-18 in Sao Paulo
+        p = Period(
+            Pendulum(2015, 10, 16, tzinfo='America/Sao_Paulo'),
+            Pendulum(2015, 10, 20, tzinfo='America/Sao_Paulo')
+        )
+
+        self.assertEqual(3, p.in_weekdays())
+        self.assertEqual(2, p.in_weekend_days())
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+
+from pendulum import Period, Pendulum, PeriodIndex
+
+from .. import AbstractTestCase
+
+
+class PeriodIndexTestCase(AbstractTestCase):
+
+    def setUp(self):
+        super(PeriodIndexTestCase, self).setUp()
+
+        start = Pendulum(2016, 8, 7)
+        self.start = start
+        self.periods = [
+            Period(start, start.add(days=3)),
+            Period(start.add(days=1), start.add(days=2)),
+            # Inverted
+            Period(start.add(days=5), start.add(days=2)),
+            Period(start.add(days=6), start.add(days=6)),
+            Period(start.add(days=8), start.add(days=10)),
+        ]
+        self.index = PeriodIndex(self.periods)
+
+    def test_containing(self):
+        p = self.periods
+        start = self.start
+
+        self.assertEqual([p[0]], self.index.containing(start))
+        self.assertEqual([p[0], p[1]], self.index.containing(start.add(days=1)))
+        self.assertEqual(
+            [p[0], p[1], p[2]], self.index.containing(start.add(days=2))
+        )
+        self.assertEqual([p[3]], self.index.containing(start.add(days=6)))
+        self.assertEqual([], self.index.containing(start.add(days=7)))
+        self.assertEqual([], self.index.containing(start.subtract(microseconds=1)))
+
+    def test_containing_other_timezone(self):
+        dt = Pendulum(2016, 8, 7, 2, tzinfo='Europe/Paris')
+
+        self.assertEqual([self.periods[0]], self.index.containing(dt))
+        self.assertEqual([], self.index.containing(dt.subtract(seconds=1)))
+
+    def test_containing_datetime(self):
+        self.assertEqual(
+            [self.periods[4]], self.index.containing(datetime(2016, 8, 16))
+        )
+
+    def test_overlapping(self):
+        p = self.periods
+        start = self.start
+
+        self.assertEqual(
+            [p[0], p[1], p[2], p[3]],
+            self.index.overlapping(start.add(days=1, hours=12), start.add(days=6))
+        )
+        self.assertEqual(
+            [p[2], p[3], p[4]],
+            self.index.overlapping(start.add(days=10), start.add(days=4))
+        )
+        self.assertEqual(
+            [], self.index.overlapping(start.add(days=6, hours=1), start.add(days=7))
+        )
+
+    def test_count(self):
+        start = self.start
+
+        self.assertEqual(3, self.index.count(start.add(days=2)))
+        self.assertEqual(0, self.index.count(start.add(days=7)))
+        self.assertEqual(
+            4, self.index.count(start.add(days=1, hours=12), start.add(days=6))
+        )
+        self.assertEqual(
+            0, self.index.count(start.add(days=7), start.add(days=6, hours=1))
+        )
+
+    def test_empty(self):
+        index = PeriodIndex()
+
+        self.assertEqual(0, len(index))
+        self.assertEqual([], index.containing(self.start))
+        self.assertEqual([], index.overlapping(self.start, self.start.add(days=1)))
+        self.assertEqual(0, index.count(self.start))
+
+    def test_iter(self):
+        p = self.periods
+
+        self.assertEqual(5, len(self.index))
+        self.assertEqual([p[0], p[1], p[2], p[3], p[4]], list(self.index))
+
+    def test_matches_contains(self):
+        start = self.start
+        periods = [
+            Period(start.add(hours=i * 7 % 50), start.add(hours=i * 13 % 50))
+            for i in range(50)
+        ]
+        index = PeriodIndex(periods)
+
+        for hours in range(-1, 52):
+            dt = start.add(hours=hours)
+            expected = set(id(p) for p in periods if dt in p)
+
+            self.assertEqual(expected, set(id(p) for p in index.containing(dt)))
+            self.assertEqual(len(expected), index.count(dt))
+
+    def test_coalesce(self):
+        start = self.start
+
+        coalesced = self.index.coalesce()
+
+        self.assertEqual(3, len(coalesced))
+        self.assertPendulum(coalesced[0].start, 2016, 8, 7)
+        self.assertPendulum(coalesced[0].end, 2016, 8, 12)
+        self.assertPendulum(coalesced[1].start, 2016, 8, 13)
+        self.assertPendulum(coalesced[1].end, 2016, 8, 13)
+        self.assertPendulum(coalesced[2].start, 2016, 8, 15)
+        self.assertPendulum(coalesced[2].end, 2016, 8, 17)
+
+        # Touching periods are merged
+        coalesced = PeriodIndex([
+            Period(start, start.add(days=1)),
+            Period(start.add(days=1), start.add(days=2)),
+        ]).coalesce()
+
+        self.assertEqual(1, len(coalesced))
+        self.assertPendulum(coalesced[0].end, 2016, 8, 9)
+
+    def test_coalesce_keeps_timezones(self):
+        start = Pendulum(2016, 8, 7, tzinfo='Europe/Paris')
+        end = Pendulum(2016, 8, 8, tzinfo='America/New_York')
+
+        coalesced = PeriodIndex([
+            Period(start, start.add(hours=12)),
+            Period(end, start.add(hours=6)),
+        ]).coalesce()
+
+        self.assertEqual(1, len(coalesced))
+        self.assertIs(start, coalesced[0].start)
+        self.assertIs(end, coalesced[0].end)
+
+    def test_complement(self):
+        start = self.start
+
+        complement = self.index.complement(start.add(days=11), start.subtract(days=1))
+
+        self.assertEqual(4, len(complement))
+        self.assertPendulum(complement[0].start, 2016, 8, 6)
+        self.assertPendulum(complement[0].end, 2016, 8, 7)
+        self.assertPendulum(complement[1].start, 2016, 8, 12)
+        self.assertPendulum(complement[1].end, 2016, 8, 13)
+        self.assertPendulum(complement[2].start, 2016, 8, 13)
+        self.assertPendulum(complement[2].end, 2016, 8, 15)
+        self.assertPendulum(complement[3].start, 2016, 8, 17)
+        self.assertPendulum(complement[3].end, 2016, 8, 18)
+
+    def test_complement_within_period(self):
+        start = self.start
+
+        self.assertEqual(
+            [], self.index.complement(start.add(days=1), start.add(days=3))
+        )
+
+        complement = self.index.complement(start.add(days=4), start.add(days=9))
+
+        self.assertEqual(2, len(complement))
+        self.assertPendulum(complement[0].start, 2016, 8, 12)
+        self.assertPendulum(complement[0].end, 2016, 8, 13)
+        self.assertPendulum(complement[1].start, 2016, 8, 13)
+        self.assertPendulum(complement[1].end, 2016, 8, 15)
+
+    def test_gaps(self):
+        gaps = self.index.gaps()
+
+        self.assertEqual(2, len(gaps))
+        self.assertPendulum(gaps[0].start, 2016, 8, 12)
+        self.assertPendulum(gaps[0].end, 2016, 8, 13)
+        self.assertPendulum(gaps[1].start, 2016, 8, 13)
+        self.assertPendulum(gaps[1].end, 2016, 8, 15)
+
+        self.assertEqual([], PeriodIndex().gaps())
+
+    def test_difference(self):
+        start = self.start
+
+        difference = self.index.difference([
+            Period(start.add(days=1), start.add(days=2)),
+            Period(start.add(days=4), start.add(days=9)),
+            Period(start.add(days=20), start.add(days=21)),
+        ])
+
+        self.assertEqual(3, len(difference))
+        self.assertPendulum(difference[0].start, 2016, 8, 7)
+        self.assertPendulum(difference[0].end, 2016, 8, 8)
+        self.assertPendulum(difference[1].start, 2016, 8, 9)
+        self.assertPendulum(difference[1].end, 2016, 8, 11)
+        self.assertPendulum(difference[2].start, 2016, 8, 16)
+        self.assertPendulum(difference[2].end, 2016, 8, 17)
+
+    def test_difference_with_index(self):
+        self.assertEqual([], self.index.difference(self.index))
+        self.assertEqual(
+            len(self.index.coalesce()),
+            len(self.index.difference(PeriodIndex()))
+        )
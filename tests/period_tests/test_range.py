@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from pendulum import Period, Pendulum
+from pendulum.tz import batch
 
 from .. import AbstractTestCase
 
@@ -92,3 +93,149 @@ class RangeTest(AbstractTestCase):
         self.assertPendulum(r[0], 2016, 10, 14, 0, 0, 0)
         self.assertPendulum(r[2], 2016, 10, 16, 1, 0, 0)
         self.assertPendulum(r[-1], 2016, 10, 21, 0, 0, 0)
+
+    def test_range_with_step(self):
+        dt1 = Pendulum(2000, 1, 1, 12, 45, 37)
+        dt2 = Pendulum(2000, 1, 31, 12, 45, 37)
+
+        p = Period(dt1, dt2)
+        r = p.range('days', 7)
+        self.assertEqual(5, len(r))
+        self.assertPendulum(r[1], 2000, 1, 8, 12, 45, 37)
+        self.assertPendulum(r[-1], 2000, 1, 29, 12, 45, 37)
+
+        r = Period(dt2, dt1).range('days', 7)
+        self.assertEqual(5, len(r))
+        self.assertPendulum(r[1], 2000, 1, 24, 12, 45, 37)
+        self.assertPendulum(r[-1], 2000, 1, 3, 12, 45, 37)
+
+    def test_range_months_with_step_clamps_from_start(self):
+        dt1 = Pendulum(2016, 1, 31)
+        dt2 = Pendulum(2016, 12, 31)
+
+        r = Period(dt1, dt2).range('months', 2)
+        self.assertEqual(6, len(r))
+        self.assertPendulum(r[1], 2016, 3, 31)
+        self.assertPendulum(r[2], 2016, 5, 31)
+        self.assertPendulum(r[4], 2016, 9, 30)
+
+        r = Period(dt1, dt2).range('years')
+        self.assertEqual(1, len(r))
+
+    def test_range_hours_with_dst(self):
+        dt1 = Pendulum(2016, 10, 30, tzinfo='Europe/Paris')
+        dt2 = Pendulum(2016, 10, 30, 4, tzinfo='Europe/Paris')
+
+        r = Period(dt1, dt2).range('hours')
+        self.assertEqual(6, len(r))
+        self.assertEqual(
+            ['2016-10-30T00:00:00+02:00', '2016-10-30T01:00:00+02:00',
+             '2016-10-30T02:00:00+02:00', '2016-10-30T02:00:00+01:00',
+             '2016-10-30T03:00:00+01:00', '2016-10-30T04:00:00+01:00'],
+            [dt.isoformat() for dt in r]
+        )
+
+    def test_range_minutes_with_step(self):
+        dt1 = Pendulum(2016, 1, 1, tzinfo='Europe/Paris')
+        dt2 = dt1.add(days=1)
+
+        r = Period(dt1, dt2).range('minutes', 15)
+        self.assertEqual(97, len(r))
+        self.assertPendulum(r[1], 2016, 1, 1, 0, 15, 0)
+        self.assertPendulum(r[-1], 2016, 1, 2, 0, 0, 0)
+        self.assertEqual('Europe/Paris', r[-1].timezone_name)
+
+        r = Period(dt2, dt1, True).range('seconds', 7200)
+        self.assertEqual(13, len(r))
+        self.assertPendulum(r[1], 2016, 1, 1, 2, 0, 0)
+
+    def test_xrange_is_lazy(self):
+        dt1 = Pendulum(2016, 1, 1)
+        dt2 = Pendulum(2116, 1, 1)
+
+        r = Period(dt1, dt2).xrange('seconds')
+        self.assertPendulum(next(r), 2016, 1, 1, 0, 0, 0)
+        self.assertPendulum(next(r), 2016, 1, 1, 0, 0, 1)
+
+    def test_range_invalid_unit_or_step(self):
+        p = Period(Pendulum(2016, 1, 1), Pendulum(2016, 1, 2))
+
+        self.assertRaises(ValueError, p.range, 'decades')
+        self.assertRaises(ValueError, p.range, 'days', 0)
+        self.assertRaises(ValueError, p.range, 'days', -1)
+        self.assertRaises(ValueError, p.range, 'days', 1.5)
+
+    def test_range_as_array(self):
+        if batch.np is None:
+            self.skipTest('NumPy is not installed')
+
+        dt1 = Pendulum(2016, 10, 30, tzinfo='Europe/Paris')
+        dt2 = Pendulum(2016, 10, 30, 4, tzinfo='Europe/Paris')
+        p = Period(dt1, dt2)
+
+        epochs = p.range('hours', as_array=True)
+        self.assertEqual('int64', epochs.dtype.name)
+        self.assertEqual(
+            [dt._get_key() for dt in p.range('hours')],
+            epochs.tolist()
+        )
+
+        local, offsets = p.range('hours', as_array='datetime64')
+        self.assertEqual('datetime64[us]', local.dtype.name)
+        self.assertEqual(
+            ['2016-10-30T00:00:00.000000', '2016-10-30T01:00:00.000000',
+             '2016-10-30T02:00:00.000000', '2016-10-30T02:00:00.000000',
+             '2016-10-30T03:00:00.000000', '2016-10-30T04:00:00.000000'],
+            [str(t) for t in local]
+        )
+        self.assertEqual([7200, 7200, 7200, 3600, 3600, 3600], offsets.tolist())
+
+    def test_range_as_array_calendar_units(self):
+        if batch.np is None:
+            self.skipTest('NumPy is not installed')
+
+        for dt1, dt2, unit, step in [
+            (Pendulum(2016, 1, 31, 2, 30, tzinfo='Europe/Paris'),
+             Pendulum(2018, 1, 31, tzinfo='Europe/Paris'), 'months', 1),
+            (Pendulum(2016, 10, 14, tzinfo='America/Sao_Paulo'),
+             Pendulum(2016, 12, 14, tzinfo='America/Sao_Paulo'), 'days', 3),
+            (Pendulum(2020, 2, 29, 12), Pendulum(2000, 1, 1), 'years', 1),
+            (Pendulum(2016, 3, 20, 2, 30, tzinfo='Europe/Paris'),
+             Pendulum(2016, 4, 20, tzinfo='UTC'), 'weeks', 1),
+        ]:
+            p = Period(dt1, dt2)
+
+            self.assertEqual(
+                [dt._get_key() for dt in p.range(unit, step)],
+                p.range(unit, step, as_array=True).tolist()
+            )
+
+    def test_range_as_array_inverted(self):
+        if batch.np is None:
+            self.skipTest('NumPy is not installed')
+
+        dt = Pendulum(2016, 1, 1)
+        p = Period(dt, dt.subtract(days=1))
+
+        epochs = p.range('hours', 6, as_array=True)
+        self.assertEqual(
+            [dt.add(hours=-6 * i)._get_key() for i in range(5)],
+            epochs.tolist()
+        )
+        self.assertEqual(1, len(Period(dt, dt).range('days', as_array=True)))
+
+    def test_range_as_array_invalid(self):
+        p = Period(Pendulum(2016, 1, 1), Pendulum(2016, 1, 2))
+
+        self.assertRaises(ValueError, p.range, 'days', 1, 'list')
+
+    def test_range_as_array_without_numpy(self):
+        np = batch.np
+        batch.np = None
+
+        try:
+            p = Period(Pendulum(2016, 1, 1), Pendulum(2016, 1, 2))
+
+            self.assertRaises(ImportError, p.range, 'days', 1, True)
+        finally:
+            batch.np = np
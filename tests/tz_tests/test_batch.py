@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+
+import pendulum
+from pendulum.tz import Timezone, timezone, batch
+from pendulum._compat import INT64_TYPECODE
+from pendulum.tz.exceptions import NonExistingTime, AmbiguousTime
+
+from .. import AbstractBatchTestCase
+
+
+class ConvertManyTest(AbstractBatchTestCase):
+
+    def assertConvertMany(self, tz, epochs, unit='s'):
+        results = tz.convert_many(epochs, unit)
+
+        factor = {'s': 1, 'ms': 1000, 'us': 1000000}[unit]
+        for i, epoch in enumerate(epochs):
+            sec, remainder = divmod(epoch, factor)
+            microsecond = remainder * (1000000 // factor)
+            dt = pendulum.from_timestamp(sec, tz)
+
+            self.assertEqual(
+                (dt.year, dt.month, dt.day,
+                 dt.hour, dt.minute, dt.second, microsecond,
+                 dt.offset, dt.is_dst),
+                tuple(int(results[field][i]) for field in batch.FIELDS[:-1])
+                + (bool(results['is_dst'][i]),)
+            )
+
+    def _epochs(self):
+        return [
+            int(pendulum.create(year, month, 1, tz='UTC').timestamp)
+            for year in (1950, 1970, 2016, 2037, 2100, 2300)
+            for month in (1, 3, 4, 7, 10, 11)
+        ] + [-1, 0, 1]
+
+    def test_convert_many_without_numpy(self):
+        batch.np = None
+
+        tz = timezone('Europe/Paris')
+        epochs = self._epochs()
+        results = tz.convert_many(epochs)
+
+        self.assertIsInstance(results['year'], array)
+        self.assertConvertMany(tz, epochs)
+
+    def test_convert_many_with_numpy(self):
+        if batch.np is None:
+            self.skipTest('NumPy is not installed')
+
+        np = batch.np
+        tz = timezone('America/New_York')
+        epochs = self._epochs()
+        results = tz.convert_many(np.array(epochs, dtype=np.int64))
+
+        self.assertIsInstance(results['year'], np.ndarray)
+        self.assertConvertMany(tz, epochs)
+
+    def test_convert_many_microseconds(self):
+        tz = timezone('Europe/Paris')
+        epochs = [-1, 0, 1459040400123456, 1477789199999999]
+
+        for _ in self.implementations():
+            self.assertConvertMany(tz, epochs, 'us')
+
+    def test_convert_many_milliseconds(self):
+        tz = timezone('Europe/Paris')
+        epochs = [-1, 0, 1500, 1459040400123, 1477789199999]
+
+        for _ in self.implementations():
+            self.assertConvertMany(tz, epochs, 'ms')
+
+            results = tz.convert_many([1500], 'ms')
+            self.assertEqual(1, int(results['second'][0]))
+            self.assertEqual(500000, int(results['microsecond'][0]))
+
+    def test_convert_many_keeps_sub_minute_offsets(self):
+        tz = timezone('Europe/Paris')
+        epoch = int(pendulum.create(1900, 1, 1, tz='UTC').timestamp)
+
+        for _ in self.implementations():
+            results = tz.convert_many([epoch])
+
+            self.assertEqual(
+                (1900, 1, 1, 0, 9, 21, 561),
+                tuple(int(results[field][0]) for field in
+                      ('year', 'month', 'day', 'hour', 'minute', 'second', 'offset'))
+            )
+
+    def test_convert_many_fixed_timezone(self):
+        tz = pendulum.tz.fixed_timezone(-5 * 3600)
+        results = tz.convert_many(array(INT64_TYPECODE, [0]))
+
+        self.assertEqual(1969, results['year'][0])
+        self.assertEqual(19, results['hour'][0])
+        self.assertEqual(-18000, results['offset'][0])
+
+    def test_convert_many_empty(self):
+        results = timezone('Europe/Paris').convert_many([])
+
+        self.assertEqual(0, len(results['year']))
+
+    def test_convert_many_invalid_unit(self):
+        self.assertRaises(
+            ValueError,
+            timezone('Europe/Paris').convert_many, [0], 'ns'
+        )
+
+
+class LocalizeManyTest(AbstractBatchTestCase):
+
+    # 2016-03-27 02:30 (skipped), 2016-10-30 02:30 (repeated)
+    # and 2016-06-01 12:00 in Europe/Paris, as naive unix times
+    EPOCHS = [1459045800, 1477794600, 1464782400]
+
+    def assertLocalizeMany(self, dst_rule, expected):
+        tz = timezone('Europe/Paris')
+
+        for _ in self.implementations():
+            utc, ambiguous, nonexistent = tz.localize_many(self.EPOCHS, dst_rule)
+
+            self.assertEqual(expected, [int(t) for t in utc])
+            self.assertEqual([False, True, False], [bool(f) for f in ambiguous])
+            self.assertEqual([True, False, False], [bool(f) for f in nonexistent])
+
+    def test_localize_many_post_transition(self):
+        self.assertLocalizeMany(
+            Timezone.POST_TRANSITION,
+            [1459045800 - 3600, 1477794600 - 3600, 1464782400 - 7200]
+        )
+
+    def test_localize_many_pre_transition(self):
+        self.assertLocalizeMany(
+            Timezone.PRE_TRANSITION,
+            [1459045800 - 3600, 1477794600 - 7200, 1464782400 - 7200]
+        )
+
+    def test_localize_many_transition_error(self):
+        tz = timezone('Europe/Paris')
+
+        for _ in self.implementations():
+            self.assertRaises(
+                NonExistingTime,
+                tz.localize_many, self.EPOCHS, Timezone.TRANSITION_ERROR
+            )
+            self.assertRaises(
+                AmbiguousTime,
+                tz.localize_many, self.EPOCHS[1:], Timezone.TRANSITION_ERROR
+            )
+
+            utc, _, _ = tz.localize_many(self.EPOCHS[2:], Timezone.TRANSITION_ERROR)
+            self.assertEqual([1464782400 - 7200], [int(t) for t in utc])
+
+    def test_localize_many_microseconds(self):
+        tz = timezone('Europe/Paris')
+
+        # 2016-10-30 02:00 and 03:00, bounds of the repeated hour
+        start = 1477792800 * 1000000
+        end = 1477796400 * 1000000
+        epochs = [start - 1, start, end, end + 1]
+
+        for _ in self.implementations():
+            utc, ambiguous, _ = tz.localize_many(epochs, unit='us')
+
+            self.assertEqual(
+                [start - 1 - 7200000000, start - 3600000000,
+                 end - 3600000000, end + 1 - 3600000000],
+                [int(t) for t in utc]
+            )
+            self.assertEqual(
+                [False, True, True, False],
+                [bool(f) for f in ambiguous]
+            )
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from pendulum.tz import (
+    Timezone, preload, set_cache_policy, cache_info
+)
+from pendulum.tz.cache import TimezoneCache
+
+from .. import AbstractTestCase
+
+
+class TimezoneCacheTest(AbstractTestCase):
+
+    def setUp(self):
+        super(TimezoneCacheTest, self).setUp()
+
+        self.cache = Timezone._cache
+        Timezone._cache = TimezoneCache()
+
+    def tearDown(self):
+        Timezone._cache = self.cache
+
+        super(TimezoneCacheTest, self).tearDown()
+
+    def test_unbounded(self):
+        tz = Timezone.load('Europe/Paris')
+        self.assertIs(tz, Timezone.load('Europe/Paris'))
+
+        info = cache_info()
+        self.assertEqual('unbounded', info['policy'])
+        self.assertEqual(1, info['size'])
+        self.assertEqual(1, info['hits'])
+        self.assertEqual(1, info['misses'])
+        self.assertEqual(0, info['evictions'])
+        self.assertGreater(info['load_time'], 0)
+
+    def test_lru(self):
+        set_cache_policy('lru', 2)
+
+        paris = Timezone.load('Europe/Paris')
+        Timezone.load('Europe/London')
+        Timezone.load('Europe/Paris')
+        Timezone.load('America/New_York')
+
+        self.assertIn('Europe/Paris', Timezone._cache)
+        self.assertNotIn('Europe/London', Timezone._cache)
+        self.assertIs(paris, Timezone.load('Europe/Paris'))
+
+        info = cache_info()
+        self.assertEqual(2, info['size'])
+        self.assertEqual(2, info['maxsize'])
+        self.assertEqual(1, info['evictions'])
+        self.assertEqual(2, info['hits'])
+        self.assertEqual(3, info['misses'])
+
+    def test_lru_shrinks_on_configure(self):
+        for name in ['Europe/Paris', 'Europe/London', 'America/New_York']:
+            Timezone.load(name)
+
+        set_cache_policy('lru', 1)
+
+        self.assertEqual(1, len(Timezone._cache))
+        self.assertIn('America/New_York', Timezone._cache)
+        self.assertEqual(2, cache_info()['evictions'])
+
+    def test_pinned(self):
+        set_cache_policy('pinned')
+
+        preload(['Europe/Paris'])
+        tz = Timezone.load('Europe/London')
+
+        self.assertIn('Europe/Paris', Timezone._cache)
+        self.assertNotIn('Europe/London', Timezone._cache)
+        self.assertIsNot(tz, Timezone.load('Europe/London'))
+
+    def test_preloaded_zones_are_never_evicted(self):
+        set_cache_policy('lru', 1)
+
+        paris, = preload(['Europe/Paris'])
+        Timezone.load('Europe/London')
+        Timezone.load('America/New_York')
+
+        self.assertIs(paris, Timezone.load('Europe/Paris'))
+
+        info = cache_info()
+        self.assertEqual(2, info['size'])
+        self.assertEqual(1, info['pinned'])
+        self.assertEqual(1, info['evictions'])
+
+    def test_invalid_policy(self):
+        self.assertRaises(ValueError, set_cache_policy, 'foo')
+        self.assertRaises(ValueError, set_cache_policy, 'lru')
+        self.assertRaises(ValueError, set_cache_policy, 'lru', 0)
+
+    def test_stats_are_thread_safe(self):
+        set_cache_policy('lru', 2)
+        Timezone.load('Europe/Paris')
+
+        def load():
+            for _ in range(1000):
+                Timezone._cache.get('Europe/Paris')
+                Timezone._cache.get('Europe/London')
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        info = cache_info()
+        self.assertEqual(8000, info['hits'])
+        self.assertEqual(8001, info['misses'])
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import warnings
+
+from datetime import datetime
+from pendulum.tz import Timezone, use_database
+from pendulum.tz.loader import Loader
+from pendulum.tz.database import ZoneDatabase, compile_database
+
+from .. import AbstractTestCase
+
+
+class ZoneDatabaseTest(AbstractTestCase):
+
+    def setUp(self):
+        super(ZoneDatabaseTest, self).setUp()
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'zones.db')
+
+    def tearDown(self):
+        use_database()
+        Loader.database_path = None
+        shutil.rmtree(self.tmpdir)
+
+        super(ZoneDatabaseTest, self).tearDown()
+
+    def test_compile(self):
+        count = compile_database(self.path, ['Europe/Paris', 'Etc/UTC'])
+
+        self.assertEqual(2, count)
+
+        db = ZoneDatabase(self.path)
+
+        self.assertEqual(2, len(db))
+        self.assertIn('Europe/Paris', db)
+        self.assertNotIn('America/Toronto', db)
+
+    def test_load(self):
+        compile_database(self.path, ['Europe/Paris', 'Etc/UTC'])
+        db = ZoneDatabase(self.path)
+
+        expected = Loader.load('Europe/Paris')
+        loaded = db.load('Europe/Paris')
+
+        for i in range(4):
+            self.assertEqual(list(expected[i]), list(loaded[i]))
+
+        self.assertEqual(
+            [(t.utc_offset, t.is_dst, t.abbrev) for t in expected[4]],
+            [(t.utc_offset, t.is_dst, t.abbrev) for t in loaded[4]]
+        )
+        self.assertEqual(expected[5], loaded[5])
+        self.assertEqual(expected[6], loaded[6])
+
+        loaded = db.load('Etc/UTC')
+
+        self.assertEqual(0, len(loaded[0]))
+        self.assertEqual('UTC', loaded[4][0].abbrev)
+
+    def test_load_unknown_timezone(self):
+        compile_database(self.path, ['Europe/Paris'])
+        db = ZoneDatabase(self.path)
+
+        self.assertRaises(ValueError, db.load, 'America/Toronto')
+
+    def test_invalid_database(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 64)
+
+        self.assertRaises(ValueError, ZoneDatabase, self.path)
+
+    def test_use_database(self):
+        compile_database(self.path, ['Europe/Paris'])
+        use_database(self.path)
+
+        tz = Timezone('Europe/Paris', *Loader.load('Europe/Paris'))
+        dt = tz.convert(datetime(2013, 3, 31, 2, 30))
+
+        self.assertEqual(datetime(2013, 3, 31, 3, 30), dt.replace(tzinfo=None))
+        self.assertEqual(7200, dt.tzinfo.offset)
+
+        # Timezones not in the database are still loaded
+        self.assertTrue(Loader.load('America/Toronto'))
+
+    def test_invalid_database_path_falls_back_on_zoneinfo(self):
+        Loader.database_path = os.path.join(self.tmpdir, 'nonexistent.db')
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+
+            self.assertTrue(Loader.load('Europe/Paris'))
+
+        self.assertEqual(1, len(w))
+        self.assertIsNone(Loader.database)
+        self.assertIsNone(Loader.database_path)
+
+    def test_invalid_database_environment_variable(self):
+        env = dict(os.environ)
+        env['PENDULUM_TZ_DATABASE'] = os.path.join(self.tmpdir, 'nonexistent.db')
+
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        process = subprocess.Popen(
+            [sys.executable, '-c',
+             'import pendulum; print(pendulum.timezone("Europe/Paris").name)'],
+            cwd=os.path.abspath(root), env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        out, err = process.communicate()
+
+        self.assertEqual(0, process.returncode, err)
+        self.assertEqual(b'Europe/Paris', out.strip())
+        self.assertIn(b'Unable to use the timezone database', err)
@@ -16,14 +16,19 @@ class TimezoneLoaderTest(AbstractTestCase):
     def test_load_from_file(self):
         local_path = os.path.join(os.path.split(__file__)[0], '..')
         tz_file = os.path.join(local_path, 'fixtures', 'tz', 'Paris')
-        (transitions,
+        (transition_times,
+         pre_times,
+         times,
+         transition_type_indexes,
          transition_types,
          default_transition_type,
-         utc_transition_times) = Loader.load_from_file(tz_file)
+         posix_rule) = Loader.load_from_file(tz_file)
 
-        self.assertGreater(len(transitions), 0)
+        self.assertGreater(len(transition_times), 0)
+        self.assertEqual(len(transition_times), len(pre_times))
+        self.assertEqual(len(transition_times), len(times))
+        self.assertEqual(len(transition_times), len(transition_type_indexes))
         self.assertGreater(len(transition_types), 0)
-        self.assertGreater(len(utc_transition_times), 0)
         self.assertIsNotNone(default_transition_type)
 
     def test_load_from_file_invalid(self):
@@ -34,4 +39,5 @@ class TimezoneLoaderTest(AbstractTestCase):
     def test_set_transitions_for_no_transition_database_file(self):
         tz = Loader.load('Etc/UTC')
 
-        self.assertEqual(1, len(tz[0]))
+        self.assertEqual(0, len(tz[0]))
+        self.assertEqual(1, len(tz[4]))
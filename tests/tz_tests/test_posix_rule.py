@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from pendulum.tz.posix_rule import PosixRule
+
+from .. import AbstractTestCase
+
+
+def _utc(*args):
+    return int((datetime(*args) - datetime(1970, 1, 1)).total_seconds())
+
+
+class PosixRuleTest(AbstractTestCase):
+
+    def test_parse_without_dst(self):
+        rule = PosixRule.parse('<+0330>-3:30')
+
+        self.assertEqual(12600, rule.std.utc_offset)
+        self.assertEqual('+0330', rule.std.abbrev)
+        self.assertFalse(rule.has_dst)
+        self.assertEqual([], rule.transitions(2100))
+
+    def test_parse(self):
+        rule = PosixRule.parse('CET-1CEST,M3.5.0,M10.5.0/3')
+
+        self.assertEqual(3600, rule.std.utc_offset)
+        self.assertEqual('CET', rule.std.abbrev)
+        self.assertFalse(rule.std.is_dst)
+        self.assertEqual(7200, rule.dst.utc_offset)
+        self.assertEqual('CEST', rule.dst.abbrev)
+        self.assertTrue(rule.dst.is_dst)
+
+    def test_parse_invalid(self):
+        self.assertRaises(ValueError, PosixRule.parse, 'C')
+        self.assertRaises(ValueError, PosixRule.parse, 'CET-1CEST,M13.5.0,M10.5.0/3')
+
+    def test_transitions(self):
+        rule = PosixRule.parse('CET-1CEST,M3.5.0,M10.5.0/3')
+
+        self.assertEqual(
+            [(_utc(2100, 3, 28, 1), True), (_utc(2100, 10, 31, 1), False)],
+            rule.transitions(2100)
+        )
+
+    def test_transitions_southern_hemisphere(self):
+        rule = PosixRule.parse('AEST-10AEDT,M10.1.0,M4.1.0/3')
+
+        self.assertEqual(
+            [(_utc(2100, 4, 3, 16), False), (_utc(2100, 10, 2, 16), True)],
+            rule.transitions(2100)
+        )
+
+    def test_transitions_with_extended_times(self):
+        rule = PosixRule.parse('<-02>2<-01>,M3.5.0/-1,M10.5.0/0')
+
+        self.assertEqual(
+            [(_utc(2100, 3, 28, 1), True), (_utc(2100, 10, 31, 1), False)],
+            rule.transitions(2100)
+        )
+
+        rule = PosixRule.parse('IST-2IDT,M3.4.4/26,M10.5.0')
+
+        self.assertEqual(
+            [(_utc(2100, 3, 26), True), (_utc(2100, 10, 30, 23), False)],
+            rule.transitions(2100)
+        )
+
+    def test_transitions_julian_days(self):
+        rule = PosixRule.parse('STD-1DST,J60,300')
+
+        # J60 is always March 1st, 300 is the 301st day
+        self.assertEqual(
+            [(_utc(2096, 3, 1, 1), True), (_utc(2096, 10, 27, 0), False)],
+            rule.transitions(2096)
+        )
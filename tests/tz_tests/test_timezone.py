@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import threading
+
+from bisect import bisect_right
+
 import pendulum
 from datetime import datetime
 from pendulum import timezone
+from pendulum.tz import Timezone, FixedTimezone, fixed_timezone
+from pendulum.tz.loader import Loader
 from pendulum.tz.exceptions import NonExistingTime, AmbiguousTime
 
 from .. import AbstractTestCase
@@ -146,3 +152,174 @@ class TimezoneTest(AbstractTestCase):
         self.assertEqual('Europe/Paris', dt.timezone_name)
         self.assertEqual(3600, dt.offset)
         self.assertFalse(dt.is_dst)
+
+    def test_transitions(self):
+        tz = timezone('Europe/Paris')
+        transitions = tz.transitions
+
+        self.assertGreater(len(transitions), 0)
+
+        tr = [t for t in transitions if t.utc_time == datetime(2013, 3, 31, 1)][0]
+        self.assertEqual(1364691600, tr.unix_time)
+        self.assertEqual(datetime(2013, 3, 31, 2), tr.pre_time)
+        self.assertEqual(datetime(2013, 3, 31, 3), tr.time)
+        self.assertEqual(3600, tz._transition_types[tr.pre_transition_type_index].utc_offset)
+        self.assertEqual(7200, tz._transition_types[tr.transition_type_index].utc_offset)
+
+    def test_convert_between_last_transitions(self):
+        tz = timezone('Europe/Paris')
+        last = tz.transitions[-1]
+        dt = tz.convert(last.time.replace(month=7, day=1, hour=12))
+
+        self.assertEqual(7200, dt.tzinfo.offset)
+        self.assertTrue(dt.tzinfo.is_dst)
+
+    def test_convert_zone_without_transitions(self):
+        tz = timezone('Etc/GMT+5')
+        dt = tz.convert(datetime(2016, 6, 1, 12, 34, 56), dst_rule=tz.TRANSITION_ERROR)
+
+        self.assertEqual(datetime(2016, 6, 1, 12, 34, 56), dt.replace(tzinfo=None))
+        self.assertEqual(-18000, dt.tzinfo.offset)
+
+        dt = tz.convert(datetime(2016, 6, 1, 12, 34, 56, tzinfo=pendulum.UTC))
+
+        self.assertEqual(datetime(2016, 6, 1, 7, 34, 56), dt.replace(tzinfo=None))
+        self.assertEqual(-18000, dt.tzinfo.offset)
+
+    def test_convert_keeps_microseconds_before_epoch(self):
+        tz = timezone('Europe/Paris')
+        dt = tz.convert(datetime(1955, 6, 16, 10, 23, 18, 986724))
+
+        self.assertEqual(datetime(1955, 6, 16, 10, 23, 18, 986724), dt.replace(tzinfo=None))
+
+    def test_convert_after_last_transition(self):
+        tz = timezone('Europe/Paris')
+        dt = tz.convert(datetime(2100, 7, 1, 12))
+
+        self.assertEqual(7200, dt.tzinfo.offset)
+        self.assertTrue(dt.tzinfo.is_dst)
+
+        dt = tz.convert(datetime(2100, 12, 1, 12))
+
+        self.assertEqual(3600, dt.tzinfo.offset)
+        self.assertFalse(dt.tzinfo.is_dst)
+
+    def test_convert_after_last_transition_southern_hemisphere(self):
+        tz = timezone('Australia/Sydney')
+        dt = tz.convert(datetime(2100, 1, 15, 12))
+
+        self.assertEqual(39600, dt.tzinfo.offset)
+        self.assertTrue(dt.tzinfo.is_dst)
+
+        dt = tz.convert(datetime(2100, 7, 15, 12))
+
+        self.assertEqual(36000, dt.tzinfo.offset)
+        self.assertFalse(dt.tzinfo.is_dst)
+
+    def test_skipped_and_repeated_time_after_last_transition(self):
+        tz = timezone('Europe/Paris')
+        dt = tz.convert(datetime(2100, 3, 28, 2, 30))
+
+        self.assertEqual(datetime(2100, 3, 28, 3, 30), dt.replace(tzinfo=None))
+        self.assertEqual(7200, dt.tzinfo.offset)
+
+        dt = tz.convert(datetime(2100, 10, 31, 2, 30), dst_rule=tz.PRE_TRANSITION)
+
+        self.assertEqual(datetime(2100, 10, 31, 2, 30), dt.replace(tzinfo=None))
+        self.assertEqual(7200, dt.tzinfo.offset)
+
+        self.assertRaises(
+            NonExistingTime,
+            tz.convert, datetime(2100, 3, 28, 2, 30), tz.TRANSITION_ERROR
+        )
+        self.assertRaises(
+            AmbiguousTime,
+            tz.convert, datetime(2100, 10, 31, 2, 30), tz.TRANSITION_ERROR
+        )
+
+    def test_fromutc_after_last_transition(self):
+        tz = timezone('America/New_York')
+        dt = tz.convert(datetime(2200, 7, 4, 16, tzinfo=pendulum.UTC))
+
+        self.assertEqual(datetime(2200, 7, 4, 12), dt.replace(tzinfo=None))
+        self.assertEqual(-14400, dt.tzinfo.offset)
+
+    def test_fromutc_before_first_transition(self):
+        tz = timezone('Europe/Paris')
+        dt = tz.convert(datetime(1800, 1, 1, 12, tzinfo=pendulum.UTC))
+
+        self.assertEqual(561, dt.tzinfo.offset)
+        self.assertEqual('LMT', dt.tzinfo.abbrev)
+
+    def test_rule_transitions_cache_is_bounded(self):
+        tz = timezone('Europe/Paris')
+
+        for year in range(2100, 2100 + 2 * tz._RULE_TRANSITIONS_CACHE_SIZE):
+            tz.convert(datetime(year, 7, 1))
+
+        self.assertEqual(
+            tz._RULE_TRANSITIONS_CACHE_SIZE,
+            len(tz._rule_transitions)
+        )
+
+    def test_lookup_hints_are_per_thread(self):
+        tz = Timezone('Europe/Paris', *Loader.load('Europe/Paris'))
+        dt = datetime(2016, 6, 1, 12, 34, 56)
+
+        tz.convert(dt)
+        tz.convert(dt)
+        tz.convert(datetime(2016, 1, 1))
+
+        self.assertEqual({'hits': 1, 'narrowed': 1, 'misses': 1}, tz.hint_stats)
+
+        stats = []
+
+        def convert():
+            stats.append(tz.hint_stats)
+            tz.convert(datetime(2013, 3, 1))
+            tz.convert(datetime(2013, 3, 1))
+            stats.append(tz.hint_stats)
+
+        thread = threading.Thread(target=convert)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(
+            [{'hits': 0, 'narrowed': 0, 'misses': 0},
+             {'hits': 1, 'narrowed': 0, 'misses': 1}],
+            stats
+        )
+        self.assertEqual({'hits': 1, 'narrowed': 1, 'misses': 1}, tz.hint_stats)
+
+        tz.convert(datetime(2016, 1, 1))
+
+        self.assertEqual({'hits': 2, 'narrowed': 1, 'misses': 1}, tz.hint_stats)
+
+    def test_utc_index(self):
+        tz = Timezone('Europe/Paris', *Loader.load('Europe/Paris'))
+        transition_times = tz._transition_times
+
+        self.assertIsNone(tz._utc_index)
+
+        for unix_time in transition_times:
+            for t in (unix_time - 1, unix_time, unix_time + 1, unix_time + 86400 * 20):
+                self.assertEqual(
+                    bisect_right(transition_times, t),
+                    tz._find_utc_index(t)
+                )
+
+        self.assertIsNotNone(tz._utc_index)
+        self.assertEqual(0, tz._find_utc_index(transition_times[0] - 86400 * 365))
+        self.assertEqual(
+            len(transition_times),
+            tz._find_utc_index(transition_times[-1] + 86400 * 365)
+        )
+
+    def test_fixed_timezone_is_interned(self):
+        tz = fixed_timezone(7200)
+
+        self.assertIsInstance(tz, FixedTimezone)
+        self.assertEqual('+02:00', tz.name)
+        self.assertIs(tz, fixed_timezone(7200.0))
+        self.assertIs(tz._tzinfo, fixed_timezone(7200)._tzinfo)
+        self.assertIsNot(tz, fixed_timezone(-7200))